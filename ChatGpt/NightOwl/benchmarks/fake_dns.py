@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+benchmarks/fake_dns.py
+Tiny UDP DNS server for resolver benchmarks and local testing.
+
+Answers by name:
+  live*.<zone>        A record derived from the name
+  flaky*.<zone>       SERVFAIL on the first query, then an A record
+  *.wild.<zone>       one fixed A record for anything (wildcard zone)
+  anything else       NXDOMAIN
+
+    python benchmarks/fake_dns.py --port 5353 --latency 0.02
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.resolver import _read_name
+
+WILDCARD_IP = bytes([10, 255, 0, 1])
+
+
+def _answer_ip(name: str) -> bytes:
+    h = zlib.crc32(name.encode())
+    return bytes([10, (h >> 16) & 0xFF, (h >> 8) & 0xFF, h & 0xFF or 1])
+
+
+class FakeDnsProtocol(asyncio.DatagramProtocol):
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.seen_flaky = set()
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        reply = self.answer(data)
+        if self.latency:
+            asyncio.get_running_loop().call_later(self.latency, self.transport.sendto, reply, addr)
+        else:
+            self.transport.sendto(reply, addr)
+
+    def answer(self, data: bytes) -> bytes:
+        qid = struct.unpack("!H", data[:2])[0]
+        name, end = _read_name(data, 12)
+        question = data[12:end + 4]
+        label = name.split(".", 1)[0]
+        rcode, ip = 3, None
+        if label.startswith("live"):
+            rcode, ip = 0, _answer_ip(name)
+        elif label.startswith("flaky"):
+            if name in self.seen_flaky:
+                rcode, ip = 0, _answer_ip(name)
+            else:
+                self.seen_flaky.add(name)
+                rcode = 2
+        elif ".wild." in f".{name}":
+            rcode, ip = 0, WILDCARD_IP
+        header = struct.pack("!HHHHHH", qid, 0x8180 | rcode, 1, 1 if ip else 0, 0, 0)
+        answer = struct.pack("!HHHIH", 0xC00C, 1, 1, 60, 4) + ip if ip else b""
+        return header + question + answer
+
+
+async def serve(host: str, port: int, latency: float):
+    loop = asyncio.get_running_loop()
+    transport, proto = await loop.create_datagram_endpoint(
+        lambda: FakeDnsProtocol(latency), local_addr=(host, port)
+    )
+    return transport, proto
+
+
+def run_forever(host: str = "127.0.0.1", port: int = 5353, latency: float = 0.0):
+    async def main():
+        await serve(host, port, latency)
+        await asyncio.Event().wait()
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake DNS server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5353)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each reply")
+    args = parser.parse_args()
+    run_forever(args.host, args.port, args.latency)
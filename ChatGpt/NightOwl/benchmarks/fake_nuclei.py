@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+benchmarks/fake_nuclei.py
+Stand-in for the nuclei binary, for the sharded runner benchmark and local testing.
+
+Accepts the flags NightOwl passes (-l/-list, -u/-target, -jsonl/-json/-j,
+-o, -silent, -t, …; unknown flags are ignored) and emits nuclei-style JSONL
+findings. Per host, by name:
+  *slow*        takes FAKE_NUCLEI_SLOW seconds (default 30)
+  *crash*       the process dies with rc 2 when it reaches this host
+  anything else FAKE_NUCLEI_LATENCY seconds (default 0.05) of wall time,
+                of which FAKE_NUCLEI_CPU (default 0.01) is busy CPU
+Every host yields a tech-detect finding; about a third also an xss one.
+
+    ln -s $PWD/benchmarks/fake_nuclei.py /tmp/bin/nuclei && PATH=/tmp/bin:$PATH ...
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+LATENCY = float(os.environ.get("FAKE_NUCLEI_LATENCY", "0.05"))
+SLOW = float(os.environ.get("FAKE_NUCLEI_SLOW", "30"))
+CPU = float(os.environ.get("FAKE_NUCLEI_CPU", "0.01"))
+
+
+def _findings(host: str):
+    url = host if "://" in host else f"https://{host}"
+    base = {"type": "http", "host": host, "matched-at": url,
+            "timestamp": datetime.now(timezone.utc).isoformat()}
+    yield {"template-id": "tech-detect", "info": {"name": "Wappalyzer Technology Detection",
+                                                   "severity": "info", "tags": ["tech"]}, **base}
+    if zlib.crc32(host.encode()) % 3 == 0:
+        yield {"template-id": "xss-reflected", "info": {"name": "Reflected XSS",
+                                                        "severity": "medium", "tags": ["xss"]},
+               **base, "matched-at": f"{url}/?q=%3Csvg%3E"}
+
+
+def _scan(host: str, out, lock: threading.Lock):
+    if "crash" in host:
+        sys.stderr.write(f"[FTL] fake crash on {host}\n")
+        sys.stderr.flush()
+        os._exit(2)
+    end = time.process_time() + CPU
+    while time.process_time() < end:
+        pass
+    time.sleep(SLOW if "slow" in host else max(0.0, LATENCY - CPU))
+    with lock:
+        for f in _findings(host):
+            out.write(json.dumps(f) + "\n")
+        out.flush()
+
+
+def main():
+    p = argparse.ArgumentParser(add_help=False)
+    p.add_argument("-l", "-list", dest="list")
+    p.add_argument("-u", "-target", dest="targets", action="append", default=[])
+    p.add_argument("-o", "-output", dest="output")
+    p.add_argument("-bs", "-bulk-size", dest="bulk", type=int, default=25)
+    args, _ = p.parse_known_args()
+
+    hosts = list(args.targets)
+    if args.list:
+        with open(args.list) as f:
+            hosts += [l.strip() for l in f if l.strip()]
+    out = open(args.output, "w") if args.output else sys.stdout
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=max(1, args.bulk)) as pool:
+        list(pool.map(lambda h: _scan(h, out, lock), hosts))
+    if out is not sys.stdout:
+        out.close()
+
+
+if __name__ == "__main__":
+    main()
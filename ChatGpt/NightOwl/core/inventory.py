@@ -0,0 +1,167 @@
+"""
+core/inventory.py
+Asset inventory for delta scans.
+ - snapshot of the last completed run under meta/inventory/: hosts with
+   their IPs, alive URLs, archive URLs, plus copies of the files the
+   delta tools read and write
+ - DeltaPlan: hosts that are new or whose IPs changed since that run
+ - input filtering / output merging so delta tools only scan those hosts
+   while their output files stay complete
+"""
+from __future__ import annotations
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from core.utils import ensure_dir, read_json, write_json, read_lines, write_lines
+
+INVENTORY_DIR = Path("meta") / "inventory"
+DELTA_DIR = "delta"
+
+HOSTS_FILE = "subdomains/resolved_with_ip.txt"
+ALIVE_FILE = "subdomains/alive_httpx.txt"
+URL_FILES = ["osint/gau_urls.txt", "osint/waybackurls.txt"]
+
+_HOST_TOKEN = re.compile(r"[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?(?:\.[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?)+", re.I)
+
+
+def line_hosts(line: str) -> Set[str]:
+    """Every hostname-looking token in a tool output line (URLs, host:port, plain names)."""
+    return {m.lower() for m in _HOST_TOKEN.findall(line)}
+
+
+def read_host_ips(path: Path) -> Dict[str, List[str]]:
+    """Parse resolved_with_ip.txt (``name,ip,ip…``)."""
+    hosts = {}
+    for line in read_lines(path):
+        name, *ips = line.split(",")
+        hosts[name.strip().lower()] = sorted(ip.strip() for ip in ips if ip.strip())
+    return hosts
+
+
+def _read_set(paths: Iterable[Path]) -> Set[str]:
+    items: Set[str] = set()
+    for p in paths:
+        items.update(read_lines(p))
+    return items
+
+
+class DeltaPlan:
+    def __init__(self, rescan: Set[str], removed: Set[str], baseline: Path):
+        self.rescan = rescan          # new or changed hosts
+        self.removed = removed
+        self.baseline = baseline      # meta/inventory/files
+
+    def filter_input(self, outdir: Path, rel: str) -> Path:
+        """
+        Write delta/<rel>: the lines of <rel> that mention a host to rescan,
+        or that were not in last run's copy of the file.
+        """
+        previous = set(read_lines(self.baseline / rel))
+        dst = outdir / DELTA_DIR / rel
+        write_lines(dst, [l for l in read_lines(outdir / rel) if l not in previous or line_hosts(l) & self.rescan])
+        return dst
+
+    def merge_output(self, outdir: Path, rel: str):
+        """Prepend last run's findings for hosts that were not rescanned (and still exist)."""
+        prev_path = self.baseline / rel
+        if not prev_path.exists():
+            return
+        drop = self.rescan | self.removed
+        kept = [l for l in read_lines(prev_path) if not line_hosts(l) & drop]
+        path = outdir / rel
+        write_lines(path, list(dict.fromkeys(kept + read_lines(path))))
+
+
+class Inventory:
+    def __init__(self, outdir: Path):
+        self.outdir = outdir
+        self.root = outdir / INVENTORY_DIR
+        self.data: Dict[str, Any] = read_json(self.root / "inventory.json", default={}) or {}
+
+    def __bool__(self):
+        return bool(self.data)
+
+    def needs_full_refresh(self, max_age_days: float) -> bool:
+        last_full = self.data.get("last_full")
+        return not last_full or time.time() - last_full >= max_age_days * 86400
+
+    def plan(self) -> DeltaPlan:
+        previous = self.data.get("hosts", {})
+        current = read_host_ips(self.outdir / HOSTS_FILE)
+        rescan = {h for h, ips in current.items() if previous.get(h) != ips}
+        return DeltaPlan(rescan, set(previous) - set(current), self.root / "files")
+
+    def diff(self) -> Dict[str, Any]:
+        """New/removed/changed hosts and new/removed alive and archive URLs."""
+        prev_hosts = self.data.get("hosts", {})
+        hosts = read_host_ips(self.outdir / HOSTS_FILE)
+        files = self.root / "files"
+        report: Dict[str, Any] = {
+            "previous_scan": self.data.get("saved_at"),
+            "hosts": {
+                "new": sorted(set(hosts) - set(prev_hosts)),
+                "removed": sorted(set(prev_hosts) - set(hosts)),
+                "changed": sorted(h for h in hosts if h in prev_hosts and prev_hosts[h] != hosts[h]),
+            },
+        }
+        for key, rels in (("alive", [ALIVE_FILE]), ("urls", URL_FILES)):
+            now = _read_set(self.outdir / r for r in rels)
+            before = _read_set(files / r for r in rels)
+            report[key] = {"new": sorted(now - before), "removed": sorted(before - now)}
+        return report
+
+    def save(self, files: Iterable[str], full: bool, pending: Iterable[str] = ()):
+        """
+        Make the current output dir the baseline for the next delta run.
+        Hosts in `pending` were not fully scanned: they keep their previous
+        entry, or are left out when they are new, so they are rescanned.
+        """
+        base = ensure_dir(self.root / "files")
+        for rel in dict.fromkeys([ALIVE_FILE, *URL_FILES, *files]):
+            src = self.outdir / rel
+            if src.exists():
+                ensure_dir((base / rel).parent)
+                shutil.copyfile(src, base / rel)
+        now = time.time()
+        previous = self.data.get("hosts", {})
+        hosts = read_host_ips(self.outdir / HOSTS_FILE)
+        for host in set(pending) & set(hosts):
+            if host in previous:
+                hosts[host] = previous[host]
+            else:
+                del hosts[host]
+        self.data = {
+            "saved_at": now,
+            "last_full": now if full else self.data.get("last_full"),
+            "hosts": hosts,
+        }
+        write_json(self.root / "inventory.json", self.data)
+
+
+def write_delta_report(outdir: Path, report: Dict[str, Any], sample: int = 50) -> Path:
+    """meta/delta.json with the full diff, reports/delta.md with counts and samples."""
+    write_json(outdir / "meta" / "delta.json", report)
+    md = ["# NightOwl Delta Report", ""]
+    md.append(f"**Mode:** {'full refresh' if report.get('full_scan') else 'delta'}")
+    if report.get("previous_scan"):
+        md.append(f"**Compared with scan at:** {time.strftime('%Y-%m-%d %H:%M', time.localtime(report['previous_scan']))}")
+    md.append("")
+    for section in ("hosts", "alive", "urls"):
+        md.append(f"## {section.capitalize()}")
+        for kind, items in report[section].items():
+            md.append(f"- {kind}: {len(items)}")
+            for item in items[:sample]:
+                md.append(f"  - {item}")
+            if len(items) > sample:
+                md.append(f"  - … ({len(items) - sample} more)")
+        md.append("")
+    if report.get("tools"):
+        md.append("## Delta tools")
+        for tool, info in report["tools"].items():
+            md.append(f"- {tool}: {info}")
+    path = ensure_dir(outdir / "reports") / "delta.md"
+    path.write_text("\n".join(md) + "\n")
+    return path
@@ -0,0 +1,169 @@
+"""
+core/nuclei_runner.py
+Sharded nuclei execution.
+ - the host list is cut into small shards pulled from one queue by N
+   parallel nuclei processes (N from a CPU budget), so a slow shard only
+   holds one worker
+ - -jsonl output is parsed line by line and handed on as findings arrive
+ - hosts of finished shards are appended to a checkpoint log; a resumed run
+   skips them
+ - a shard that times out or crashes is split in half and requeued; a single
+   host that still times out is recorded as slow and dropped
+"""
+from __future__ import annotations
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from core.supervisor import ProcessSupervisor
+from core.utils import ensure_dir, read_lines
+
+Finding = Dict[str, Any]
+
+
+def finding_key(f: Finding) -> str:
+    return "|".join(str(f.get(k, "")) for k in ("template-id", "matcher-name", "matched-at", "host"))
+
+
+def finding_line(f: Finding) -> str:
+    """One-line text rendering, like nuclei's default output."""
+    info = f.get("info", {})
+    parts = [f"[{f.get('template-id', '?')}]", f"[{f.get('type', '?')}]", f"[{info.get('severity', 'unknown')}]",
+             f.get("matched-at") or f.get("host", "")]
+    if f.get("extracted-results"):
+        parts.append(str(f["extracted-results"]))
+    return " ".join(parts)
+
+
+class ShardedNuclei:
+    def __init__(
+        self,
+        cmd: str,
+        workdir: Path,
+        shard_size: int = 25,
+        parallel: int = 0,
+        cpu_budget: float = 0.75,
+        shard_timeout: Optional[float] = 900,
+        memory_limit_mb: Optional[float] = None,
+        supervisor: Optional[ProcessSupervisor] = None,
+    ):
+        """
+        cmd: nuclei command without the target list; `-l <shard file>` is appended.
+        parallel: nuclei processes at once; 0 = cpu_count * cpu_budget.
+        """
+        self.cmd = cmd
+        self.workdir = ensure_dir(workdir)
+        self.shard_size = max(1, shard_size)
+        self.parallel = parallel or max(1, int((os.cpu_count() or 1) * cpu_budget))
+        self.shard_timeout = shard_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.supervisor = supervisor or ProcessSupervisor()
+        self.done_log = self.workdir / "done_hosts.txt"
+        self.slow_log = self.workdir / "dropped_hosts.txt"   # timed out / crashed on their own
+        self.stats: Dict[str, Any] = {
+            "hosts": 0, "skipped": 0, "shards": 0, "splits": 0, "findings": 0,
+            "slow_hosts": [], "failed_hosts": [],
+            "lines": 0, "bytes": 0, "cpu_user": 0.0, "cpu_system": 0.0, "peak_rss_mb": 0.0,
+        }
+
+    def reset(self):
+        """Forget checkpointed progress (fresh scan)."""
+        for p in (self.done_log, self.slow_log):
+            p.unlink(missing_ok=True)
+
+    def completed_hosts(self) -> Set[str]:
+        return set(read_lines(self.done_log)) | set(read_lines(self.slow_log))
+
+    async def run(
+        self,
+        hosts: List[str],
+        on_finding: Callable[[Finding], None],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        start = time.time()
+        done = self.completed_hosts()
+        todo = [h for h in dict.fromkeys(hosts) if h not in done]
+        self.stats["hosts"] = len(todo)
+        self.stats["skipped"] = len(hosts) - len(todo)
+        finished = 0
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(0, len(todo), self.shard_size):
+            queue.put_nowait(todo[i:i + self.shard_size])
+
+        async def worker(wid: int):
+            nonlocal finished
+            while True:
+                shard = await queue.get()
+                try:
+                    ok = await self._run_shard(wid, shard, on_finding)
+                    if ok:
+                        finished += len(shard)
+                        self._append(self.done_log, shard)
+                        if on_progress:
+                            on_progress(finished, len(todo))
+                    elif len(shard) > 1:
+                        # move the slow/crashing host(s) away from the rest
+                        mid = len(shard) // 2
+                        self.stats["splits"] += 1
+                        queue.put_nowait(shard[:mid])
+                        queue.put_nowait(shard[mid:])
+                    else:
+                        finished += 1
+                        self._append(self.slow_log, shard)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.ensure_future(worker(i)) for i in range(self.parallel)]
+        try:
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for path in self.workdir.glob("shard-*.txt"):
+                path.unlink()
+        self.stats["elapsed"] = round(time.time() - start, 2)
+        for k in ("cpu_user", "cpu_system", "peak_rss_mb"):
+            self.stats[k] = round(self.stats[k], 2)
+        return self.stats
+
+    async def _run_shard(self, wid: int, shard: List[str], on_finding: Callable[[Finding], None]) -> bool:
+        path = self.workdir / f"shard-{wid}.txt"
+        path.write_text("\n".join(shard) + "\n")
+
+        def consume(line: str):
+            if not line.startswith("{"):
+                return
+            try:
+                finding = json.loads(line)
+            except ValueError:
+                return
+            self.stats["findings"] += 1
+            on_finding(finding)
+
+        self.stats["shards"] += 1
+        res = await self.supervisor.run(
+            f"{self.cmd} -l {path}",
+            timeout=self.shard_timeout,
+            memory_limit_mb=self.memory_limit_mb,
+            consumers=[consume],
+        )
+        for k in ("lines", "bytes", "cpu_user", "cpu_system"):
+            self.stats[k] += res[k]
+        self.stats["peak_rss_mb"] = max(self.stats["peak_rss_mb"], res["peak_rss_mb"])
+        if res["rc"] == 0:
+            return True
+        if len(shard) == 1:
+            key = "slow_hosts" if res["timeout"] else "failed_hosts"
+            self.stats[key].append(shard[0])
+        self.stats["last_error"] = res["stderr"][-500:] or f"rc={res['rc']}"
+        return False
+
+    @staticmethod
+    def _append(path: Path, hosts: List[str]):
+        with open(path, "a") as f:
+            f.write("\n".join(hosts) + "\n")
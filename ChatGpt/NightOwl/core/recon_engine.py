@@ -3,14 +3,21 @@ core/recon_engine.py
 NightOwl Orchestrator – Stage 10.5
 Adds:
  - per-tool timeout
- - passive group parallelization
+ - dependency-graph scheduling across phases (inputs/outputs in the configs)
  - resilient error capture
+ - tools run under core.supervisor: streamed stdout, memory caps, CPU/RSS metrics
+ - cross-scan result cache with per-tool TTLs (core/result_cache.py)
+ - delta scans: expensive tools only see new/changed hosts (core/inventory.py)
+ - sharded tools (`shards:` in tools.yaml, i.e. nuclei) run via core/nuclei_runner.py
 """
 from __future__ import annotations
+import asyncio
 import importlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 
 from core.utils import (
     load_tools_config,
@@ -20,9 +27,17 @@ from core.utils import (
     ensure_dir,
     render_cmd,
     tool_exists,
-    run_command,
+    DEFAULT_MAX_MEMORY_MB,
+    read_lines,
+    load_cache_config,
+    load_delta_config,
 )
 from core import error_handler
+from core.scheduler import DagScheduler, Node
+from core.supervisor import ProcessSupervisor, LineConsumer
+from core.result_cache import ResultCache
+from core.inventory import Inventory, DeltaPlan, DELTA_DIR, write_delta_report
+from core.nuclei_runner import ShardedNuclei, finding_key, finding_line
 
 
 class ReconTool:
@@ -34,8 +49,11 @@ class ReconTool:
         phases: Optional[List[str]] = None,
         resume: bool = False,
         ui=None,
-        passive_workers: int = 5,
+        workers: int = 8,
         default_tool_timeout: int = 300,
+        use_cache: bool = True,
+        delta: bool = False,
+        full_refresh: bool = False,
     ):
         self.target = target
         self.scan_level = scan_level
@@ -43,61 +61,137 @@ class ReconTool:
         self.phases_override = phases
         self.resume = resume
         self.ui = ui
-        self.passive_workers = passive_workers
+        self.workers = workers
         self.default_tool_timeout = default_tool_timeout
+        self._state_lock = threading.Lock()
+        self._started_phases = set()
+        self.supervisor = ProcessSupervisor()
+        self.consumers: Dict[str, List[LineConsumer]] = {}
 
         self.tools_cfg = load_tools_config()
         self.phases_cfg = load_phases_config()
+        self.cache_cfg = load_cache_config()
+        self.cache = None
+        if use_cache and self.cache_cfg["enabled"]:
+            self.cache = ResultCache(
+                project_path(self.cache_cfg["dir"]),
+                max_size_mb=self.cache_cfg["max_size_mb"],
+                compress_level=self.cache_cfg["compress_level"],
+            )
 
         self.outdir = target_outdir(target)
         ensure_dir(self.outdir)
 
+        self.inventory = Inventory(self.outdir) if delta else None
+        self.full_scan = True
+        self._delta_plan: Optional[DeltaPlan] = None
+        self.delta_counts: Dict[str, Dict[str, int]] = {}
+        self._delta_incomplete: Set[str] = set()
+        if delta:
+            days = load_delta_config()["full_refresh_days"]
+            self.full_scan = full_refresh or self.inventory.needs_full_refresh(days)
+            self._log("Delta scan: full refresh." if self.full_scan else "Delta scan: only new/changed hosts.")
+
         self.state = error_handler.load_state(target) if resume else {}
         self.completed = set(self.state.get("completed_phases", []))
 
         if self.ui:
             self.ui.log(f"Output dir: {self.outdir}")
 
+    def subscribe(self, tool_name: str, consumer: LineConsumer):
+        """Receive every stdout line of `tool_name` as it is produced."""
+        self.consumers.setdefault(tool_name, []).append(consumer)
+
     # ---------------- Main Loop ---------------- #
 
     def run(self):
+        scheduler = self._build_graph()
+        scheduler.run()
+
+        cp = scheduler.critical_path()
+        chain = " -> ".join(f"{step['node']} ({step['elapsed']:.1f}s)" for step in cp["path"])
+        self._log(f"Critical path {cp['duration']:.1f}s of {cp['wall_time']:.1f}s wall: {chain}")
+        with self._state_lock:
+            self.state["critical_path"] = cp
+            error_handler.save_state(self.target, self.state)
+        if self.inventory is not None:
+            self._finish_delta()
+
+    def _build_graph(self) -> DagScheduler:
+        """
+        One node per tool and one per phase module. A phase module waits for
+        its own tools; any node waits for the nodes declared before it (in
+        phases.yaml order) whose `outputs` include one of its `inputs`.
+        Declaration order breaks what would otherwise be cycles; an input
+        that only a later node produces is not waited for, and is warned about.
+        """
+        scheduler = DagScheduler(self.workers, on_start=self._node_started, on_done=self._node_done)
+        producers: Dict[str, List[str]] = {}
+        unproduced: Dict[str, List[str]] = {}
+
+        def deps_for(node_name: str, inputs: List[str]) -> List[str]:
+            for path in inputs:
+                if path not in producers:
+                    unproduced.setdefault(path, []).append(node_name)
+            return list(dict.fromkeys(n for path in inputs for n in producers.get(path, [])))
+
+        def register(node: Node, outputs: List[str]):
+            scheduler.add(node)
+            for path in outputs:
+                producers.setdefault(path, []).append(node.name)
+
         for phase in self.phases_cfg:
             name = phase["name"]
-
             if self.resume and name in self.completed:
                 self._log(f"Skipping {name} (already completed).", style="success")
                 continue
             if self.phases_override and name not in self.phases_override:
                 continue
 
-            self._phase_start(name)
-
-            phase_tool_names = self._phase_tool_selection(phase)
-
-            # Run grouped passive tools in parallel
-            tool_results = {}
-            passive_group = [
-                t for t in phase_tool_names
-                if self.tools_cfg.get(t, {}).get("group") == "passive"
-            ]
-            serial_tools = [t for t in phase_tool_names if t not in passive_group]
-
-            if passive_group:
-                self._log(f"Parallel passive tools: {', '.join(passive_group)}")
-                tool_results.update(self._run_parallel(passive_group, phase=name))
-
-            for tname in serial_tools:
-                tool_results[tname] = self._run_tool(tname, phase=name)
-
-            # Phase post-processing module
-            self._run_phase_module(name, tool_results)
-
-            # Mark completion
-            self.completed.add(name)
+            tool_names = self._phase_tool_selection(phase)
+            for tname in tool_names:
+                cfg = self.tools_cfg.get(tname, {})
+                node = Node(f"tool:{tname}", partial(self._run_tool, tname, name),
+                            deps_for(f"tool:{tname}", cfg.get("inputs", [])), kind="tool", phase=name)
+                register(node, cfg.get("outputs", []))
+
+            tool_nodes = [f"tool:{t}" for t in tool_names]
+            module = Node(f"phase:{name}", partial(self._run_phase_from_graph, scheduler, name, tool_names),
+                          tool_nodes + deps_for(f"phase:{name}", phase.get("inputs", [])), kind="phase", phase=name)
+            register(module, phase.get("outputs", []))
+
+        for path, readers in unproduced.items():
+            if path in producers:
+                self._log(f"{', '.join(readers)} read {path}, which {', '.join(producers[path])} only produces later; "
+                          f"it will not wait for it. Declare the producer first in phases.yaml.", style="warn")
+        return scheduler
+
+    def _run_phase_from_graph(self, scheduler: DagScheduler, name: str, tool_names: List[str]):
+        tool_results = {t: scheduler.nodes[f"tool:{t}"].result for t in tool_names}
+        self._run_phase_module(name, tool_results)
+
+    def _node_started(self, node: Node):
+        with self._state_lock:
+            first = node.phase not in self._started_phases
+            self._started_phases.add(node.phase)
+        if first:
+            self._phase_start(node.phase)
+
+    def _node_done(self, node: Node):
+        if node.error:
+            self._log(f"{node.name} crashed: {node.error}", style="error")
+            self._record_failure(node.name.split(":", 1)[1], node.phase, node.error)
+        if node.kind != "phase":
+            return
+        with self._state_lock:
+            self.completed.add(node.phase)
             self.state["completed_phases"] = list(self.completed)
             error_handler.save_state(self.target, self.state)
+        self._phase_end(node.phase)
 
-            self._phase_end(name)
+    def _record_failure(self, tool: str, phase: str, error: str):
+        with self._state_lock:
+            error_handler.record_failure(self.target, tool, phase, error, self.state)
 
     # ---------------- Phase Helpers ---------------- #
 
@@ -138,60 +232,246 @@ class ReconTool:
 
     # ---------------- Tool Execution ---------------- #
 
-    def _run_parallel(self, tool_names: List[str], phase: str) -> Dict[str, Dict[str, Any]]:
-        results = {}
-        with ThreadPoolExecutor(max_workers=self.passive_workers) as pool:
-            future_map = {
-                pool.submit(self._run_tool, tname, phase): tname for tname in tool_names
-            }
-            for future in as_completed(future_map):
-                tname = future_map[future]
-                try:
-                    results[tname] = future.result()
-                except Exception as e:
-                    self._log(f"{tname} crashed in parallel: {e}", style="error")
-                    error_handler.record_failure(self.target, tname, phase, str(e), self.state)
-        return results
+    async def _run_tool(self, tool_name: str, phase: str) -> Dict[str, Any]:
+        delta_tool = self.inventory is not None and self.tools_cfg.get(tool_name, {}).get("delta")
+        try:
+            result = await self._execute_tool(tool_name, phase)
+        except BaseException:
+            if delta_tool:
+                self._delta_incomplete.add(tool_name)
+            raise
+        if delta_tool and result.get("status") != "ok":
+            self._delta_incomplete.add(tool_name)
+        return result
 
-    def _run_tool(self, tool_name: str, phase: str) -> Dict[str, Any]:
+    async def _execute_tool(self, tool_name: str, phase: str) -> Dict[str, Any]:
         cfg = self.tools_cfg.get(tool_name)
         if not cfg:
             msg = "Not defined in tools.yaml"
             self._log(f"{tool_name}: {msg}", style="error")
-            error_handler.record_failure(self.target, tool_name, phase, msg, self.state)
+            self._record_failure(tool_name, phase, msg)
             return {"tool": tool_name, "status": "undefined"}
 
         binary = cfg["cmd"].split()[0]
         if not tool_exists(binary):
             msg = f"binary '{binary}' missing in PATH"
             self._log(f"{tool_name}: {msg}", style="warn")
-            error_handler.record_failure(self.target, tool_name, phase, msg, self.state)
+            self._record_failure(tool_name, phase, msg)
             return {"tool": tool_name, "status": "missing"}
 
         cmd = render_cmd(cfg["cmd"], self.target, self.outdir)
         timeout = cfg.get("timeout", self.default_tool_timeout)
-
-        self._log(f"Running {tool_name}: {cmd}")
-        result = run_command(cmd, timeout=timeout)
+        stdout = cfg.get("stdout")
+        inputs = [self.outdir / rel for rel in cfg.get("inputs", [])]
+
+        plan = self._plan_for(cfg)
+        if plan:
+            cmd, skip = self._apply_delta(tool_name, cfg, cmd, plan)
+            inputs = [self.outdir / DELTA_DIR / rel for rel in cfg.get("inputs", [])]
+            if skip:
+                self._log(f"{tool_name}: no new or changed hosts, keeping previous results", style="success")
+                for rel in cfg.get("outputs", []):
+                    plan.merge_output(self.outdir, rel)
+                return {"tool": tool_name, "phase": phase, "status": "ok", "delta_skipped": True}
+
+        ttl = cfg.get("cache_ttl", self.cache_cfg["default_ttl"]) if self.cache and not plan else 0
+        cache_key = self.cache.key(cmd, binary, cfg.get("env"), stdout) if ttl else None
+        if cache_key:
+            hit = await asyncio.to_thread(self.cache.get, cache_key, self.outdir)
+            if hit:
+                self._log(f"{tool_name} served from cache ({hit['cache_age'] / 3600:.1f}h old)", style="success")
+                if stdout and self.consumers.get(tool_name):
+                    await asyncio.to_thread(self._replay_stdout, tool_name, self.outdir / stdout)
+                return {**hit, "tool": tool_name, "phase": phase, "status": "ok", "cached": True}
+
+        if cfg.get("shards"):
+            result = await self._run_sharded(tool_name, cfg, cmd, inputs[0])
+        else:
+            self._log(f"Running {tool_name}: {cmd}")
+            result = await self.supervisor.run(
+                cmd,
+                timeout=timeout,
+                memory_limit_mb=cfg.get("max_memory_mb", DEFAULT_MAX_MEMORY_MB),
+                stdout_path=self.outdir / stdout if stdout else None,
+                stderr_path=self.outdir / "logs" / f"{tool_name}.stderr.log",
+                consumers=self.consumers.get(tool_name, []),
+                env=cfg.get("env"),
+            )
         result["tool"] = tool_name
         result["phase"] = phase
         result["timeout_set"] = timeout
+        self._record_metrics(result)
 
         if result["timeout"]:
             status = f"timeout ({timeout}s)"
             self._log(f"{tool_name} {status}", style="error")
-            error_handler.record_failure(self.target, tool_name, phase, status, self.state)
+            self._record_failure(tool_name, phase, status)
             result["status"] = "timeout"
+        elif result["killed"] == "memory":
+            status = f"killed at {result['peak_rss_mb']:.0f} MB (max_memory_mb)"
+            self._log(f"{tool_name} {status}", style="error")
+            self._record_failure(tool_name, phase, status)
+            result["status"] = "memory"
         elif result["rc"] != 0:
             self._log(f"{tool_name} failed rc={result['rc']}", style="error")
-            error_handler.record_failure(self.target, tool_name, phase, result["stderr"], self.state)
+            self._record_failure(tool_name, phase, result["stderr"])
             result["status"] = "error"
         else:
             self._log(f"{tool_name} completed in {result['elapsed']:.2f}s", style="success")
             result["status"] = "ok"
+            if plan:
+                for rel in cfg.get("outputs", []):
+                    plan.merge_output(self.outdir, rel)
+            if cache_key:
+                files = cfg.get("outputs", []) + ([stdout] if stdout else [])
+                if files and not any(self._has_data(rel) for rel in files):
+                    # shell pipelines (curl | jq > file) exit 0 even when the fetch failed
+                    self._log(f"{tool_name} produced no output; not caching it", style="warn")
+                else:
+                    await asyncio.to_thread(self.cache.put, cache_key, tool_name, ttl, self.outdir, files, result)
 
         return result
 
+    def _has_data(self, rel: str) -> bool:
+        path = self.outdir / rel
+        return path.is_file() and path.stat().st_size > 0
+
+    # ---------------- Sharded Tools ---------------- #
+
+    async def _run_sharded(self, tool_name: str, cfg: Dict[str, Any], cmd: str, hosts_path: Path) -> Dict[str, Any]:
+        """
+        Run a JSONL-emitting scanner over the hosts in `hosts_path` via ShardedNuclei.
+        outputs[0] gets the text rendering, outputs[1] the raw JSONL findings;
+        both are appended to when resuming, deduplicated by finding key.
+        """
+        shards = cfg["shards"]
+        runner = ShardedNuclei(
+            cmd,
+            self.outdir / "meta" / "shards" / tool_name,
+            shard_size=shards.get("size", 25),
+            parallel=shards.get("parallel", 0),
+            cpu_budget=shards.get("cpu_budget", 0.75),
+            shard_timeout=shards.get("timeout", cfg.get("timeout", self.default_tool_timeout)),
+            memory_limit_mb=cfg.get("max_memory_mb", DEFAULT_MAX_MEMORY_MB),
+            supervisor=self.supervisor,
+        )
+        text_path, jsonl_path = (self.outdir / rel for rel in cfg["outputs"][:2])
+        ensure_dir(text_path.parent)
+        seen = set()
+        if self.resume:
+            for line in read_lines(jsonl_path):
+                try:
+                    seen.add(finding_key(json.loads(line)))
+                except ValueError:
+                    pass
+        else:
+            runner.reset()
+        mode = "a" if seen else "w"
+        consumers = self.consumers.get(tool_name, [])
+
+        with open(text_path, mode) as text_fh, open(jsonl_path, mode) as jsonl_fh:
+            def on_finding(finding: Dict[str, Any]):
+                key = finding_key(finding)
+                if key in seen:
+                    return
+                seen.add(key)
+                raw = json.dumps(finding)
+                jsonl_fh.write(raw + "\n")
+                text_fh.write(finding_line(finding) + "\n")
+                for consume in consumers:
+                    consume(raw)
+
+            def on_progress(done: int, total: int):
+                if self.ui:
+                    self.ui.log(f"{tool_name}: {done}/{total} hosts")
+
+            hosts = read_lines(hosts_path)
+            self._log(f"Running {tool_name}: {len(hosts)} hosts in shards of {runner.shard_size}, "
+                      f"{runner.parallel} parallel")
+            stats = await runner.run(hosts, on_finding, on_progress)
+
+        if stats["skipped"]:
+            self._log(f"{tool_name}: {stats['skipped']} hosts already scanned (checkpoint)")
+        for key, what in (("slow_hosts", "timed out"), ("failed_hosts", "crashed")):
+            if stats[key]:
+                self._log(f"{tool_name}: {len(stats[key])} hosts {what} and were dropped ({runner.slow_log})",
+                          style="warn")
+        return {
+            **stats,
+            "cmd": cmd,
+            "rc": 0,
+            "stdout": "",
+            "stderr": stats.get("last_error", ""),
+            "timeout": False,
+            "killed": None,
+        }
+
+    # ---------------- Delta Scans ---------------- #
+
+    def _plan_for(self, cfg: Dict[str, Any]) -> Optional[DeltaPlan]:
+        """Delta plan for a `delta: true` tool, or None when it should see everything."""
+        if self.inventory is None or self.full_scan or not cfg.get("delta"):
+            return None
+        with self._state_lock:
+            # delta tools depend on the passive phase, so resolved_with_ip.txt is final here
+            if self._delta_plan is None:
+                self._delta_plan = self.inventory.plan()
+        return self._delta_plan
+
+    def _apply_delta(self, tool_name: str, cfg: Dict[str, Any], cmd: str, plan: DeltaPlan):
+        """Point the command at delta/<input> files; skip the tool when they are all empty."""
+        sizes = []
+        for rel in cfg.get("inputs", []):
+            delta_path = plan.filter_input(self.outdir, rel)
+            cmd = cmd.replace(str(self.outdir / rel), str(delta_path))
+            sizes.append(len(read_lines(delta_path)))
+        self.delta_counts[tool_name] = {"inputs": sum(sizes), "rescan_hosts": len(plan.rescan)}
+        return cmd, bool(sizes) and not any(sizes)
+
+    def _finish_delta(self):
+        """Write the diff report and make this run the next delta baseline."""
+        report = self.inventory.diff()
+        report["full_scan"] = self.full_scan
+        report["tools"] = self.delta_counts
+        incomplete = sorted(self._delta_incomplete)
+        if incomplete:
+            report["incomplete_tools"] = incomplete
+        path = write_delta_report(self.outdir, report)
+        h = report["hosts"]
+        self._log(
+            f"Delta: {len(h['new'])} new, {len(h['changed'])} changed, {len(h['removed'])} removed hosts "
+            f"({path})", style="success"
+        )
+        files = [
+            rel for name, cfg in self.tools_cfg.items() if cfg.get("delta") and name not in self._delta_incomplete
+            for rel in cfg.get("inputs", []) + cfg.get("outputs", [])
+        ]
+        if not incomplete:
+            self.inventory.save(files, self.full_scan)
+            return
+        # A delta tool did not finish: its partial output must not become the
+        # baseline, and the hosts it should have rescanned keep their previous
+        # entry so the next run rescans them.
+        self._log(f"Delta: {', '.join(incomplete)} did not finish; their hosts stay pending", style="warn")
+        failed_outputs = {
+            rel for name in incomplete for rel in self.tools_cfg[name].get("outputs", [])
+        }
+        rescan = (self._delta_plan or self.inventory.plan()).rescan
+        self.inventory.save([rel for rel in files if rel not in failed_outputs], False, pending=rescan)
+
+    def _replay_stdout(self, tool_name: str, path: Path):
+        if not path.exists():
+            return
+        with open(path, errors="replace") as fh:
+            for line in fh:
+                for consume in self.consumers[tool_name]:
+                    consume(line.rstrip("\n"))
+
+    def _record_metrics(self, result: Dict[str, Any]):
+        keys = ("elapsed", "rc", "killed", "lines", "bytes", "cpu_user", "cpu_system", "peak_rss_mb")
+        with self._state_lock:
+            self.state.setdefault("tool_metrics", {})[result["tool"]] = {k: result[k] for k in keys}
+
     # ---------------- Phase Module ---------------- #
 
     def _run_phase_module(self, phase_name: str, tool_results: Dict[str, Any]):
@@ -212,7 +492,7 @@ class ReconTool:
             )
         except Exception as e:
             self._log(f"Phase module {phase_name} crashed: {e}", style="error")
-            error_handler.record_failure(self.target, f"__phase__{phase_name}", phase_name, str(e), self.state)
+            self._record_failure(f"__phase__{phase_name}", phase_name, str(e))
 
     # ---------------- Logging ---------------- #
 
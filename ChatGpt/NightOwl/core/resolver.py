@@ -0,0 +1,261 @@
+"""
+core/resolver.py
+Concurrent stub DNS resolver (stdlib asyncio, no external deps).
+Used by the passive phase to resolve large candidate lists:
+ - bounded parallelism over a shared UDP socket per nameserver
+ - per-attempt timeout, retry on SERVFAIL/REFUSED/timeout across nameservers
+ - wildcard-zone detection so wildcard hits are not reported as resolved
+"""
+from __future__ import annotations
+import asyncio
+import ipaddress
+import random
+import string
+import struct
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+QTYPE_A = 1
+QTYPE_CNAME = 5
+QTYPE_AAAA = 28
+
+RCODE_NOERROR = 0
+RCODE_SERVFAIL = 2
+RCODE_NXDOMAIN = 3
+RCODE_REFUSED = 5
+
+FALLBACK_NAMESERVERS = ["1.1.1.1", "8.8.8.8"]
+_DONE = object()
+
+# ---------------- Wire Format ---------------- #
+
+def build_query(name: str, qid: int, qtype: int = QTYPE_A) -> bytes:
+    header = struct.pack("!HHHHHH", qid, 0x0100, 1, 0, 0, 0)  # RD set
+    qname = b"".join(
+        bytes([len(label)]) + label for label in name.rstrip(".").encode("idna").split(b".") if label
+    ) + b"\x00"
+    return header + qname + struct.pack("!HH", qtype, 1)
+
+def _read_name(data: bytes, offset: int) -> Tuple[str, int]:
+    labels = []
+    end = None
+    for _ in range(128):  # bounds compression-pointer loops
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode("ascii", "replace"))
+        offset += length
+    return ".".join(labels).lower(), (end if end is not None else offset)
+
+def parse_response(data: bytes) -> Tuple[int, int, List[Tuple[int, str]]]:
+    """Return (qid, rcode, [(rtype, value), ...]) for A, AAAA and CNAME answers."""
+    qid, flags, qdcount, ancount, _, _ = struct.unpack("!HHHHHH", data[:12])
+    offset = 12
+    for _ in range(qdcount):
+        _, offset = _read_name(data, offset)
+        offset += 4
+    answers = []
+    for _ in range(ancount):
+        _, offset = _read_name(data, offset)
+        rtype, _, _, rdlength = struct.unpack("!HHIH", data[offset:offset + 10])
+        offset += 10
+        rdata = data[offset:offset + rdlength]
+        if rtype == QTYPE_A and rdlength == 4:
+            answers.append((rtype, str(ipaddress.IPv4Address(rdata))))
+        elif rtype == QTYPE_AAAA and rdlength == 16:
+            answers.append((rtype, str(ipaddress.IPv6Address(rdata))))
+        elif rtype == QTYPE_CNAME:
+            answers.append((rtype, _read_name(data, offset)[0]))
+        offset += rdlength
+    return qid, flags & 0x000F, answers
+
+def system_nameservers(path: str = "/etc/resolv.conf") -> List[str]:
+    p = Path(path)
+    if not p.exists():
+        return []
+    servers = []
+    for line in p.read_text().splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0] == "nameserver":
+            servers.append(parts[1])
+    return servers
+
+# ---------------- Transport ---------------- #
+
+class _NameserverProtocol(asyncio.DatagramProtocol):
+    """One UDP socket to one nameserver; answers are matched to queries by transaction id."""
+
+    def __init__(self):
+        self.transport = None
+        self.pending: Dict[int, asyncio.Future] = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        try:
+            qid, rcode, answers = parse_response(data)
+        except Exception:
+            return
+        fut = self.pending.pop(qid, None)
+        if fut and not fut.done():
+            fut.set_result((rcode, answers))
+
+    def error_received(self, exc):
+        pass
+
+    def query(self, name: str, qtype: int) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        qid = random.randrange(65536)
+        while qid in self.pending:
+            qid = random.randrange(65536)
+        self.pending[qid] = fut
+        fut.add_done_callback(lambda _: self.pending.pop(qid, None))
+        self.transport.sendto(build_query(name, qid, qtype))
+        return fut
+
+# ---------------- Resolver ---------------- #
+
+class ConcurrentResolver:
+    """
+    Resolve many names at once with bounded parallelism.
+
+    Every result is a dict:
+        {"name", "status", "ips", "cnames"}
+    where status is one of resolved, nxdomain, noanswer, servfail,
+    timeout, wildcard or error. A name is "wildcard" when its parent zone
+    answers for random labels and the name's addresses are all wildcard
+    addresses.
+    """
+
+    def __init__(
+        self,
+        nameservers: Optional[List[str]] = None,
+        port: int = 53,
+        concurrency: int = 200,
+        timeout: float = 2.0,
+        retries: int = 2,
+        wildcard_checks: int = 2,
+    ):
+        self.nameservers = nameservers or system_nameservers() or FALLBACK_NAMESERVERS
+        self.port = port
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.wildcard_checks = wildcard_checks
+        self.queries = 0
+        self._protocols: List[_NameserverProtocol] = []
+        self._wildcards: Dict[str, asyncio.Future] = {}
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        for server in self.nameservers:
+            _, proto = await loop.create_datagram_endpoint(
+                _NameserverProtocol, remote_addr=(server, self.port)
+            )
+            self._protocols.append(proto)
+
+    def close(self):
+        for proto in self._protocols:
+            if proto.transport:
+                proto.transport.close()
+        self._protocols = []
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    async def _lookup(self, name: str, qtype: int = QTYPE_A) -> Tuple[str, List[Tuple[int, str]]]:
+        """One record lookup with retries, rotating nameservers. Returns (status, answers)."""
+        status = "error"
+        start = random.randrange(len(self._protocols))
+        for attempt in range(self.retries + 1):
+            proto = self._protocols[(start + attempt) % len(self._protocols)]
+            self.queries += 1
+            try:
+                rcode, answers = await asyncio.wait_for(proto.query(name, qtype), self.timeout)
+            except asyncio.TimeoutError:
+                status = "timeout"
+                continue
+            if rcode in (RCODE_SERVFAIL, RCODE_REFUSED):
+                status = "servfail"
+                continue
+            if rcode == RCODE_NXDOMAIN:
+                return "nxdomain", []
+            if rcode != RCODE_NOERROR:
+                return "error", []
+            return ("resolved" if answers else "noanswer"), answers
+        return status, []
+
+    async def _wildcard_ips(self, zone: str) -> set:
+        fut = self._wildcards.get(zone)
+        if fut is None:
+            fut = self._wildcards[zone] = asyncio.ensure_future(self._probe_wildcard(zone))
+        return await fut
+
+    async def _probe_wildcard(self, zone: str) -> set:
+        ips = set()
+        for _ in range(self.wildcard_checks):
+            label = "".join(random.choices(string.ascii_lowercase + string.digits, k=16))
+            status, answers = await self._lookup(f"{label}.{zone}")
+            if status == "resolved":
+                ips.update(v for t, v in answers if t != QTYPE_CNAME)
+        return ips
+
+    async def resolve(self, name: str) -> Dict[str, Any]:
+        status, answers = await self._lookup(name)
+        ips = [v for t, v in answers if t != QTYPE_CNAME]
+        cnames = [v for t, v in answers if t == QTYPE_CNAME]
+        if status == "resolved" and not ips:
+            status = "noanswer"
+        if status == "resolved" and self.wildcard_checks and "." in name:
+            wildcard = await self._wildcard_ips(name.split(".", 1)[1])
+            if wildcard and set(ips) <= wildcard:
+                status = "wildcard"
+        return {"name": name, "status": status, "ips": ips, "cnames": cnames}
+
+    async def resolve_many(self, names: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a result for every name, in completion order."""
+        jobs: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def feed():
+            for name in names:
+                await jobs.put(name)
+            for _ in range(self.concurrency):
+                await jobs.put(_DONE)
+
+        async def work():
+            while True:
+                name = await jobs.get()
+                if name is _DONE:
+                    break
+                try:
+                    result = await self.resolve(name)
+                except Exception as e:
+                    result = {"name": name, "status": "error", "ips": [], "cnames": [], "error": str(e)}
+                await results.put(result)
+            await results.put(_DONE)
+
+        tasks = [asyncio.ensure_future(feed())]
+        tasks += [asyncio.ensure_future(work()) for _ in range(self.concurrency)]
+        try:
+            finished = 0
+            while finished < self.concurrency:
+                item = await results.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
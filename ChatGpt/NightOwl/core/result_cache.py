@@ -0,0 +1,202 @@
+"""
+core/result_cache.py
+Persistent cross-scan cache of tool results.
+ - keyed by the rendered command, the tool binary's fingerprint and its env
+ - per-tool TTL (`cache_ttl` in tools.yaml)
+ - output files stored gzip-compressed and content-addressed (sha256 of the
+   raw bytes), so identical outputs across targets/days are kept once
+ - least-recently-used eviction once the store exceeds max_size_mb
+Index lives in <dir>/index.db (sqlite), blobs in <dir>/objects/.
+"""
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.utils import ensure_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    expires REAL NOT NULL,
+    manifest BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entry_files (
+    key TEXT NOT NULL,
+    relpath TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (key, relpath)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entry_files_hash ON entry_files (hash);
+"""
+
+# result fields worth replaying on a hit; the rest describe the original run
+_RESULT_KEYS = ("cmd", "rc", "elapsed", "stdout", "stderr", "lines", "bytes")
+
+
+class ResultCache:
+    def __init__(self, root: Path, max_size_mb: float = 2048, compress_level: int = 6):
+        self.root = ensure_dir(Path(root))
+        self.objects = ensure_dir(self.root / "objects")
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, str] = {}
+        self._db = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    # ---------------- Keys ---------------- #
+
+    def fingerprint(self, binary: str) -> str:
+        """
+        Identify the installed tool version by its resolved path, size and
+        mtime: upgrading or rebuilding the binary changes the key.
+        """
+        if binary not in self._fingerprints:
+            path = shutil.which(binary)
+            if path:
+                st = os.stat(path)
+                self._fingerprints[binary] = f"{os.path.realpath(path)}:{st.st_size}:{int(st.st_mtime)}"
+            else:
+                self._fingerprints[binary] = binary
+        return self._fingerprints[binary]
+
+    def key(self, cmd: str, binary: str, env: Optional[Dict[str, str]] = None, stdout: Optional[str] = None) -> str:
+        raw = json.dumps([cmd, self.fingerprint(binary), env or {}, stdout], sort_keys=True)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    # ---------------- Lookup ---------------- #
+
+    def get(self, key: str, outdir: Path) -> Optional[Dict[str, Any]]:
+        """Restore a live entry's files under `outdir` and return its result, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT created, expires, manifest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            created, expires, manifest = row
+            if expires <= now:
+                self._delete(key)
+                self._db.commit()
+                return None
+            files = self._db.execute(
+                "SELECT relpath, hash FROM entry_files WHERE key = ?", (key,)
+            ).fetchall()
+            if not all(self._blob_path(h).exists() for _, h in files):
+                self._delete(key)
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+
+        for relpath, h in files:
+            self._restore(h, outdir / relpath)
+        result = json.loads(zlib.decompress(manifest))
+        result["cache_age"] = round(now - created, 1)
+        return result
+
+    # ---------------- Store ---------------- #
+
+    def put(self, key: str, tool: str, ttl: float, outdir: Path, files: List[str], result: Dict[str, Any]):
+        """Store `files` (relative to outdir; missing ones are skipped) and the result for `ttl` seconds."""
+        stored = []
+        for relpath in dict.fromkeys(files):
+            path = outdir / relpath
+            if path.is_file():
+                stored.append((relpath, *self._store_blob(path)))
+
+        now = time.time()
+        manifest = zlib.compress(json.dumps({k: result.get(k) for k in _RESULT_KEYS}).encode())
+        with self._lock:
+            self._delete(key)
+            self._db.execute(
+                "INSERT INTO entries (key, tool, created, accessed, expires, manifest) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, tool, now, now, now + ttl, manifest),
+            )
+            for relpath, h, size in stored:
+                self._db.execute("INSERT OR IGNORE INTO blobs (hash, size) VALUES (?, ?)", (h, size))
+                self._db.execute(
+                    "INSERT INTO entry_files (key, relpath, hash) VALUES (?, ?, ?)", (key, relpath, h)
+                )
+            self._evict()
+            self._db.commit()
+
+    def _store_blob(self, path: Path):
+        digest = hashlib.sha256()
+        tmp = self.objects / f".tmp-{os.getpid()}-{threading.get_ident()}"
+        with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=self.compress_level) as dst:
+            for chunk in iter(lambda: src.read(1 << 20), b""):
+                digest.update(chunk)
+                dst.write(chunk)
+        h = digest.hexdigest()
+        blob = self._blob_path(h)
+        if blob.exists():
+            tmp.unlink()
+        else:
+            ensure_dir(blob.parent)
+            tmp.replace(blob)
+        return h, blob.stat().st_size
+
+    def _restore(self, h: str, dest: Path):
+        ensure_dir(dest.parent)
+        tmp = dest.with_name(dest.name + ".cache-tmp")
+        with gzip.open(self._blob_path(h), "rb") as src, open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        tmp.replace(dest)
+
+    def _blob_path(self, h: str) -> Path:
+        return self.objects / h[:2] / f"{h}.gz"
+
+    # ---------------- Eviction ---------------- #
+
+    def _delete(self, key: str):
+        hashes = [h for (h,) in self._db.execute("SELECT hash FROM entry_files WHERE key = ?", (key,))]
+        self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._db.execute("DELETE FROM entry_files WHERE key = ?", (key,))
+        for h in hashes:
+            if not self._db.execute("SELECT 1 FROM entry_files WHERE hash = ? LIMIT 1", (h,)).fetchone():
+                self._db.execute("DELETE FROM blobs WHERE hash = ?", (h,))
+                self._blob_path(h).unlink(missing_ok=True)
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        for (key,) in self._db.execute("SELECT key FROM entries WHERE expires <= ?", (time.time(),)).fetchall():
+            self._delete(key)
+        total = self.size()
+        if total <= self.max_bytes:
+            return
+        for (key,) in self._db.execute("SELECT key FROM entries ORDER BY accessed").fetchall():
+            self._delete(key)
+            total = self.size()
+            if total <= self.max_bytes:
+                break
+
+    def size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {"entries": entries, "size_mb": round(self.size() / (1024 * 1024), 1)}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,139 @@
+"""
+core/scheduler.py
+Dependency-graph scheduler for ReconTool.
+Runs every node as soon as the nodes it depends on have finished, with at
+most `workers` nodes running at once, and reports the critical path.
+Coroutine nodes (external tools under core.supervisor) share one event loop;
+plain callables (phase modules) run in worker threads.
+"""
+from __future__ import annotations
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Node:
+    def __init__(self, name: str, run: Callable[[], Any], deps: Optional[List[str]] = None,
+                 kind: str = "tool", phase: Optional[str] = None):
+        self.name = name
+        self.run = run
+        self.deps = list(deps or [])
+        self.kind = kind
+        self.phase = phase
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+class DagScheduler:
+    """
+    Run nodes in dependency order with a global worker budget.
+
+    A failing node is recorded but does not stop its dependents: phase
+    modules already fall back when a tool's output is missing.
+    """
+
+    def __init__(self, workers: int = 8, on_start: Optional[Callable[[Node], None]] = None,
+                 on_done: Optional[Callable[[Node], None]] = None):
+        self.workers = max(1, workers)
+        self.nodes: Dict[str, Node] = {}
+        self.on_start = on_start
+        self.on_done = on_done
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add(self, node: Node):
+        if node.name in self.nodes:
+            raise ValueError(f"duplicate node {node.name}")
+        self.nodes[node.name] = node
+
+    async def _execute(self, node: Node):
+        node.start = time.monotonic()
+        if self.on_start:
+            self.on_start(node)
+        try:
+            if inspect.iscoroutinefunction(node.run):
+                node.result = await node.run()
+            else:
+                node.result = await asyncio.to_thread(node.run)
+        except Exception as e:
+            node.error = str(e)
+        finally:
+            node.end = time.monotonic()
+        return node
+
+    def run(self):
+        asyncio.run(self._run())
+
+    async def _run(self):
+        # dependencies on nodes that are not scheduled (filtered out, resumed) are already satisfied
+        waiting = {
+            name: {d for d in node.deps if d in self.nodes}
+            for name, node in self.nodes.items()
+        }
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for name, deps in waiting.items():
+            for d in deps:
+                dependents[d].append(name)
+        order = {name: i for i, name in enumerate(self.nodes)}
+        ready = [n for n in order if not waiting[n]]
+        running = {}
+        self.started_at = time.monotonic()
+        while ready or running:
+            while ready and len(running) < self.workers:
+                name = ready.pop(0)
+                running[asyncio.ensure_future(self._execute(self.nodes[name]))] = name
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                node = self.nodes[name]
+                if self.on_done:
+                    self.on_done(node)
+                for child in dependents[name]:
+                    waiting[child].discard(name)
+                    if not waiting[child]:
+                        ready.append(child)
+            # keep declaration order among ready nodes
+            ready.sort(key=order.get)
+        self.finished_at = time.monotonic()
+        stuck = [n for n, deps in waiting.items() if deps and self.nodes[n].start is None]
+        if stuck:
+            raise RuntimeError(f"dependency cycle between: {', '.join(stuck)}")
+
+    def critical_path(self) -> Dict[str, Any]:
+        """Longest chain of dependent nodes by elapsed time."""
+        best: Dict[str, float] = {}
+        prev: Dict[str, Optional[str]] = {}
+
+        def finish(name: str) -> float:
+            if name in best:
+                return best[name]
+            node = self.nodes[name]
+            parent, base = None, 0.0
+            for d in node.deps:
+                if d in self.nodes and finish(d) > base:
+                    parent, base = d, finish(d)
+            best[name] = base + node.elapsed
+            prev[name] = parent
+            return best[name]
+
+        if not self.nodes:
+            return {"path": [], "duration": 0.0, "wall_time": 0.0}
+        tail = max(self.nodes, key=finish)
+        path = []
+        while tail:
+            path.append({"node": tail, "elapsed": round(self.nodes[tail].elapsed, 2)})
+            tail = prev[tail]
+        path.reverse()
+        wall = (self.finished_at or 0) - (self.started_at or 0)
+        return {"path": path, "duration": round(best[path[-1]["node"]], 2), "wall_time": round(wall, 2)}
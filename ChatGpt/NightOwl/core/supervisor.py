@@ -0,0 +1,178 @@
+"""
+core/supervisor.py
+Asyncio process supervisor for external tools.
+ - stdout is streamed line by line to consumers / an output file, never buffered whole
+ - stderr goes to a log file; only the last lines of each stream are kept in memory
+ - per-tool memory cap and timeout, enforced on the whole process group
+   (SIGTERM first, SIGKILL after a grace period)
+ - CPU time and peak RSS of the process tree, sampled with psutil
+"""
+from __future__ import annotations
+import asyncio
+import os
+import signal
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import psutil
+
+from core.utils import ensure_dir
+
+LineConsumer = Callable[[str], None]
+
+_READ_LIMIT = 1 << 20  # longest line kept whole; longer lines are split
+
+
+class ProcessSupervisor:
+    def __init__(self, grace: float = 5.0, poll_interval: float = 0.5, tail_lines: int = 200):
+        self.grace = grace
+        self.poll_interval = poll_interval
+        self.tail_lines = tail_lines
+
+    async def run(
+        self,
+        cmd: str,
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[float] = None,
+        stdout_path: Optional[Path] = None,
+        stderr_path: Optional[Path] = None,
+        consumers: Iterable[LineConsumer] = (),
+        env: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run `cmd` through the shell in its own process group.
+
+        Returns the same keys as core.utils.run_command (stdout/stderr hold
+        only the last `tail_lines` lines) plus lines, bytes, cpu_user,
+        cpu_system, peak_rss_mb and killed ("timeout", "memory" or None).
+        """
+        start = time.time()
+        proc = await asyncio.create_subprocess_shell(
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            limit=_READ_LIMIT,
+            env={**os.environ, **env} if env else None,
+        )
+        stats = {"lines": 0, "bytes": 0, "cpu_user": 0.0, "cpu_system": 0.0, "peak_rss": 0, "killed": None}
+        out_tail: deque = deque(maxlen=self.tail_lines)
+        err_tail: deque = deque(maxlen=self.tail_lines)
+
+        readers = asyncio.gather(
+            self._pump(proc.stdout, out_tail, stdout_path, list(consumers), stats),
+            self._pump(proc.stderr, err_tail, stderr_path, [], None),
+        )
+        watcher = asyncio.ensure_future(self._watch(proc, memory_limit_mb, stats))
+        try:
+            await asyncio.wait_for(asyncio.shield(readers), timeout)
+            await proc.wait()
+        except asyncio.TimeoutError:
+            stats["killed"] = "timeout"
+            await self._terminate(proc)
+            await readers
+        finally:
+            watcher.cancel()
+            if proc.returncode is None:
+                await self._terminate(proc)
+                await readers
+
+        if stats["killed"] == "timeout":
+            rc = 124
+        elif stats["killed"] == "memory":
+            rc = 137
+        else:
+            rc = proc.returncode
+        return {
+            "cmd": cmd,
+            "rc": rc,
+            "elapsed": round(time.time() - start, 2),
+            "stdout": "\n".join(out_tail),
+            "stderr": "\n".join(err_tail),
+            "timeout": stats["killed"] == "timeout",
+            "killed": stats["killed"],
+            "lines": stats["lines"],
+            "bytes": stats["bytes"],
+            "cpu_user": round(stats["cpu_user"], 2),
+            "cpu_system": round(stats["cpu_system"], 2),
+            "peak_rss_mb": round(stats["peak_rss"] / (1024 * 1024), 1),
+        }
+
+    async def _pump(self, stream, tail: deque, path: Optional[Path], consumers, stats):
+        fh = None
+        if path:
+            ensure_dir(path.parent)
+            fh = open(path, "w")
+        try:
+            while True:
+                try:
+                    raw = await stream.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    raw = e.partial  # last line without a newline, or EOF
+                except asyncio.LimitOverrunError as e:
+                    # line longer than the read limit: the buffered part becomes one piece,
+                    # the rest of the line follows as the next piece(s)
+                    raw = await stream.readexactly(e.consumed)
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                tail.append(line)
+                if fh:
+                    fh.write(line + "\n")
+                for consume in consumers:
+                    consume(line)
+                if stats is not None:
+                    stats["lines"] += 1
+                    stats["bytes"] += len(raw)
+        finally:
+            if fh:
+                fh.close()
+
+    async def _watch(self, proc, memory_limit_mb: Optional[float], stats):
+        """Sample the process tree for CPU/RSS and enforce the memory cap."""
+        cpu: Dict[int, tuple] = {}
+        try:
+            root = psutil.Process(proc.pid)
+        except psutil.Error:
+            return
+        while proc.returncode is None:
+            rss = 0
+            try:
+                procs = [root] + root.children(recursive=True)
+            except psutil.Error:
+                procs = []
+            for p in procs:
+                try:
+                    with p.oneshot():
+                        rss += p.memory_info().rss
+                        t = p.cpu_times()
+                        cpu[p.pid] = (t.user, t.system)
+                except psutil.Error:
+                    continue
+            stats["peak_rss"] = max(stats["peak_rss"], rss)
+            stats["cpu_user"] = sum(u for u, _ in cpu.values())
+            stats["cpu_system"] = sum(s for _, s in cpu.values())
+            if memory_limit_mb and rss > memory_limit_mb * 1024 * 1024:
+                stats["killed"] = "memory"
+                await self._terminate(proc)
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    async def _terminate(self, proc):
+        """SIGTERM the process group, then SIGKILL it if it is still there after `grace` seconds."""
+        if proc.returncode is not None:
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        try:
+            await asyncio.wait_for(proc.wait(), self.grace)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await proc.wait()
@@ -5,8 +5,6 @@ Stage 10.5 – adds timeout + parallel support utilities.
 """
 from __future__ import annotations
 import shutil
-import subprocess
-import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import yaml
@@ -20,9 +18,11 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 def project_path(*parts) -> Path:
     return PROJECT_ROOT.joinpath(*parts)
 
+def target_slug(target: str) -> str:
+    return target.replace("*.", "").strip()
+
 def target_outdir(target: str) -> Path:
-    safe = target.replace("*.", "").strip()
-    return project_path("output") / safe
+    return project_path("output") / target_slug(target)
 
 def ensure_dir(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
@@ -49,6 +49,42 @@ def load_phases_config(path: str = "config/phases.yaml") -> List[Dict[str, Any]]
         raise ValueError("phases.yaml must be a list of phase objects")
     return data
 
+DNS_DEFAULTS = {
+    "resolvers": [],
+    "port": 53,
+    "concurrency": 200,
+    "timeout": 2,
+    "retries": 2,
+    "wildcard_checks": 2,
+}
+
+def load_dns_config(path: str = "config/dns.yaml") -> Dict[str, Any]:
+    p = project_path(path)
+    data = _read_yaml(p) if p.exists() else None
+    return {**DNS_DEFAULTS, **(data or {})}
+
+CACHE_DEFAULTS = {
+    "enabled": True,
+    "dir": "cache",
+    "max_size_mb": 2048,
+    "default_ttl": 0,
+    "compress_level": 6,
+}
+
+def load_cache_config(path: str = "config/cache.yaml") -> Dict[str, Any]:
+    p = project_path(path)
+    data = _read_yaml(p) if p.exists() else None
+    return {**CACHE_DEFAULTS, **(data or {})}
+
+DELTA_DEFAULTS = {
+    "full_refresh_days": 7,
+}
+
+def load_delta_config(path: str = "config/delta.yaml") -> Dict[str, Any]:
+    p = project_path(path)
+    data = _read_yaml(p) if p.exists() else None
+    return {**DELTA_DEFAULTS, **(data or {})}
+
 def validate_schema(instance, schema_rel_path: str):
     schema_path = project_path(schema_rel_path)
     if not schema_path.exists():
@@ -86,54 +122,56 @@ def write_lines(path: Path, lines: List[str]):
     ensure_dir(path.parent)
     path.write_text("\n".join(lines) + ("\n" if lines else ""))
 
+def read_json(path: Path, default: Any = None) -> Any:
+    if not path.exists():
+        return default
+    try:
+        return json.loads(path.read_text())
+    except ValueError:
+        return default
+
+def write_json(path: Path, data: Any):
+    ensure_dir(path.parent)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, default=str))
+    tmp.replace(path)
+
 # ---------------- Command Execution ---------------- #
 
 DEFAULT_TIMEOUT = 300  # seconds
 
+DEFAULT_MAX_MEMORY_MB = 2048  # per tool process tree; 0/None disables the cap
+
 def run_command(
     cmd: str,
     timeout: Optional[int] = None,
-    shell: bool = True,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+    memory_limit_mb: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
-    Run a shell command with timeout enforcement.
+    Run a shell command under core.supervisor.ProcessSupervisor.
+    Blocking wrapper for callers outside an event loop.
 
     Returns:
         {
           'cmd': str,
           'rc': int,
           'elapsed': float,
-          'stdout': str,
-          'stderr': str,
-          'timeout': bool
+          'stdout': str,      # last lines only
+          'stderr': str,      # last lines only
+          'timeout': bool,
+          ...                 # cpu/rss/line counters, see ProcessSupervisor.run
         }
     """
-    to = timeout if timeout is not None else DEFAULT_TIMEOUT
-    start = time.time()
-    proc = subprocess.Popen(
+    import asyncio
+    from core.supervisor import ProcessSupervisor
+
+    return asyncio.run(ProcessSupervisor().run(
         cmd,
-        shell=shell,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    timed_out = False
-    try:
-        stdout, stderr = proc.communicate(timeout=to)
-    except subprocess.TimeoutExpired:
-        timed_out = True
-        proc.kill()
-        try:
-            stdout, stderr = proc.communicate(timeout=5)
-        except Exception:
-            stdout, stderr = "", "forced termination"
-    elapsed = time.time() - start
-    return {
-        "cmd": cmd,
-        "rc": (proc.returncode if not timed_out else 124),
-        "elapsed": elapsed,
-        "stdout": stdout,
-        "stderr": stderr,
-        "timeout": timed_out,
-    }
+        timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+        memory_limit_mb=memory_limit_mb,
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+    ))
 
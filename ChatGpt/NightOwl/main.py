@@ -22,6 +22,10 @@ def main():
         phases=args.phases.split(",") if args.phases else None,
         resume=args.resume,
         ui=ui,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        delta=args.delta,
+        full_refresh=args.full_refresh,
     )
     engine.run()
 
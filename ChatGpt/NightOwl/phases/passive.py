@@ -1,13 +1,15 @@
 """
 phases/passive.py
-Merge passive subdomain tool outputs and perform lightweight DNS resolution.
+Merge passive subdomain tool outputs and resolve them concurrently.
 """
 from __future__ import annotations
-import socket
+import asyncio
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from core.utils import ensure_dir, read_lines, write_lines
+from core.resolver import ConcurrentResolver
+from core.utils import ensure_dir, read_lines, write_lines, load_dns_config
 
 PASSIVE_OUTPUT_FILES = [
     "subfinder.txt",
@@ -21,13 +23,43 @@ def _read_tool_file(base_dir: Path, fname: str):
     p = base_dir / "subdomains" / fname
     return read_lines(p, unique=False) if p.exists() else []
 
-def _resolve_host(host: str):
+async def _resolve_all(names: List[str], sub_dir: Path, dns_cfg: Dict[str, Any], ui) -> Counter:
+    """Resolve ``names`` and append each result to the output files as it arrives."""
+    counts = Counter()
+    files = {
+        key: open(sub_dir / fname, "w")
+        for key, fname in [
+            ("resolved", "resolved.txt"),
+            ("unresolved", "unresolved.txt"),
+            ("with_ip", "resolved_with_ip.txt"),
+            ("wildcard", "wildcard.txt"),
+        ]
+    }
     try:
-        data = socket.gethostbyname_ex(host)
-        # data: (hostname, aliaslist, ipaddrlist)
-        return data[2] if data and len(data) >= 3 else []
-    except Exception:
-        return []
+        async with ConcurrentResolver(
+            nameservers=dns_cfg["resolvers"],
+            port=dns_cfg["port"],
+            concurrency=dns_cfg["concurrency"],
+            timeout=dns_cfg["timeout"],
+            retries=dns_cfg["retries"],
+            wildcard_checks=dns_cfg["wildcard_checks"],
+        ) as resolver:
+            async for res in resolver.resolve_many(names):
+                counts[res["status"]] += 1
+                if res["status"] == "resolved":
+                    files["resolved"].write(res["name"] + "\n")
+                    files["with_ip"].write(f"{res['name']},{','.join(res['ips'])}\n")
+                elif res["status"] == "wildcard":
+                    files["wildcard"].write(f"{res['name']},{','.join(res['ips'])}\n")
+                else:
+                    files["unresolved"].write(res["name"] + "\n")
+                done = sum(counts.values())
+                if done % 5000 == 0:
+                    ui.log(f"  … {done}/{len(names)} resolved ({counts['resolved']} live)")
+    finally:
+        for f in files.values():
+            f.close()
+    return counts
 
 def run(
     target,
@@ -56,20 +88,11 @@ def run(
     ui.log_success(f"Collected {len(raw)} candidate subdomains.")
 
     # DNS resolve
-    ui.log("Resolving candidates (Python socket)…")
-    resolved = []
-    unresolved = []
-    resolved_with_ip = []
-    for name in raw:
-        ips = _resolve_host(name)
-        if ips:
-            resolved.append(name)
-            resolved_with_ip.append(f"{name},{','.join(ips)}")
-        else:
-            unresolved.append(name)
+    dns_cfg = load_dns_config()
+    ui.log(f"Resolving candidates ({dns_cfg['concurrency']} parallel)…")
+    counts = asyncio.run(_resolve_all(raw, sub_dir, dns_cfg, ui))
 
-    write_lines(sub_dir / "resolved.txt", resolved)
-    write_lines(sub_dir / "unresolved.txt", unresolved)
-    write_lines(sub_dir / "resolved_with_ip.txt", resolved_with_ip)
-
-    ui.log_success(f"Resolved: {len(resolved)} | Unresolved: {len(unresolved)}")
+    unresolved = sum(n for status, n in counts.items() if status not in ("resolved", "wildcard"))
+    ui.log_success(
+        f"Resolved: {counts['resolved']} | Unresolved: {unresolved} | Wildcard: {counts['wildcard']}"
+    )
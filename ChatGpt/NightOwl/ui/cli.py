@@ -9,4 +9,12 @@ def parse_args():
     p.add_argument("--tools", help="Comma-separated tool override (custom mode only)")
     p.add_argument("--phases", help="Comma-separated phase override (custom mode only)")
     p.add_argument("--resume", action="store_true", help="Resume previous scan state")
+    p.add_argument("--workers", type=int, default=8,
+                  help="Max tools/phase modules running at once across all phases")
+    p.add_argument("--no-cache", action="store_true",
+                  help="Always run tools instead of reusing cached results from earlier scans")
+    p.add_argument("--delta", action="store_true",
+                  help="Run delta tools (nuclei, naabu, …) only on hosts new or changed since the last run")
+    p.add_argument("--full-refresh", action="store_true",
+                  help="With --delta, rescan every host and reset the refresh clock")
     return p.parse_args()
@@ -1,18 +1,21 @@
-from fastapi import FastAPI, BackgroundTasks, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 import os
+import json
 import uuid
 import asyncio
+from config.settings import API_PAGE_SIZE
 from core.orchestrator import NightOwlOrchestrator
-from core.dashboard import NightOwlDashboard
+from .jobs import JobStore, JobDashboard, ScanPool, QueueFull, FINISHED
 
 app = FastAPI(
     title="NightOwl Recon API",
     description="REST API for NightOwl Reconnaissance Tool",
-    version="1.0.0"
+    version="1.1.0"
 )
 
 app.add_middleware(
@@ -23,7 +26,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-scan_status = {}
+store = JobStore()
 
 class ScanRequest(BaseModel):
     target: str
@@ -31,35 +34,138 @@ class ScanRequest(BaseModel):
     target_type: str = "single"
     custom_tools: list = []
 
+def run_scan(job, store):
+    scan_id = job["id"]
+    output_dir = f"outputs/{job['target']}_{scan_id}"
+    os.makedirs(output_dir, exist_ok=True)
+    store.update_job(scan_id, status="running", output_dir=output_dir, start_time=datetime.now().isoformat())
+    try:
+        dashboard = JobDashboard(store, scan_id, verbose=True)
+        dashboard.start()
+        dashboard.set_target_info(job["target"], job["mode"], job["target_type"])
+
+        orchestrator = NightOwlOrchestrator(
+            target=job["target"],
+            mode=job["mode"],
+            target_type=job["target_type"],
+            custom_tools=job["custom_tools"],
+            output_dir=output_dir,
+            dashboard=dashboard,
+            verbose=True
+        )
+        orchestrator.on_findings = lambda phase, tool, items: store.add_findings(scan_id, phase, tool, items)
+        orchestrator.on_phase = lambda phase: (store.update_job(scan_id, phase=phase),
+                                               store.add_event(scan_id, "phase", phase))
+
+        asyncio.run(orchestrator.execute_workflow())
+        store.update_job(scan_id, status="completed", end_time=datetime.now().isoformat())
+    except Exception as e:
+        store.update_job(scan_id, status="failed", error=str(e), end_time=datetime.now().isoformat())
+
+pool = ScanPool(store, run_scan)
+
+@app.on_event("startup")
+async def start_pool():
+    await pool.start()
+
+@app.on_event("shutdown")
+async def stop_pool():
+    await pool.stop()
+
+def _job_or_404(scan_id):
+    job = store.get_job(scan_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scan not found")
+    return job
+
+def _limit(limit):
+    return max(1, min(limit or API_PAGE_SIZE, 1000))
+
 @app.post("/scan", status_code=202)
-async def start_scan(request: ScanRequest, background_tasks: BackgroundTasks):
+async def start_scan(request: ScanRequest):
     scan_id = f"scan_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:6]}"
-    scan_status[scan_id] = {
-        "id": scan_id,
-        "target": request.target,
-        "status": "queued",
-        "start_time": datetime.now().isoformat()
+    try:
+        await pool.submit(scan_id, request.target, request.mode, request.target_type, request.custom_tools)
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=f"Scan queue is full: {e}")
+    position = await asyncio.to_thread(store.queue_position, scan_id)
+    return {"scan_id": scan_id, "status": "queued", "queue_position": position}
+
+# Handlers that only query the store are plain functions, which FastAPI
+# runs in its threadpool, so sqlite never blocks the event loop.
+
+@app.get("/scans")
+def list_scans(status: Optional[str] = None, after: int = 0, limit: int = API_PAGE_SIZE):
+    """Scans in submission order, one page at a time; pass `next` back as `after`."""
+    jobs = store.list_jobs(status, after, _limit(limit))
+    return {
+        "items": jobs,
+        "next": jobs[-1]["seq"] if len(jobs) == _limit(limit) else None,
+        "running": len(pool.running),
+        "queued": store.count_queued()
     }
-    
-    background_tasks.add_task(run_scan, scan_id, request)
-    return {"scan_id": scan_id, "status": "queued"}
 
 @app.get("/scan/{scan_id}")
-async def get_scan_status(scan_id: str):
-    if scan_id not in scan_status:
-        raise HTTPException(status_code=404, detail="Scan not found")
-    return scan_status[scan_id]
+def get_scan_status(scan_id: str):
+    job = _job_or_404(scan_id)
+    job["findings"] = store.finding_counts(scan_id)
+    if job["status"] == "queued":
+        job["queue_position"] = store.queue_position(scan_id)
+    if job["status"] == "completed":
+        job["report_url"] = f"/scan/{scan_id}/report"
+    return job
+
+@app.get("/scan/{scan_id}/findings")
+def get_scan_findings(scan_id: str, after: int = 0, limit: int = API_PAGE_SIZE,
+                      tool: Optional[str] = None, phase: Optional[str] = None):
+    """Findings recorded so far, oldest first, one page at a time; pass `next` back as `after`."""
+    _job_or_404(scan_id)
+    items = store.findings(scan_id, after, _limit(limit), tool, phase)
+    return {"items": items, "next": items[-1]["seq"] if len(items) == _limit(limit) else None}
+
+@app.get("/scan/{scan_id}/events")
+async def stream_scan_events(scan_id: str, request: Request, after: int = 0,
+                             last_event_id: Optional[str] = Header(None)):
+    """
+    Server-sent events: status, phase, tool and finding events as they are
+    recorded. Ends with an `end` event once the scan is finished. A client
+    that reconnects resumes after Last-Event-ID (or `after`).
+    """
+    await asyncio.to_thread(_job_or_404, scan_id)
+    cursor = int(last_event_id) if last_event_id and last_event_id.isdigit() else after
+
+    async def events():
+        nonlocal cursor
+        idle = 0
+        while not await request.is_disconnected():
+            rows = await asyncio.to_thread(store.events, scan_id, cursor)
+            for row in rows:
+                cursor = row["seq"]
+                yield f"id: {row['seq']}\nevent: {row['kind']}\ndata: {json.dumps(row)}\n\n"
+            if rows:
+                idle = 0
+                continue
+            job = await asyncio.to_thread(store.get_job, scan_id)
+            if job["status"] in FINISHED and not await asyncio.to_thread(store.events, scan_id, cursor, 1):
+                yield f"event: end\ndata: {json.dumps({'status': job['status']})}\n\n"
+                return
+            idle += 1
+            if idle % 15 == 0:
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(1)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @app.get("/scan/{scan_id}/report")
-async def get_scan_report(scan_id: str, report_type: str = "html"):
-    if scan_id not in scan_status:
-        raise HTTPException(status_code=404, detail="Scan not found")
-    
-    if scan_status[scan_id]["status"] != "completed":
+def get_scan_report(scan_id: str, report_type: str = "html"):
+    job = _job_or_404(scan_id)
+
+    if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="Scan not completed")
-    
-    output_dir = scan_status[scan_id]["output_dir"]
-    
+
+    output_dir = job["output_dir"]
+
     if report_type == "html":
         report_path = f"{output_dir}/reports/report.html"
         return FileResponse(report_path, media_type="text/html")
@@ -68,35 +174,3 @@ async def get_scan_report(scan_id: str, report_type: str = "html"):
         return FileResponse(report_path, media_type="application/pdf")
     else:
         raise HTTPException(status_code=400, detail="Invalid report type")
-
-def run_scan(scan_id: str, request: ScanRequest):
-    try:
-        scan_status[scan_id]["status"] = "running"
-        
-        output_dir = f"outputs/{request.target}_{scan_id}"
-        os.makedirs(output_dir, exist_ok=True)
-        scan_status[scan_id]["output_dir"] = output_dir
-        
-        dashboard = NightOwlDashboard(verbose=True)
-        dashboard.start()
-        dashboard.set_target_info(request.target, request.mode, request.target_type)
-        
-        orchestrator = NightOwlOrchestrator(
-            target=request.target,
-            mode=request.mode,
-            target_type=request.target_type,
-            custom_tools=request.custom_tools,
-            output_dir=output_dir,
-            dashboard=dashboard,
-            verbose=True
-        )
-        
-        asyncio.run(orchestrator.execute_workflow())
-        
-        scan_status[scan_id]["status"] = "completed"
-        scan_status[scan_id]["end_time"] = datetime.now().isoformat()
-        scan_status[scan_id]["report_url"] = f"/scan/{scan_id}/report"
-        
-    except Exception as e:
-        scan_status[scan_id]["status"] = "failed"
-        scan_status[scan_id]["error"] = str(e)
\ No newline at end of file
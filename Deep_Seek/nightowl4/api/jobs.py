@@ -0,0 +1,251 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from rich.progress import Progress, BarColumn, TextColumn
+from config.settings import API_DB_PATH, API_MAX_CONCURRENT_SCANS, API_MAX_QUEUED_SCANS
+from core.dashboard import NightOwlDashboard
+
+FINISHED = ("completed", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT UNIQUE NOT NULL,
+    target TEXT NOT NULL,
+    mode TEXT,
+    target_type TEXT,
+    custom_tools TEXT,
+    status TEXT NOT NULL,
+    phase TEXT,
+    output_dir TEXT,
+    error TEXT,
+    created TEXT,
+    start_time TEXT,
+    end_time TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    phase TEXT,
+    tool TEXT,
+    data TEXT,
+    created TEXT
+);
+CREATE INDEX IF NOT EXISTS events_scan ON events (scan_id, seq);
+CREATE INDEX IF NOT EXISTS events_findings ON events (scan_id, kind, tool, seq);
+"""
+
+class JobStore:
+    """
+    Scan jobs and their event log in sqlite, shared by the API and the scan threads.
+
+    Every status change, phase, tool start/finish/error and each individual
+    finding is an event row. Its autoincrement `seq` is the cursor that
+    event streams and paginated queries resume from.
+
+    Writes go through one connection under a lock. Each reading thread has
+    its own connection; with WAL, reads never wait for a write. All methods
+    block, so call them from async code with asyncio.to_thread().
+    """
+
+    def __init__(self, path=API_DB_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.readers = threading.local()
+
+    def _write(self, sql, args=()):
+        with self.lock, self.db:
+            return self.db.execute(sql, args)
+
+    def _read(self, sql, args=()):
+        db = getattr(self.readers, "db", None)
+        if db is None:
+            db = self.readers.db = sqlite3.connect(self.path, isolation_level=None)
+            db.row_factory = sqlite3.Row
+        return [dict(row) for row in db.execute(sql, args).fetchall()]
+
+    def create_job(self, scan_id, target, mode, target_type, custom_tools):
+        self._write(
+            "INSERT INTO jobs (id, target, mode, target_type, custom_tools, status, created) VALUES (?, ?, ?, ?, ?, 'queued', ?)",
+            (scan_id, target, mode, target_type, json.dumps(custom_tools), datetime.now().isoformat())
+        )
+        self.add_event(scan_id, "status", data="queued")
+
+    def get_job(self, scan_id):
+        rows = self._read("SELECT * FROM jobs WHERE id = ?", (scan_id,))
+        if not rows:
+            return None
+        job = rows[0]
+        job["custom_tools"] = json.loads(job["custom_tools"] or "[]")
+        return job
+
+    def update_job(self, scan_id, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock, self.db:
+            # one transaction, so a reader never sees the new status without its event
+            self.db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), scan_id))
+            if "status" in fields:
+                self.db.execute(
+                    "INSERT INTO events (scan_id, kind, data, created) VALUES (?, 'status', ?, ?)",
+                    (scan_id, fields["status"], datetime.now().isoformat())
+                )
+
+    def list_jobs(self, status=None, after=0, limit=100):
+        if status:
+            return self._read("SELECT * FROM jobs WHERE status = ? AND seq > ? ORDER BY seq LIMIT ?", (status, after, limit))
+        return self._read("SELECT * FROM jobs WHERE seq > ? ORDER BY seq LIMIT ?", (after, limit))
+
+    def queue_position(self, scan_id):
+        """Number of queued jobs ahead of this one."""
+        rows = self._read(
+            "SELECT COUNT(*) AS n FROM jobs WHERE status = 'queued' AND seq < (SELECT seq FROM jobs WHERE id = ?)",
+            (scan_id,)
+        )
+        return rows[0]["n"]
+
+    def count_queued(self):
+        return self._read("SELECT COUNT(*) AS n FROM jobs WHERE status = 'queued'")[0]["n"]
+
+    def recover(self):
+        """
+        Called at startup. Jobs left running by a previous server process are
+        failed; queued ones are returned in submission order to be run again.
+        """
+        for job in self._read("SELECT id FROM jobs WHERE status = 'running'"):
+            self.update_job(job["id"], status="failed", error="interrupted by server restart",
+                            end_time=datetime.now().isoformat())
+        return [job["id"] for job in self._read("SELECT id FROM jobs WHERE status = 'queued' ORDER BY seq")]
+
+    def add_event(self, scan_id, kind, phase=None, tool=None, data=None):
+        self._write(
+            "INSERT INTO events (scan_id, kind, phase, tool, data, created) VALUES (?, ?, ?, ?, ?, ?)",
+            (scan_id, kind, phase, tool, data, datetime.now().isoformat())
+        )
+
+    def add_findings(self, scan_id, phase, tool, items):
+        now = datetime.now().isoformat()
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT INTO events (scan_id, kind, phase, tool, data, created) VALUES (?, 'finding', ?, ?, ?, ?)",
+                [(scan_id, phase, tool, item, now) for item in items]
+            )
+
+    def events(self, scan_id, after=0, limit=500):
+        return self._read("SELECT * FROM events WHERE scan_id = ? AND seq > ? ORDER BY seq LIMIT ?", (scan_id, after, limit))
+
+    def findings(self, scan_id, after=0, limit=100, tool=None, phase=None):
+        sql = "SELECT seq, phase, tool, data, created FROM events WHERE scan_id = ? AND kind = 'finding' AND seq > ?"
+        args = [scan_id, after]
+        if tool:
+            sql += " AND tool = ?"
+            args.append(tool)
+        if phase:
+            sql += " AND phase = ?"
+            args.append(phase)
+        return self._read(sql + " ORDER BY seq LIMIT ?", (*args, limit))
+
+    def finding_counts(self, scan_id):
+        rows = self._read(
+            "SELECT tool, COUNT(*) AS n FROM events WHERE scan_id = ? AND kind = 'finding' GROUP BY tool", (scan_id,)
+        )
+        return {row["tool"]: row["n"] for row in rows}
+
+
+class JobDashboard(NightOwlDashboard):
+    """Dashboard for API scans: also records tool progress as job events, and uses no live display."""
+
+    def __init__(self, store, scan_id, verbose=False):
+        super().__init__(verbose=verbose)
+        self.store = store
+        self.scan_id = scan_id
+
+    def start(self):
+        # several scans share the server's terminal, so no Live display
+        self.progress = Progress(TextColumn("{task.description}"), BarColumn(), console=self.console)
+
+    def start_tool(self, tool, description):
+        self.store.add_event(self.scan_id, "tool_start", self.phases[self.current_phase], tool, description)
+        return super().start_tool(tool, description)
+
+    def complete_tool(self, tool, result):
+        self.store.add_event(self.scan_id, "tool_done", self.phases[self.current_phase], tool, str(result))
+        super().complete_tool(tool, result)
+
+    def tool_error(self, tool, error):
+        self.store.add_event(self.scan_id, "tool_error", self.phases[self.current_phase], tool, str(error))
+        super().tool_error(tool, error)
+
+    def skip_tool(self, tool, reason):
+        self.store.add_event(self.scan_id, "tool_skipped", None, tool, str(reason))
+        super().skip_tool(tool, reason)
+
+
+class QueueFull(Exception):
+    pass
+
+
+class ScanPool:
+    """
+    Runs at most `max_concurrent` scans at a time. Each runs in its own
+    thread, so the event loop stays free for API requests. Further scans
+    wait in a FIFO queue. Once `max_queued` are waiting, submit() raises
+    QueueFull. Store calls are made with asyncio.to_thread().
+    """
+
+    def __init__(self, store, runner, max_concurrent=API_MAX_CONCURRENT_SCANS, max_queued=API_MAX_QUEUED_SCANS):
+        self.store = store
+        self.runner = runner
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max_queued
+        self.queue = None
+        self.workers = []
+        self.running = set()
+        self.submitting = 0
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        for scan_id in await asyncio.to_thread(self.store.recover):
+            self.queue.put_nowait(scan_id)
+        self.workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)]
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+
+    async def submit(self, scan_id, target, mode, target_type, custom_tools):
+        # jobs still being written count too, so concurrent submits cannot overshoot
+        if self.queue.qsize() + self.submitting >= self.max_queued:
+            raise QueueFull(f"{self.queue.qsize() + self.submitting} scans already queued")
+        self.submitting += 1
+        try:
+            await asyncio.to_thread(self.store.create_job, scan_id, target, mode, target_type, custom_tools)
+            self.queue.put_nowait(scan_id)
+        finally:
+            self.submitting -= 1
+
+    async def _worker(self):
+        while True:
+            scan_id = await self.queue.get()
+            try:
+                job = await asyncio.to_thread(self.store.get_job, scan_id)
+                if job and job["status"] == "queued":
+                    self.running.add(scan_id)
+                    await asyncio.to_thread(self.runner, job, self.store)
+            except Exception as e:
+                await asyncio.to_thread(self.store.update_job, scan_id, status="failed", error=str(e),
+                                        end_time=datetime.now().isoformat())
+            finally:
+                self.running.discard(scan_id)
+                self.queue.task_done()
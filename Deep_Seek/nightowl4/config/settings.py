@@ -7,6 +7,10 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 # API configuration
 API_HOST = "0.0.0.0"
 API_PORT = 8000
+API_DB_PATH = os.getenv("NIGHTOWL_API_DB", "outputs/nightowl_api.db")  # scan jobs, events and findings
+API_MAX_CONCURRENT_SCANS = int(os.getenv("NIGHTOWL_MAX_SCANS", 2))
+API_MAX_QUEUED_SCANS = 100   # further POST /scan requests get 429
+API_PAGE_SIZE = 100          # default page size of list endpoints (max 1000)
 
 # Default scan modes
 SCAN_MODES = {
@@ -34,4 +38,43 @@ OUTPUT_DIRS = [
     "reports",
     "network",
     "mobile"
-]
\ No newline at end of file
+]
+
+# Distributed task queue (core/distributed.py)
+QUEUE_CONFIG = {
+    "backend": os.getenv("NIGHTOWL_QUEUE", "redis"),  # "memory" = in-process, for tests and single-host runs
+    "prefix": "nightowl",
+    "codec": "msgpack" if os.getenv("NIGHTOWL_CODEC") == "msgpack" else "json",
+    "lease_seconds": 120,       # a task is re-delivered if its worker stops renewing it this long
+    "heartbeat_interval": 15,   # workers renew heartbeat and leases this often
+    "worker_timeout": 60,       # a worker silent this long is considered dead
+    "max_attempts": 3,          # deliveries before a task is answered with an error
+    "batch_size": 10            # tasks leased per fetch
+}
+
+# How --distributed scans are cut into work units (see NightOwlOrchestrator)
+FANOUT_CONFIG = {
+    "subdomain_tools": ["amass", "subfinder", "assetfinder", "findomain"],  # run remotely, one task per tool
+    "probe_chunk": 250,     # hosts per liveness-probe task
+    "nuclei_chunk": 200,    # live URLs per nuclei task
+    "timeout": None         # seconds to wait for a phase's units; None waits until all are answered
+}
+
+# Live host checking (NightOwlUtils.check_alive)
+ALIVE_CHECK = {
+    "concurrency": 500,     # TCP connections in flight
+    "dns_workers": 64,      # threads resolving hostnames
+    "timeout": 2,           # seconds per connect (and per HEAD when verify_http is set)
+    "verify_http": False    # send HEAD / and require an HTTP status line, not just an open port
+}
+
+# ffuf content discovery (NightOwlOrchestrator.run_ffuf)
+FFUF_CONFIG = {
+    "wordlist": WORDLISTS["directories"],
+    "parallel_hosts": 20,       # ffuf processes at once
+    "rate": 400,                # requests/second across all of them, split evenly
+    "threads": 10,              # ffuf -t per process
+    "max_time": 600,            # ffuf -maxtime per host, seconds
+    "args": "-mc 200,204,301,302,307,401,403",
+    "wildcard_threshold": 25    # drop a (status, length, words) signature seen this often on one host
+}
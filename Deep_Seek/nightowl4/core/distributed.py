@@ -1,44 +1,658 @@
-import redis
-import pickle
+import json
+import os
+import socket
+import threading
+import time
+import uuid
 from datetime import datetime
 
+from config.settings import REDIS_HOST, REDIS_PORT, QUEUE_CONFIG
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# ---------------------------------------------------------------------------
+# Framing: one tag byte then the body, so JSON and msgpack peers interoperate
+# ---------------------------------------------------------------------------
+
+def encode(obj, codec="json"):
+    if codec == "msgpack" and msgpack is not None:
+        return b"m" + msgpack.packb(obj, use_bin_type=True)
+    return b"j" + json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+def decode(data):
+    if isinstance(data, str):
+        data = data.encode()
+    if data[:1] == b"m":
+        if msgpack is None:
+            raise ValueError("msgpack-framed message but msgpack is not installed")
+        return msgpack.unpackb(data[1:], raw=False)
+    if data[:1] == b"j":
+        return json.loads(data[1:])
+    raise ValueError("unknown message framing")
+
+def _s(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# ---------------------------------------------------------------------------
+# Backends. Both implement the same small set of atomic operations.
+#
+#   tasks     id -> encoded task       attempts  id -> deliveries so far
+#   solo      ids always leased alone (long work units), never in a batch
+#   leases    id -> lease deadline     owners    id -> worker holding it
+#   queues    ready task ids; "ready" is shared, "ready:<worker>" holds
+#             tasks hinted to one worker (locality), which idle workers
+#             may steal
+#   done:<scan>     ids already acked (first result wins)
+#   results:<scan>  result stream, read with a cursor
+#   workers         worker -> last heartbeat, worker_info -> its details
+# ---------------------------------------------------------------------------
+
+_FETCH = """
+local out = {}
+local n = tonumber(ARGV[2])
+for q = 6, #KEYS do
+  while #out < n * 3 do
+    local id = redis.call('LPOP', KEYS[q])
+    if not id then break end
+    local data = redis.call('HGET', KEYS[3], id)
+    if data then
+      local solo = redis.call('HEXISTS', KEYS[5], id) == 1
+      if solo and #out > 0 then
+        redis.call('LPUSH', KEYS[q], id)
+        return out
+      end
+      redis.call('ZADD', KEYS[1], ARGV[3], id)
+      redis.call('HSET', KEYS[2], id, ARGV[1])
+      local attempts = redis.call('HINCRBY', KEYS[4], id, 1)
+      table.insert(out, id)
+      table.insert(out, data)
+      table.insert(out, attempts)
+      if solo then
+        return out
+      end
+    end
+  end
+end
+return out
+"""
+
+_ACK = """
+if redis.call('HSETNX', KEYS[5], ARGV[1], ARGV[2]) == 0 then
+  return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+redis.call('HDEL', KEYS[7], ARGV[1])
+redis.call('XADD', KEYS[6], '*', 'task', ARGV[1], 'data', ARGV[3])
+return 1
+"""
+
+_REQUEUE = """
+local dead = {}
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], id)
+  redis.call('HDEL', KEYS[2], id)
+  local data = redis.call('HGET', KEYS[3], id)
+  if data then
+    local attempts = tonumber(redis.call('HGET', KEYS[4], id) or '0')
+    if attempts >= tonumber(ARGV[2]) then
+      table.insert(dead, id)
+      table.insert(dead, data)
+    else
+      redis.call('LPUSH', KEYS[5], id)
+    end
+  end
+end
+return dead
+"""
+
+_HEARTBEAT = """
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[1], ARGV[4])
+local held = 0
+for i = 5, #ARGV do
+  if redis.call('HGET', KEYS[3], ARGV[i]) == ARGV[1] then
+    redis.call('ZADD', KEYS[2], ARGV[3], ARGV[i])
+    held = held + 1
+  end
+end
+return held
+"""
+
+_RELEASE = """
+local n = 0
+for i = 2, #ARGV do
+  if redis.call('HGET', KEYS[2], ARGV[i]) == ARGV[1] then
+    redis.call('ZADD', KEYS[1], 0, ARGV[i])
+    n = n + 1
+  end
+end
+return n
+"""
+
+_MOVE = """
+local n = 0
+while true do
+  local id = redis.call('LPOP', KEYS[1])
+  if not id then break end
+  redis.call('RPUSH', KEYS[2], id)
+  n = n + 1
+end
+return n
+"""
+
+
+class RedisBackend:
+    def __init__(self, host=REDIS_HOST, port=REDIS_PORT, prefix="nightowl", client=None):
+        if client is None:
+            import redis
+            client = redis.Redis(host=host, port=port, db=0)
+        self.redis = client
+        self.prefix = prefix
+        self._fetch = client.register_script(_FETCH)
+        self._ack = client.register_script(_ACK)
+        self._requeue = client.register_script(_REQUEUE)
+        self._heartbeat = client.register_script(_HEARTBEAT)
+        self._release = client.register_script(_RELEASE)
+        self._move = client.register_script(_MOVE)
+
+    def key(self, *parts):
+        return ":".join((self.prefix,) + parts)
+
+    def _core_keys(self):
+        return [self.key("leases"), self.key("owners"), self.key("tasks"), self.key("attempts")]
+
+    def push(self, queue, items):
+        pipe = self.redis.pipeline()
+        for task_id, data, solo in items:
+            pipe.hset(self.key("tasks"), task_id, data)
+            if solo:
+                pipe.hset(self.key("solo"), task_id, 1)
+        pipe.rpush(self.key(queue), *[task_id for task_id, _, _ in items])
+        pipe.execute()
+
+    def fetch(self, worker, queues, n, deadline):
+        keys = self._core_keys() + [self.key("solo")] + [self.key(q) for q in queues]
+        flat = self._fetch(keys=keys,
+                           args=[worker, n, deadline])
+        return [(_s(flat[i]), flat[i + 1], int(flat[i + 2])) for i in range(0, len(flat), 3)]
+
+    def ack(self, scan_id, task_id, worker, payload):
+        keys = self._core_keys() + [self.key("done", scan_id), self.key("results", scan_id), self.key("solo")]
+        return bool(self._ack(keys=keys, args=[task_id, worker, payload]))
+
+    def requeue_expired(self, now, max_attempts, queue="ready"):
+        flat = self._requeue(keys=self._core_keys() + [self.key(queue)], args=[now, max_attempts])
+        return [(_s(flat[i]), flat[i + 1]) for i in range(0, len(flat), 2)]
+
+    def heartbeat(self, worker, task_ids, now, deadline, info):
+        keys = [self.key("workers"), self.key("leases"), self.key("owners"), self.key("worker_info")]
+        return self._heartbeat(keys=keys, args=[worker, now, deadline, info, *task_ids])
+
+    def release(self, worker, task_ids):
+        """Expire the worker's leases on task_ids now; the next requeue_expired re-delivers them."""
+        if not task_ids:
+            return 0
+        return self._release(keys=[self.key("leases"), self.key("owners")], args=[worker, *task_ids])
+
+    def move_queue(self, src, dst):
+        return self._move(keys=[self.key(src), self.key(dst)])
+
+    def held_by(self, worker):
+        return [_s(t) for t, w in self.redis.hgetall(self.key("owners")).items() if _s(w) == worker]
+
+    def workers(self, since):
+        """Workers whose last heartbeat is newer than `since` -> (last beat, encoded info)."""
+        alive = self.redis.zrangebyscore(self.key("workers"), since, "+inf", withscores=True)
+        info = self.redis.hgetall(self.key("worker_info"))
+        return {_s(w): (score, info.get(w)) for w, score in alive}
+
+    def stale_workers(self, before):
+        return [_s(w) for w in self.redis.zrangebyscore(self.key("workers"), "-inf", before)]
+
+    def forget_worker(self, worker):
+        self.redis.zrem(self.key("workers"), worker)
+        self.redis.hdel(self.key("worker_info"), worker)
+
+    def read_results(self, scan_id, cursor, block=None, count=1000):
+        streams = self.redis.xread({self.key("results", scan_id): cursor}, count=count,
+                                   block=int(block * 1000) if block else None)
+        entries = []
+        for _, items in streams or []:
+            for entry_id, fields in items:
+                cursor = _s(entry_id)
+                entries.append((_s(fields[b"task"]), fields[b"data"]))
+        return entries, cursor
+
+    def drop_scan(self, scan_id):
+        self.redis.delete(self.key("done", scan_id), self.key("results", scan_id))
+
+    def pending(self, queue="ready"):
+        return self.redis.llen(self.key(queue))
+
+
+class MemoryBackend:
+    """
+    In-process stand-in for RedisBackend, with the same semantics. Use it
+    for tests and for single-machine runs with worker threads. Every
+    operation runs under one lock, just as the Lua scripts run atomically
+    in Redis.
+    """
+
+    def __init__(self, prefix="nightowl"):
+        self.prefix = prefix
+        self.cond = threading.Condition()
+        self.tasks, self.attempts, self.leases, self.owners = {}, {}, {}, {}
+        self.solo = set()
+        self.queues, self.done, self.results = {}, {}, {}
+        self.worker_beats, self.worker_info = {}, {}
+        self._seq = 0
+
+    def push(self, queue, items):
+        with self.cond:
+            for task_id, data, solo in items:
+                self.tasks[task_id] = data
+                if solo:
+                    self.solo.add(task_id)
+                self.queues.setdefault(queue, []).append(task_id)
+            self.cond.notify_all()
+
+    def fetch(self, worker, queues, n, deadline):
+        out = []
+        with self.cond:
+            for queue in queues:
+                pending = self.queues.get(queue, [])
+                while pending and len(out) < n:
+                    task_id = pending.pop(0)
+                    if task_id not in self.tasks:
+                        continue
+                    solo = task_id in self.solo
+                    if solo and out:
+                        pending.insert(0, task_id)
+                        return out
+                    self.leases[task_id] = deadline
+                    self.owners[task_id] = worker
+                    self.attempts[task_id] = self.attempts.get(task_id, 0) + 1
+                    out.append((task_id, self.tasks[task_id], self.attempts[task_id]))
+                    if solo:
+                        return out
+        return out
+
+    def ack(self, scan_id, task_id, worker, payload):
+        with self.cond:
+            done = self.done.setdefault(scan_id, {})
+            if task_id in done:
+                return False
+            done[task_id] = worker
+            for table in (self.leases, self.owners, self.tasks, self.attempts):
+                table.pop(task_id, None)
+            self.solo.discard(task_id)
+            self._seq += 1
+            self.results.setdefault(scan_id, []).append((f"{self._seq}-0", task_id, payload))
+            self.cond.notify_all()
+            return True
+
+    def requeue_expired(self, now, max_attempts, queue="ready"):
+        dead = []
+        with self.cond:
+            for task_id in [t for t, deadline in self.leases.items() if deadline <= now]:
+                del self.leases[task_id]
+                self.owners.pop(task_id, None)
+                if task_id not in self.tasks:
+                    continue
+                if self.attempts.get(task_id, 0) >= max_attempts:
+                    dead.append((task_id, self.tasks[task_id]))
+                else:
+                    self.queues.setdefault(queue, []).insert(0, task_id)
+            if self.queues.get(queue):
+                self.cond.notify_all()
+        return dead
+
+    def heartbeat(self, worker, task_ids, now, deadline, info):
+        held = 0
+        with self.cond:
+            self.worker_beats[worker] = now
+            self.worker_info[worker] = info
+            for task_id in task_ids:
+                if self.owners.get(task_id) == worker:
+                    self.leases[task_id] = deadline
+                    held += 1
+        return held
+
+    def release(self, worker, task_ids):
+        n = 0
+        with self.cond:
+            for task_id in task_ids:
+                if self.owners.get(task_id) == worker:
+                    self.leases[task_id] = 0
+                    n += 1
+        return n
+
+    def move_queue(self, src, dst):
+        with self.cond:
+            moved = self.queues.pop(src, [])
+            self.queues.setdefault(dst, []).extend(moved)
+            if moved:
+                self.cond.notify_all()
+            return len(moved)
+
+    def held_by(self, worker):
+        with self.cond:
+            return [t for t, w in self.owners.items() if w == worker]
+
+    def workers(self, since):
+        with self.cond:
+            return {w: (beat, self.worker_info.get(w)) for w, beat in self.worker_beats.items() if beat >= since}
+
+    def stale_workers(self, before):
+        with self.cond:
+            return [w for w, beat in self.worker_beats.items() if beat <= before]
+
+    def forget_worker(self, worker):
+        with self.cond:
+            self.worker_beats.pop(worker, None)
+            self.worker_info.pop(worker, None)
+
+    def read_results(self, scan_id, cursor, block=None, count=1000):
+        def after():
+            seq = int(cursor.split("-")[0])
+            return [e for e in self.results.get(scan_id, []) if int(e[0].split("-")[0]) > seq][:count]
+        with self.cond:
+            entries = after()
+            if not entries and block:
+                self.cond.wait_for(lambda: bool(after()), timeout=block)
+                entries = after()
+        if entries:
+            cursor = entries[-1][0]
+        return [(task_id, payload) for _, task_id, payload in entries], cursor
+
+    def drop_scan(self, scan_id):
+        with self.cond:
+            self.done.pop(scan_id, None)
+            self.results.pop(scan_id, None)
+
+    def pending(self, queue="ready"):
+        with self.cond:
+            return len(self.queues.get(queue, []))
+
+    def wait_for_work(self, queues, timeout):
+        with self.cond:
+            self.cond.wait_for(lambda: any(self.queues.get(q) for q in queues), timeout=timeout)
+
+
+_memory_backend = None
+
+def shared_memory_backend():
+    """The process-wide MemoryBackend used when QUEUE_CONFIG["backend"] is "memory"."""
+    global _memory_backend
+    if _memory_backend is None:
+        _memory_backend = MemoryBackend(QUEUE_CONFIG["prefix"])
+    return _memory_backend
+
+
+# ---------------------------------------------------------------------------
+# Queue API used by the orchestrator and the workers
+# ---------------------------------------------------------------------------
+
 class DistributedScanner:
-    def __init__(self, redis_host='localhost', redis_port=6379):
-        self.redis = redis.Redis(host=redis_host, port=redis_port, db=0)
-        self.task_queue = "nightowl_tasks"
-        self.result_queue = "nightowl_results"
-    
-    def enqueue_task(self, task_type, target, config=None):
-        task = {
+    """
+    Reliable task queue over Redis (or MemoryBackend).
+
+    A task is delivered to one worker at a time under a lease of
+    `lease_seconds`. The worker's heartbeat keeps renewing the lease while it
+    holds the task. If the worker dies, the lease runs out and
+    requeue_expired() puts the task back for another worker. After
+    `max_attempts` deliveries the task is answered with an error result
+    instead. Results go to a per-scan stream. Each task id is acked once;
+    later duplicates from a worker whose lease had expired are ignored.
+    """
+
+    def __init__(self, redis_host=REDIS_HOST, redis_port=REDIS_PORT, backend=None, codec=None,
+                 lease_seconds=None, max_attempts=None):
+        cfg = QUEUE_CONFIG
+        if backend is None:
+            backend = shared_memory_backend() if cfg["backend"] == "memory" else \
+                RedisBackend(redis_host, redis_port, prefix=cfg["prefix"])
+        self.backend = backend
+        self.codec = codec or cfg["codec"]
+        self.lease_seconds = lease_seconds or cfg["lease_seconds"]
+        self.max_attempts = max_attempts or cfg["max_attempts"]
+        self.worker_timeout = cfg["worker_timeout"]
+        self._last_reap = 0
+
+    # -- producer side -----------------------------------------------------
+
+    @staticmethod
+    def new_scan_id():
+        return f"scan-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def make_task(task_type, target, config=None, scan_id=None, worker_hint=None, solo=False):
+        """
+        A task dict for enqueue_many. A solo task is always leased on its own,
+        never as part of a batch. Use it for long work units, so one worker
+        does not sit on several of them while others are idle.
+        """
+        return {
+            "id": uuid.uuid4().hex,
+            "scan_id": scan_id or "default",
             "type": task_type,
             "target": target,
             "config": config or {},
+            "worker_hint": worker_hint,
+            "solo": solo,
             "timestamp": datetime.now().isoformat()
         }
-        self.redis.rpush(self.task_queue, pickle.dumps(task))
-        return True
-    
-    def get_task(self):
-        task_data = self.redis.blpop(self.task_queue, timeout=30)
-        if task_data:
-            return pickle.loads(task_data[1])
-        return None
-    
-    def send_result(self, task, result):
-        result_data = {
-            "task_id": task.get("timestamp"),
+
+    def enqueue_task(self, task_type, target, config=None, scan_id=None):
+        """Queue one task; returns its id."""
+        task = self.make_task(task_type, target, config, scan_id)
+        self.enqueue_many([task])
+        return task["id"]
+
+    def enqueue_many(self, tasks):
+        """Queue prepared tasks (make_task); a task with a worker_hint goes to that worker's queue first."""
+        by_queue = {}
+        for task in tasks:
+            queue = f"ready:{task['worker_hint']}" if task.get("worker_hint") else "ready"
+            by_queue.setdefault(queue, []).append((task["id"], encode(task, self.codec), task.get("solo", False)))
+        for queue, items in by_queue.items():
+            self.backend.push(queue, items)
+        return [task["id"] for task in tasks]
+
+    def get_results(self, scan_id, cursor="0", block=None):
+        """New results of a scan after `cursor` -> (list of result dicts, new cursor)."""
+        entries, cursor = self.backend.read_results(scan_id, cursor, block)
+        return [decode(payload) for _, payload in entries], cursor
+
+    def wait_for(self, scan_id, task_ids, timeout=None, on_result=None, poll=1.0):
+        """
+        Collect the results of `task_ids` and keep expired leases moving
+        while waiting. Returns {task_id: result}. Tasks without a result by
+        `timeout` are left out.
+        """
+        waiting = set(task_ids)
+        results = {}
+        cursor = "0"
+        deadline = time.time() + timeout if timeout else None
+        while waiting and (deadline is None or time.time() < deadline):
+            self.reap()
+            batch, cursor = self.get_results(scan_id, cursor, block=poll)
+            for result in batch:
+                if result["task_id"] in waiting:
+                    waiting.discard(result["task_id"])
+                    results[result["task_id"]] = result
+                    if on_result:
+                        on_result(result)
+        return results
+
+    def run_units(self, scan_id, task_type, units, configs=None, hint=None, timeout=None, on_result=None):
+        """
+        Fan `units` out as one task each and wait for all of them.
+
+        configs, if given, holds one task config per unit. hint(unit) may
+        name the worker that should preferably run a unit. Hints naming
+        workers that are not alive are dropped. Returns (task, result) pairs
+        in `units` order; result is None for a unit with no result by
+        `timeout`.
+        """
+        live = set(self.workers())
+        configs = configs or [None] * len(units)
+        tasks = []
+        for unit, config in zip(units, configs):
+            worker = hint(unit) if hint else None
+            tasks.append(self.make_task(task_type, unit, config, scan_id, worker if worker in live else None, solo=True))
+        self.enqueue_many(tasks)
+        results = self.wait_for(scan_id, [task["id"] for task in tasks], timeout, on_result)
+        return [(task, results.get(task["id"])) for task in tasks]
+
+    @staticmethod
+    def chunked(items, size):
+        items = list(items)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def close_scan(self, scan_id):
+        self.backend.drop_scan(scan_id)
+
+    # -- worker side -------------------------------------------------------
+
+    def get_tasks(self, worker_id, max_tasks=None, timeout=30):
+        """
+        Lease up to `max_tasks` tasks: first those hinted to this worker, then
+        shared ones, and only when both are empty, tasks hinted to other
+        live workers (work stealing, so one busy worker does not hold up the
+        scan). Waits up to `timeout` seconds for work and returns [] when
+        there is none.
+        """
+        max_tasks = max_tasks or QUEUE_CONFIG["batch_size"]
+        queues = [f"ready:{worker_id}", "ready"]
+        end = time.time() + timeout
+        delay = 0.05
+        while True:
+            self.reap()
+            deadline = time.time() + self.lease_seconds
+            leased = self.backend.fetch(worker_id, queues, max_tasks, deadline)
+            others = [f"ready:{w}" for w in self.workers() if w != worker_id]
+            if not leased and others:
+                leased = self.backend.fetch(worker_id, others, max_tasks, deadline)
+            if leased or time.time() >= end:
+                break
+            if isinstance(self.backend, MemoryBackend):
+                self.backend.wait_for_work(queues + others, min(1.0, end - time.time()))
+            else:
+                time.sleep(min(delay, max(0, end - time.time())))
+                delay = min(delay * 2, 1.0)
+        tasks = []
+        for task_id, data, attempts in leased:
+            task = decode(data)
+            task["attempts"] = attempts
+            tasks.append(task)
+        return tasks
+
+    def get_task(self, worker_id="worker", timeout=30):
+        tasks = self.get_tasks(worker_id, max_tasks=1, timeout=timeout)
+        return tasks[0] if tasks else None
+
+    def send_result(self, task, result, worker_id="worker"):
+        """Ack a task with its result. Returns False if it was already answered."""
+        payload = {
+            "task_id": task["id"],
+            "scan_id": task["scan_id"],
+            "type": task["type"],
+            "target": task["target"],
+            "worker": worker_id,
+            "attempts": task.get("attempts", 1),
             "result": result,
             "timestamp": datetime.now().isoformat()
         }
-        self.redis.rpush(self.result_queue, pickle.dumps(result_data))
-    
-    def get_results(self, task_id):
-        results = []
-        while True:
-            result_data = self.redis.lpop(self.result_queue)
-            if not result_data:
-                break
-            result = pickle.loads(result_data)
-            if result["task_id"] == task_id:
-                results.append(result)
-        return results
\ No newline at end of file
+        return self.backend.ack(task["scan_id"], task["id"], worker_id, encode(payload, self.codec))
+
+    def release(self, worker_id, tasks):
+        """Give leased tasks back for immediate re-delivery (e.g. on shutdown)."""
+        self.backend.release(worker_id, [t["id"] for t in tasks])
+        self.reap(force=True)
+
+    def heartbeat(self, worker_id, tasks=(), info=None):
+        """Mark the worker alive and extend its leases on `tasks`."""
+        now = time.time()
+        return self.backend.heartbeat(worker_id, [t["id"] for t in tasks], now, now + self.lease_seconds,
+                                      encode(info or {}, self.codec))
+
+    def workers(self):
+        """Live workers -> their last heartbeat info."""
+        since = time.time() - self.worker_timeout
+        return {w: {**(decode(info) if info else {}), "last_seen": beat}
+                for w, (beat, info) in self.backend.workers(since).items()}
+
+    # -- housekeeping ------------------------------------------------------
+
+    def reap(self, force=False):
+        """
+        Re-deliver tasks whose lease ran out, answering those out of attempts
+        with an error result. Tasks held by workers that stopped
+        heartbeating are released at once rather than waiting out the lease.
+        Runs at most once a second unless forced.
+        """
+        now = time.time()
+        if not force and now - self._last_reap < 1.0:
+            return
+        self._last_reap = now
+        for worker in self.backend.stale_workers(now - self.worker_timeout):
+            self.backend.release(worker, self.backend.held_by(worker))
+            self.backend.move_queue(f"ready:{worker}", "ready")
+            self.backend.forget_worker(worker)
+        for task_id, data in self.backend.requeue_expired(now, self.max_attempts):
+            task = decode(data)
+            task["attempts"] = self.max_attempts
+            self.send_result(task, {"status": "error", "error": f"gave up after {self.max_attempts} attempts"},
+                             worker_id="reaper")
+
+
+class Heartbeat:
+    """Background thread renewing a worker's heartbeat and the leases of what it is processing."""
+
+    def __init__(self, scanner, worker_id, info=None, interval=None):
+        self.scanner = scanner
+        self.worker_id = worker_id
+        self.info = info or {"host": socket.gethostname(), "pid": os.getpid()}
+        self.interval = interval or QUEUE_CONFIG["heartbeat_interval"]
+        self.tasks = []
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.beat()
+        self.thread.start()
+        return self
+
+    def hold(self, tasks):
+        with self.lock:
+            self.tasks = list(tasks)
+
+    def done(self, task):
+        with self.lock:
+            self.tasks = [t for t in self.tasks if t["id"] != task["id"]]
+
+    def beat(self):
+        with self.lock:
+            tasks = list(self.tasks)
+        self.scanner.heartbeat(self.worker_id, tasks, self.info)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.beat()
+            except Exception as e:
+                print(f"[!] Heartbeat failed: {e}")
+
+    def stop(self):
+        self.stopped.set()
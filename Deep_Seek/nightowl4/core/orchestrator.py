@@ -4,8 +4,8 @@ import json
 import shutil
 import subprocess
 import time
-import redis
-import pickle
+import threading
+from collections import Counter
 import requests  # Add missing import
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -16,8 +16,12 @@ from .error_handler import ErrorHandler
 from .report_generator import generate_html_report, generate_pdf_report
 from .ml_analyzer import MLVulnerabilityAnalyzer
 from .distributed import DistributedScanner
+from config.settings import FANOUT_CONFIG, FFUF_CONFIG
 
 class NightOwlOrchestrator:
+    # tools that pass findings to on_findings themselves while they run
+    STREAMING_TOOLS = {"ffuf"}
+    
     TOOL_BINARIES = {
         "amass": "amass",
         "assetfinder": "assetfinder",
@@ -61,7 +65,10 @@ class NightOwlOrchestrator:
         self.error_handler = ErrorHandler()
         self.utils = utils.NightOwlUtils()
         self.ml_analyzer = MLVulnerabilityAnalyzer()
-        self.distributed_scanner = DistributedScanner()
+        self.distributed_scanner = DistributedScanner() if distributed else None
+        self.scan_id = DistributedScanner.new_scan_id() if distributed else None
+        self.on_findings = None
+        self.on_phase = None
         
         self.tool_map = {
             "subdomain": {
@@ -132,11 +139,31 @@ class NightOwlOrchestrator:
         ]
         
         for idx, phase in enumerate(phases):
+            if self.on_phase:
+                self.on_phase(phase["name"])
             self.dashboard.start_phase(idx)
             await phase["func"](phase["tools"])
             self.dashboard.complete_phase(idx)
             StateManager.save_state(self.target, self.state)
     
+    def emit_findings(self, phase, tool, items):
+        """Pass a tool's results to on_findings (if set) as a list of strings, as soon as the tool finishes."""
+        if not self.on_findings or not items:
+            return
+        if isinstance(items, str):
+            if items.startswith("Error"):
+                return
+            items = items.splitlines()
+        elif isinstance(items, dict):
+            items = [json.dumps(items, default=str)]
+        items = [item if isinstance(item, str) else json.dumps(item, default=str) for item in items]
+        items = [item.strip() for item in items if item and item.strip()]
+        if items:
+            try:
+                self.on_findings(phase, tool, items)
+            except Exception as e:
+                self.error_handler.log_error(tool, f"findings listener failed: {e}", self.target)
+    
     def get_tools(self, category):
         if self.mode == "light":
             return ["assetfinder", "sublist3r", "crt_sh"]
@@ -166,18 +193,29 @@ class NightOwlOrchestrator:
     
     async def run_subdomain_tools(self, tools):
         all_subdomains = []
+        remote = [t for t in tools if t in FANOUT_CONFIG["subdomain_tools"]] if self.distributed else []
+        remote_run = asyncio.create_task(asyncio.to_thread(
+            self.distribute, "subdomain_tool", [self.target] * len(remote),
+            configs=[{"tool": tool} for tool in remote])) if remote else None
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(self.tool_map["subdomain"][tool]): tool for tool in tools}
+            futures = {executor.submit(self.tool_map["subdomain"][tool]): tool for tool in tools if tool not in remote}
             for future in as_completed(futures):
                 tool = futures[future]
                 try:
                     result = future.result()
                     if result:
                         all_subdomains.extend(result)
+                        self.emit_findings("subdomains", tool, result)
                         self.dashboard.complete_tool(tool, f"Found {len(result)} subdomains")
                 except Exception as e:
                     self.error_handler.log_error(tool, str(e), self.target)
                     self.dashboard.tool_error(tool, str(e))
+        if remote_run:
+            for tool, (_, _, found) in zip(remote, await remote_run):
+                if found is not None:
+                    all_subdomains.extend(found)
+                    self.emit_findings("subdomains", tool, found)
+                    self.dashboard.complete_tool(tool, f"Found {len(found)} subdomains")
         
         all_subdomains = list(set(all_subdomains))
         with open(f"{self.output_dir}/subdomains/all.txt", "w") as f:
@@ -192,10 +230,14 @@ class NightOwlOrchestrator:
             return []
         
         self.dashboard.show_info("Checking live hosts...")
-        live_urls = self.utils.check_alive(self.state["subdomains"], f"{self.output_dir}/live_hosts")
+        if self.distributed:
+            live_urls = await asyncio.to_thread(self.probe_distributed, self.state["subdomains"])
+        else:
+            live_urls = await self.utils.check_alive_async(self.state["subdomains"], f"{self.output_dir}/live_hosts")
         
         important = self.utils.get_important_domains(live_urls, f"{self.output_dir}/live_hosts")
         self.state["live_urls"] = live_urls
+        self.emit_findings("live_hosts", "check_alive", live_urls)
         self.dashboard.show_info(f"Found {len(live_urls)} live hosts ({len(important)} important)")
         return live_urls
     
@@ -209,6 +251,7 @@ class NightOwlOrchestrator:
             try:
                 self.dashboard.start_tool(tool, f"Running network scan")
                 results[tool] = self.tool_map["network"][tool]()
+                self.emit_findings("network", tool, results[tool])
                 self.dashboard.complete_tool(tool, f"Completed network scan")
             except Exception as e:
                 self.error_handler.log_error(tool, str(e), self.target)
@@ -225,7 +268,14 @@ class NightOwlOrchestrator:
         for tool in tools:
             try:
                 self.dashboard.start_tool(tool, f"Running content discovery")
+                if self.distributed and tool == "gospider":
+                    results[tool] = await asyncio.to_thread(self.run_gospider_distributed)
+                    self.emit_findings("content", tool, results[tool])
+                    self.dashboard.complete_tool(tool, f"Completed content discovery")
+                    continue
                 results[tool] = self.tool_map["content"][tool]()
+                if tool not in self.STREAMING_TOOLS:
+                    self.emit_findings("content", tool, results[tool])
                 self.dashboard.complete_tool(tool, f"Completed content discovery")
             except Exception as e:
                 self.error_handler.log_error(tool, str(e), self.target)
@@ -243,6 +293,7 @@ class NightOwlOrchestrator:
             try:
                 self.dashboard.start_tool(tool, f"Extracting information")
                 results[tool] = self.tool_map["info"][tool]()
+                self.emit_findings("info", tool, results[tool])
                 self.dashboard.complete_tool(tool, f"Extracted {len(results[tool])} items")
             except Exception as e:
                 self.error_handler.log_error(tool, str(e), self.target)
@@ -269,7 +320,11 @@ class NightOwlOrchestrator:
         for tool in tools:
             try:
                 self.dashboard.start_tool(tool, f"Scanning for vulnerabilities")
-                vulns[tool] = self.tool_map["vuln"][tool]()
+                if self.distributed and tool == "nuclei":
+                    vulns[tool] = await asyncio.to_thread(self.run_nuclei_distributed)
+                else:
+                    vulns[tool] = self.tool_map["vuln"][tool]()
+                self.emit_findings("vulns", tool, vulns[tool])
                 self.dashboard.complete_tool(tool, f"Found {len(vulns[tool])} vulnerabilities")
                 
                 if vulns[tool]:
@@ -291,6 +346,7 @@ class NightOwlOrchestrator:
             try:
                 self.dashboard.start_tool(tool, f"Analyzing mobile application")
                 results[tool] = self.tool_map["mobile"][tool]()
+                self.emit_findings("mobile", tool, results[tool])
                 self.dashboard.complete_tool(tool, f"Completed mobile analysis")
             except Exception as e:
                 self.error_handler.log_error(tool, str(e), self.target)
@@ -298,6 +354,78 @@ class NightOwlOrchestrator:
         
         self.state["mobile"] = results
     
+    def distribute(self, task_type, units, configs=None, hint=None):
+        """
+        Run work units on the connected workers and wait for all of them.
+        Returns (unit, worker, result) per unit in order; result is None for
+        units that failed or timed out (their errors are logged).
+        """
+        scanner = self.distributed_scanner
+        workers = scanner.workers()
+        if not workers:
+            self.dashboard.show_warning(f"No workers connected; {len(units)} {task_type} tasks wait for one")
+        self.dashboard.show_info(f"Distributing {len(units)} {task_type} tasks across {len(workers)} workers")
+        results = scanner.run_units(self.scan_id, task_type, units, configs, hint, FANOUT_CONFIG["timeout"])
+        merged = []
+        for task, payload in results:
+            if payload is None:
+                self.error_handler.log_error(task_type, "no result before timeout", str(task["target"])[:200])
+                merged.append((task["target"], None, None))
+            elif payload["result"].get("status") != "success":
+                self.error_handler.log_error(task_type, payload["result"].get("error"), str(task["target"])[:200])
+                merged.append((task["target"], payload["worker"], None))
+            else:
+                merged.append((task["target"], payload["worker"], payload["result"]["result"] or []))
+        return merged
+
+    def probe_distributed(self, subdomains):
+        """
+        Probe liveness in chunks across workers. The worker that found a
+        host alive is remembered in state["host_workers"], so later units on
+        that host go to the same worker.
+        """
+        chunks = DistributedScanner.chunked(subdomains, FANOUT_CONFIG["probe_chunk"])
+        live_urls = []
+        host_workers = {}
+        for _, worker, alive in self.distribute("probe_hosts", chunks):
+            for url in alive or []:
+                live_urls.append(url)
+                host_workers[url] = worker
+        self.state["host_workers"] = host_workers
+        with open(f"{self.output_dir}/live_hosts/alive.txt", "w") as f:
+            f.write("\n".join(live_urls))
+        return live_urls
+
+    def _by_worker(self, urls):
+        """URLs grouped by the worker that probed them, so a chunk stays on one worker."""
+        host_workers = self.state.get("host_workers", {})
+        groups = {}
+        for url in urls:
+            groups.setdefault(host_workers.get(url), []).append(url)
+        return groups
+
+    def run_nuclei_distributed(self):
+        chunks = []
+        for urls in self._by_worker(self.state["live_urls"]).values():
+            chunks.extend(DistributedScanner.chunked(urls, FANOUT_CONFIG["nuclei_chunk"]))
+        host_workers = self.state.get("host_workers", {})
+        findings = []
+        for _, _, found in self.distribute("nuclei_chunk", chunks, hint=lambda chunk: host_workers.get(chunk[0])):
+            findings.extend(found or [])
+        with open(f"{self.output_dir}/vulns/nuclei.txt", "w") as f:
+            f.write("\n".join(findings))
+        return findings
+
+    def run_gospider_distributed(self):
+        host_workers = self.state.get("host_workers", {})
+        urls = []
+        for _, _, found in self.distribute("content_discovery", self.state["live_urls"], hint=host_workers.get):
+            urls.extend(found or [])
+        urls = list(dict.fromkeys(urls))
+        with open(f"{self.output_dir}/content/gospider.txt", "w") as f:
+            f.write("\n".join(urls))
+        return urls
+
     async def generate_reports(self, tools):
         self.dashboard.show_info("Analyzing results and generating reports...")
         
@@ -480,23 +608,66 @@ class NightOwlOrchestrator:
         return self.utils.run_command(cmd, verbose=self.verbose, output_file=output_file)
     
     def run_ffuf(self):
-        wordlist = "config/wordlists/directories.txt"
-        output_file = f"{self.output_dir}/content/ffuf.txt"
-        results = []
-        
-        for url in self.state["live_urls"]:
-            cmd = f"ffuf -w {wordlist} -u {url}/FUZZ -o {output_file} -of json"
-            result = self.utils.run_command(cmd, verbose=self.verbose)
-            if result:
+        """
+        ffuf against every live URL, FFUF_CONFIG["parallel_hosts"] hosts at a
+        time. The FFUF_CONFIG["rate"] request budget is split evenly between
+        them. Each host gets its own JSON output under content/ffuf/ and its
+        own -ac auto-calibration against wildcard responses. Hits go into
+        state["ffuf"] and to on_findings as each host finishes. With
+        --resume, hosts that already have an output file are not fuzzed
+        again.
+        """
+        cfg = FFUF_CONFIG
+        out_dir = f"{self.output_dir}/content/ffuf"
+        os.makedirs(out_dir, exist_ok=True)
+        urls = list(dict.fromkeys(self.state["live_urls"]))
+        parallel = max(1, min(cfg["parallel_hosts"], len(urls)))
+        rate = max(1, cfg["rate"] // parallel)
+        found = {}
+        lock = threading.Lock()
+        
+        def fuzz(url):
+            output_file = f"{out_dir}/{urlparse(url).netloc.replace(':', '_')}.json"
+            if not (self.resume and os.path.exists(output_file)):
+                cmd = (f"ffuf -w {cfg['wordlist']} -u {url}/FUZZ -o {output_file} -of json -s -ac "
+                       f"-rate {rate} -t {cfg['threads']} -maxtime {cfg['max_time']} {cfg['args']}")
+                self.utils.run_command(cmd, timeout=cfg["max_time"] + 60, verbose=self.verbose)
+            hits = self.parse_ffuf(output_file)
+            with lock:
+                found[url] = hits
+                self.state.setdefault("ffuf", {})[url] = hits
+            self.emit_findings("content", "ffuf", hits)
+        
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            futures = {executor.submit(fuzz, url): url for url in urls}
+            for done, future in enumerate(as_completed(futures), 1):
                 try:
-                    data = json.loads(result)
-                    for item in data.get("results", []):
-                        results.append(f"{url}{item['url']}")
-                except:
-                    continue
+                    future.result()
+                except Exception as e:
+                    self.error_handler.log_error("ffuf", str(e), futures[future])
+                self.dashboard.update_progress("ffuf", done * 100 // len(urls))
         
+        results = [hit for url in urls for hit in found.get(url, [])]
+        with open(f"{self.output_dir}/content/ffuf.txt", "w") as f:
+            f.write("\n".join(results))
         return results
     
+    @staticmethod
+    def parse_ffuf(output_file, wildcard_threshold=FFUF_CONFIG["wildcard_threshold"]):
+        """
+        URLs from an ffuf JSON output file. A response signature (status,
+        length, words) that repeats wildcard_threshold times or more is
+        catch-all noise that -ac did not catch, and is dropped.
+        """
+        try:
+            with open(output_file, "r") as f:
+                items = json.load(f).get("results", [])
+        except (OSError, ValueError):
+            return []
+        signatures = Counter((i.get("status"), i.get("length"), i.get("words")) for i in items)
+        return [i["url"] for i in items
+                if signatures[(i.get("status"), i.get("length"), i.get("words"))] < wildcard_threshold]
+    
     def run_gospider(self):
         input_file = f"{self.output_dir}/live_hosts/urls.txt"
         with open(input_file, "w") as f:
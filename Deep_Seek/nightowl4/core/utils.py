@@ -4,8 +4,12 @@ import json
 import yaml
 import requests
 import socket
+import ssl
+import asyncio
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+from config.settings import ALIVE_CHECK
 
 class NightOwlUtils:
     @staticmethod
@@ -26,24 +30,118 @@ class NightOwlUtils:
             }
     
     @staticmethod
-    def check_alive(domains, output_dir=None):
-        alive = []
-        for domain in domains:
+    def check_alive(domains, output_dir=None, **options):
+        """
+        Blocking form of check_alive_async(). It can be called whether or not an
+        event loop is running in this thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(NightOwlUtils.check_alive_async(domains, output_dir, **options))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, NightOwlUtils.check_alive_async(domains, output_dir, **options)).result()
+    
+    @staticmethod
+    async def check_alive_async(domains, output_dir=None, concurrency=None, timeout=None, verify_http=None):
+        """
+        Probe ports 80 and 443 of every domain concurrently. Returns
+        "http://<domain>" when port 80 answers, otherwise "https://<domain>"
+        when 443 does, in input order, like the old serial check.
+
+        Each host is resolved once for both ports. Its first IPv4 and first
+        IPv6 address are tried in that order, so dual-stack hosts are not
+        lost to a dead IPv6 route. At most `concurrency` connections are in
+        flight. With verify_http, a port counts only if a
+        HEAD / gets an HTTP status line back (TLS on 443). Live hosts are
+        appended to <output_dir>/alive.txt as they are found, in the order
+        they are found.
+        """
+        concurrency = concurrency or ALIVE_CHECK["concurrency"]
+        timeout = timeout or ALIVE_CHECK["timeout"]
+        verify_http = ALIVE_CHECK["verify_http"] if verify_http is None else verify_http
+        loop = asyncio.get_running_loop()
+        dns_pool = ThreadPoolExecutor(max_workers=ALIVE_CHECK["dns_workers"])
+        tls = ssl.create_default_context()
+        tls.check_hostname = False
+        tls.verify_mode = ssl.CERT_NONE
+        alive = {}
+        queue = asyncio.Queue()
+        for domain in dict.fromkeys(domains):
+            queue.put_nowait(domain)
+        out = open(f"{output_dir}/alive.txt", "w") if output_dir else None
+
+        async def probe(domain, addrs, port):
+            for addr in addrs:
+                if await connect(domain, addr, port):
+                    return True
+            return False
+
+        async def connect(domain, addr, port):
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(
+                    addr, port,
+                    ssl=tls if verify_http and port == 443 else None,
+                    server_hostname=domain if verify_http and port == 443 else None
+                ), timeout)
+            except (OSError, asyncio.TimeoutError, ssl.SSLError):
+                return False
             try:
-                socket.create_connection((domain, 80), timeout=2)
-                alive.append(f"http://{domain}")
-            except:
+                if not verify_http:
+                    return True
+                writer.write(f"HEAD / HTTP/1.1\r\nHost: {domain}\r\nConnection: close\r\n\r\n".encode())
+                await writer.drain()
+                status = await asyncio.wait_for(reader.readline(), timeout)
+                return status.startswith(b"HTTP/")
+            except (OSError, asyncio.TimeoutError, ssl.SSLError):
+                return False
+            finally:
+                writer.close()
                 try:
-                    socket.create_connection((domain, 443), timeout=2)
-                    alive.append(f"https://{domain}")
-                except:
-                    continue
-        
-        if output_dir:
-            with open(f"{output_dir}/alive.txt", "w") as f:
-                f.write("\n".join(alive))
-        
-        return alive
+                    await asyncio.wait_for(writer.wait_closed(), timeout)
+                except (OSError, asyncio.TimeoutError, ssl.SSLError):
+                    pass
+
+        async def check(domain):
+            try:
+                infos = await loop.run_in_executor(dns_pool, socket.getaddrinfo, domain, None, 0, socket.SOCK_STREAM)
+            except (OSError, UnicodeError):
+                return None
+            first = {}
+            for family, _, _, _, sockaddr in infos:
+                first.setdefault(family, sockaddr[0])
+            addrs = [first[f] for f in sorted(first, key=lambda f: f != socket.AF_INET)]
+            http = asyncio.ensure_future(probe(domain, addrs, 80))
+            https = asyncio.ensure_future(probe(domain, addrs, 443))
+            if await http:
+                https.cancel()
+                await asyncio.gather(https, return_exceptions=True)
+                return f"http://{domain}"
+            if await https:
+                return f"https://{domain}"
+            return None
+
+        async def worker():
+            # each worker keeps at most two connections open, one per port
+            while True:
+                try:
+                    domain = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                url = await check(domain)
+                if url:
+                    alive[domain] = url
+                    if out:
+                        out.write(url + "\n")
+                        out.flush()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency // 2, queue.qsize())))))
+        finally:
+            dns_pool.shutdown(wait=False, cancel_futures=True)
+            if out:
+                out.close()
+        return [alive[d] for d in domains if d in alive]
     
     @staticmethod
     def get_important_domains(domains, output_dir=None):
@@ -1,74 +1,113 @@
-import time
 import os
-import json
-import requests
-from core.distributed import DistributedScanner
+import socket
+import tempfile
+from core.distributed import DistributedScanner, Heartbeat
 from core.utils import NightOwlUtils
 
 utils = NightOwlUtils()
 
-def worker_process():
-    scanner = DistributedScanner()
-    print("[*] NightOwl worker started. Waiting for tasks...")
-    
-    while True:
-        task = scanner.get_task()
-        if not task:
-            time.sleep(5)
-            continue
-        
-        print(f"[*] Processing {task['type']} task for {task['target']}")
-        
-        result = None
-        try:
-            if task["type"] == "subdomain_enum":
-                result = run_subdomain_enum(task["target"])
-            elif task["type"] == "vuln_scan":
-                result = run_vuln_scan(task["target"])
-            elif task["type"] == "content_discovery":
-                result = run_content_discovery(task["target"])
-            
-            scanner.send_result(task, {"status": "success", "result": result})
-            print(f"[+] Task completed: {task['type']} for {task['target']}")
-        except Exception as e:
-            scanner.send_result(task, {"status": "error", "error": str(e)})
-            print(f"[!] Task failed: {task['type']} for {task['target']}: {str(e)}")
+def worker_process(worker_id=None, scanner=None, max_tasks=None, stop=None):
+    """
+    Lease tasks in batches (fan-out units one at a time, see make_task)
+    and run them one after another. A heartbeat
+    thread renews the leases while the batch is worked through. If this
+    worker dies, its tasks go back to the queue when the leases run out.
+    """
+    scanner = scanner or DistributedScanner()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    heartbeat = Heartbeat(scanner, worker_id).start()
+    print(f"[*] NightOwl worker {worker_id} started. Waiting for tasks...")
 
-def run_subdomain_enum(target):
-    tools = ["amass", "subfinder", "assetfinder"]
+    try:
+        while not (stop and stop.is_set()):
+            tasks = scanner.get_tasks(worker_id, max_tasks=max_tasks, timeout=5)
+            if not tasks:
+                continue
+            heartbeat.hold(tasks)
+            for i, task in enumerate(tasks):
+                if stop and stop.is_set():
+                    scanner.release(worker_id, tasks[i:])
+                    break
+                process_task(scanner, worker_id, task)
+                heartbeat.done(task)
+    finally:
+        heartbeat.stop()
+
+def process_task(scanner, worker_id, task):
+    target = task["target"] if isinstance(task["target"], str) else f"{len(task['target'])} hosts"
+    print(f"[*] Processing {task['type']} task for {target}")
+    handler = TASK_HANDLERS.get(task["type"])
+    try:
+        if handler is None:
+            raise ValueError(f"unknown task type {task['type']}")
+        result = handler(task["target"], task.get("config"))
+        scanner.send_result(task, {"status": "success", "result": result}, worker_id)
+        print(f"[+] Task completed: {task['type']} for {target}")
+    except Exception as e:
+        scanner.send_result(task, {"status": "error", "error": str(e)}, worker_id)
+        print(f"[!] Task failed: {task['type']} for {target}: {str(e)}")
+
+SUBDOMAIN_COMMANDS = {
+    "amass": "amass enum -passive -d {target} -o /dev/stdout",
+    "subfinder": "subfinder -d {target} -silent",
+    "assetfinder": "assetfinder -subs-only {target}",
+    "findomain": "findomain -t {target} --quiet"
+}
+
+def _lines(output):
+    if not output or output.startswith("Error"):
+        return []
+    return [line.strip() for line in output.splitlines() if line.strip()]
+
+def run_subdomain_enum(target, config=None):
     results = []
-    for tool in tools:
-        if tool == "amass":
-            cmd = f"amass enum -passive -d {target} -o /dev/stdout"
-        elif tool == "subfinder":
-            cmd = f"subfinder -d {target} -silent"
-        elif tool == "assetfinder":
-            cmd = f"assetfinder -subs-only {target}"
-        
-        result = utils.run_command(cmd)
-        if result and not result.startswith("Error"):
-            results.extend(result.splitlines())
-    
+    for tool in ["amass", "subfinder", "assetfinder"]:
+        results.extend(run_subdomain_tool(target, {"tool": tool}))
     return list(set(results))
 
-def run_vuln_scan(target):
+def run_subdomain_tool(target, config=None):
+    """One enumeration tool for one domain (a unit of the subdomain phase)."""
+    cmd = SUBDOMAIN_COMMANDS[config["tool"]].format(target=target)
+    return _lines(utils.run_command(cmd))
+
+def run_probe_hosts(hosts, config=None):
+    """Liveness of a chunk of hosts. The orchestrator sends later work on these hosts back to this worker."""
+    return utils.check_alive(hosts)
+
+def run_vuln_scan(target, config=None):
     cmd = f"nuclei -u {target} -severity medium,high,critical -silent"
-    result = utils.run_command(cmd)
-    return result.splitlines() if result else []
+    return _lines(utils.run_command(cmd))
 
-def run_content_discovery(target):
-    cmd = f"gospider -s https://{target} -d 2 -t 50 -c 5 --other-source --subs -o output"
-    utils.run_command(cmd)
-    
-    # Process output files
+def run_nuclei_chunk(urls, config=None):
+    """nuclei over a chunk of live URLs."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(urls) + "\n")
+    try:
+        cmd = f"nuclei -l {f.name} -severity medium,high,critical -silent"
+        return _lines(utils.run_command(cmd, timeout=(config or {}).get("timeout", 1800)))
+    finally:
+        os.unlink(f.name)
+
+def run_content_discovery(target, config=None):
+    """gospider on one host, in a scratch directory of its own so concurrent tasks do not mix output."""
+    url = target if target.startswith("http") else f"https://{target}"
     results = []
-    if os.path.exists("output"):
-        for file in os.listdir("output"):
-            if file.endswith(".txt"):
-                with open(os.path.join("output", file), "r") as f:
-                    results.extend(f.readlines())
-    
+    with tempfile.TemporaryDirectory(prefix="nightowl-gospider-") as outdir:
+        cmd = f"gospider -s {url} -d 2 -t 50 -c 5 --other-source --subs -o {outdir}"
+        utils.run_command(cmd)
+        for file in os.listdir(outdir):
+            with open(os.path.join(outdir, file), "r") as f:
+                results.extend(line.strip() for line in f if line.strip())
     return results
 
+TASK_HANDLERS = {
+    "subdomain_enum": run_subdomain_enum,
+    "subdomain_tool": run_subdomain_tool,
+    "probe_hosts": run_probe_hosts,
+    "vuln_scan": run_vuln_scan,
+    "nuclei_chunk": run_nuclei_chunk,
+    "content_discovery": run_content_discovery
+}
+
 if __name__ == "__main__":
     worker_process()
\ No newline at end of file
@@ -10,7 +10,9 @@ import random
 import argparse
 import subprocess
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import partial
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from rich.table import Table
@@ -81,8 +83,8 @@ class ResourceMonitor:
 class ProgressTracker:
     def __init__(self):
         self.start_time = time.time()
-        self.current_target = None
-        self.module_progress = {}
+        self.active_targets = {}
+        self.target_tasks = {}
         self.errors = []
         self.resource_monitor = ResourceMonitor()
         self.target_count = 0
@@ -108,16 +110,14 @@ class ProgressTracker:
         self._update_display()
     
     def start_target(self, target):
-        self.current_target = target
-        self.completed_targets += 1
-        self.target_task = self.progress.add_task(
+        self.active_targets[target] = {}
+        self.target_tasks[target] = self.progress.add_task(
             f"[green]Processing {target}", total=100
         )
-        self.module_progress = {}
         self._update_display()
     
-    def start_module(self, module_name):
-        self.module_progress[module_name] = {
+    def start_module(self, target, module_name):
+        self.active_targets[target][module_name] = {
             'start_time': time.time(),
             'progress': 0,
             'completed': False,
@@ -125,17 +125,19 @@ class ProgressTracker:
         }
         self._update_display()
     
-    def update_module(self, module_name, progress):
-        if module_name in self.module_progress:
-            self.module_progress[module_name]['progress'] = progress
+    def update_module(self, target, module_name, progress):
+        modules = self.active_targets.get(target, {})
+        if module_name in modules:
+            modules[module_name]['progress'] = progress
             self._update_display()
     
-    def complete_module(self, module_name, result_count=None):
-        if module_name in self.module_progress:
-            self.module_progress[module_name]['progress'] = 100
-            self.module_progress[module_name]['completed'] = True
+    def complete_module(self, target, module_name, result_count=None):
+        modules = self.active_targets.get(target, {})
+        if module_name in modules:
+            modules[module_name]['progress'] = 100
+            modules[module_name]['completed'] = True
             if result_count is not None:
-                self.module_progress[module_name]['results'] = result_count
+                modules[module_name]['results'] = result_count
             self._update_display()
     
     def add_error(self, error_message):
@@ -155,18 +157,22 @@ class ProgressTracker:
         )
     
     def _build_scan_status(self):
-        status = f"Targets: [bold]{self.completed_targets}/{self.target_count}[/bold] completed\n"
-        
-        if self.current_target:
-            status += f"\nCurrent: [bold]{self.current_target}[/bold]\n"
-            for module, data in self.module_progress.items():
-                status += f"\n[cyan]{module.capitalize()}:[/cyan] "
-                if data.get('completed'):
-                    status += "[green]✓ Completed[/green]"
-                    if data['results'] > 0:
-                        status += f" ([yellow]{data['results']}[/yellow] results)"
-                else:
-                    status += f"[yellow]{data['progress']}%[/yellow]"
+        status = f"Targets: [bold]{self.completed_targets}/{self.target_count}[/bold] completed"
+        status += f", [bold]{len(self.active_targets)}[/bold] in progress\n"
+        
+        # Only the oldest few active targets fit in the panel
+        for target, modules in list(self.active_targets.items())[:6]:
+            status += f"\n[bold]{target}[/bold] "
+            if not modules:
+                continue
+            module, data = list(modules.items())[-1]
+            status += f"[cyan]{module.capitalize()}:[/cyan] "
+            if data.get('completed'):
+                status += "[green]✓ Completed[/green]"
+                if data['results'] > 0:
+                    status += f" ([yellow]{data['results']}[/yellow] results)"
+            else:
+                status += f"[yellow]{data['progress']}%[/yellow]"
         
         if self.errors:
             status += "\n\n[red]Errors:[/red]"
@@ -197,7 +203,10 @@ class ProgressTracker:
         self.live.update(grid)
     
     def complete_target(self, target):
-        self.progress.update(self.target_task, completed=100)
+        self.progress.update(self.target_tasks.pop(target), completed=100)
+        self.progress.advance(self.scan_task)
+        self.active_targets.pop(target, None)
+        self.completed_targets += 1
         self._update_display()
     
     def complete_scan(self):
@@ -208,13 +217,51 @@ class ProgressTracker:
         console.print(f"\n[bold]📊 Report generated:[/bold] [cyan]{report_path}[/cyan]")
 
 
+class TargetJob:
+    """Work left for one target: its stages, and the units of the current stage"""
+    def __init__(self, target, target_dir, stages):
+        self.target = target
+        self.target_dir = target_dir
+        self.stages = deque(stages)
+        self.module = None
+        self.merge = None
+        self.total = 0
+        self.pending = deque()
+        self.parts = {}
+        self.in_flight = 0
+        self.failed = False
+    
+    def next_stage(self):
+        """Queue the next stage's units; False once every stage has run"""
+        if self.failed or not self.stages:
+            return False
+        self.module, units, self.merge = self.stages.popleft()
+        self.pending = deque(enumerate(units))
+        self.total = len(units)
+        self.parts = {}
+        return True
+    
+    def results(self):
+        """Unit results in declaration order, whatever order they finished in"""
+        return [self.parts[i] for i in sorted(self.parts)]
+    
+    @property
+    def stage_done(self):
+        return not self.pending and not self.in_flight
+
+
 class ReconScanner:
     def __init__(self, target, target_list, mode, output_dir, 
-                 concurrency=10, max_resources=False):
+                 concurrency=10, max_resources=False, per_target=2,
+                 max_active_targets=None):
         self.targets = self._load_targets(target, target_list)
         self.mode = mode
         self.output_dir = output_dir
-        self.concurrency = concurrency
+        self.concurrency = max(1, concurrency)
+        self.per_target = max(1, per_target)
+        # Bound how many targets are open at once so early ones finish (and
+        # get written) instead of every target advancing in lockstep
+        self.max_active_targets = max_active_targets or self.concurrency
         self.max_resources = max_resources
         self.resource_monitor = ResourceMonitor()
         self.progress_tracker = ProgressTracker()
@@ -229,102 +276,187 @@ class ReconScanner:
         if target_list and os.path.exists(target_list):
             with open(target_list, 'r') as f:
                 targets.extend(line.strip() for line in f if line.strip())
-        return list(set(targets))
+        # Keep file order (dedup only) so targets complete roughly in list order
+        return list(dict.fromkeys(targets))
     
     def run(self):
+        """
+        Batch scan: every target's tools go through one shared worker pool.
+        Each tool run is a work unit; a target runs at most `per_target`
+        units at once and free workers are handed out round-robin across
+        open targets, so a big target cannot starve the rest.
+        """
         self.progress_tracker.start_scan(len(self.targets))
+        queue = deque(self.targets)
+        active = []
+        running = {}
         
-        # Process targets
-        for target in self.targets:
-            self.progress_tracker.start_target(target)
-            self._scan_target(target)
-            self.progress_tracker.complete_target(target)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while queue or active:
+                while queue and len(active) < self.max_active_targets:
+                    job = self._open_target(queue.popleft())
+                    if job:
+                        active.append(job)
+                
+                self._dispatch(pool, active, running)
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, index = running.pop(future)
+                    job.in_flight -= 1
+                    try:
+                        job.parts[index] = future.result()
+                    except Exception as e:
+                        self._target_failed(job, e)
+                    if not job.failed:
+                        self.progress_tracker.update_module(
+                            job.target, job.module,
+                            int((job.total - len(job.pending) - job.in_flight) / job.total * 100)
+                        )
+                    if job.stage_done and not self._advance(job):
+                        active.remove(job)
+                        self._finish_target(job)
         
         self.progress_tracker.complete_scan()
     
-    def _scan_target(self, target):
+    def _dispatch(self, pool, active, running):
+        slots = self.concurrency - len(running)
+        while slots > 0:
+            submitted = False
+            for job in active:
+                if slots and job.pending and job.in_flight < self.per_target:
+                    index, unit = job.pending.popleft()
+                    running[pool.submit(unit, job.target)] = (job, index)
+                    job.in_flight += 1
+                    slots -= 1
+                    submitted = True
+            if not submitted:
+                break
+    
+    def _open_target(self, target):
         # Create output directory
         target_dir = os.path.join(self.output_dir, target)
         os.makedirs(target_dir, exist_ok=True)
         
-        try:
-            # Subdomain enumeration
-            self.progress_tracker.start_module("subdomain_enumeration")
-            subdomains = self._run_subdomain_enum(target, target_dir)
-            self.results[target]['subdomains'] = subdomains
-            self.results[target]['subdomain_count'] = len(subdomains)
-            self.progress_tracker.complete_module("subdomain_enumeration", len(subdomains))
-            
-            # Content discovery
-            self.progress_tracker.start_module("content_discovery")
-            content_data = self._run_content_discovery(target, target_dir, subdomains)
-            self.results[target].update(content_data)
-            self.progress_tracker.complete_module("content_discovery", len(content_data['urls']))
-            
-            # Vulnerability scanning (deep mode only)
-            if self.mode == 'deep':
-                self.progress_tracker.start_module("vulnerability_scan")
-                vulnerabilities = self._run_vulnerability_scan(target, target_dir, content_data['urls'])
-                self.results[target]['vulnerabilities'] = vulnerabilities
-                self.progress_tracker.complete_module("vulnerability_scan", len(vulnerabilities))
-                
-        except Exception as e:
-            error_msg = f"{target} scan failed: {str(e)}"
-            self.errors.append(error_msg)
-            self.progress_tracker.add_error(error_msg)
+        stages = [
+            ("subdomain_enumeration", [
+                partial(self._run_subdomain_tool, tool)
+                for tool in self.SUBDOMAIN_TOOLS
+            ], self._merge_subdomains),
+            ("content_discovery", [
+                self._run_waybackurls, self._run_gau,
+                self._run_js_discovery, self._run_extension_scan
+            ], self._merge_content),
+        ]
+        # Vulnerability scanning (deep mode only)
+        if self.mode == 'deep':
+            stages.append(("vulnerability_scan", [
+                self._run_nuclei, self._run_custom_checks
+            ], self._merge_vulnerabilities))
+        
+        job = TargetJob(target, target_dir, stages)
+        self.progress_tracker.start_target(target)
+        if not self._advance(job):
+            self._finish_target(job)
+            return None
+        return job
+    
+    def _advance(self, job):
+        """Merge the finished stage (if any) and queue the next one"""
+        if job.merge and not job.failed:
+            try:
+                count = job.merge(job)
+                self.progress_tracker.complete_module(job.target, job.module, count)
+            except Exception as e:
+                self._target_failed(job, e)
+        if not job.next_stage():
+            return False
+        self.progress_tracker.start_module(job.target, job.module)
+        return True
+    
+    def _target_failed(self, job, error):
+        error_msg = f"{job.target} scan failed: {str(error)}"
+        self.errors.append(error_msg)
+        self.progress_tracker.add_error(error_msg)
+        # Drop the rest of the target's work; units already running finish
+        job.failed = True
+        job.pending.clear()
+        job.stages.clear()
+        job.merge = None
+    
+    def _finish_target(self, job):
+        """Write the target's report as soon as its last unit is done"""
+        if job.target in self.results:
+            report_gen = ReportGenerator(
+                self.results,
+                self.output_dir,
+                self.mode,
+                scan_duration=time.time() - self.start_time,
+                errors=self.errors
+            )
+            try:
+                report_gen.generate_target(job.target)
+            except Exception as e:
+                self.errors.append(f"{job.target} report failed: {str(e)}")
+        self.progress_tracker.complete_target(job.target)
+    
+    # ----------------------------------------------
+    # Subdomain enumeration
+    # ----------------------------------------------
+    
+    SUBDOMAIN_TOOLS = [
+        {"name": "SubFinder", "count": 15},
+        {"name": "Amass", "count": 20},
+        {"name": "AssetFinder", "count": 12},
+        {"name": "crt.sh", "count": 8}
+    ]
     
-    def _run_subdomain_enum(self, target, output_dir):
-        """Simulated subdomain enumeration with progress"""
+    def _run_subdomain_tool(self, tool, target):
+        """Simulated subdomain enumeration tool"""
+        task = f"{target}:{tool['name']}"
+        self.progress_tracker.resource_monitor.start_task(task)
+        
+        # Simulate finding domains
         domains = []
+        for i in range(tool['count']):
+            time.sleep(random.uniform(0.05, 0.2))
+            domains.append(f"{tool['name'].lower()}{i}.{target}")
+        
+        # Simulate resource usage
+        self.progress_tracker.resource_monitor.end_task(task)
+        return domains
+    
+    def _merge_subdomains(self, job):
+        target = job.target
         base_domains = [
             f"www.{target}", f"api.{target}", f"dev.{target}", 
             f"staging.{target}", f"mail.{target}", f"app.{target}",
             f"cdn.{target}", f"assets.{target}", f"blog.{target}"
         ]
         
-        # Simulate tool execution
-        tools = [
-            {"name": "SubFinder", "count": 15},
-            {"name": "Amass", "count": 20},
-            {"name": "AssetFinder", "count": 12},
-            {"name": "crt.sh", "count": 8}
-        ]
-        
-        for tool in tools:
-            self.progress_tracker.resource_monitor.start_task(tool['name'])
-            
-            # Simulate finding domains
-            for i in range(tool['count']):
-                time.sleep(random.uniform(0.05, 0.2))
-                new_domain = f"{tool['name'].lower()}{i}.{target}"
-                domains.append(new_domain)
-                
-                # Update progress
-                progress = int((i + 1) / tool['count'] * 100)
-                self.progress_tracker.update_module("subdomain_enumeration", 
-                                                  min(95, progress))
-            
-            # Simulate resource usage
-            resource_data = self.progress_tracker.resource_monitor.end_task(tool['name'])
-        
         # Combine all domains
-        all_domains = list(set(base_domains + domains))
+        all_domains = list(set(base_domains + [d for part in job.results() for d in part]))
         
         # Write to file
-        with open(os.path.join(output_dir, "subdomains.txt"), 'w') as f:
+        with open(os.path.join(job.target_dir, "subdomains.txt"), 'w') as f:
             f.write("\n".join(all_domains))
         
-        return all_domains
+        self.results[target]['subdomains'] = all_domains
+        self.results[target]['subdomain_count'] = len(all_domains)
+        return len(all_domains)
     
-    def _run_content_discovery(self, target, output_dir, subdomains):
-        """Simulated content discovery with progress"""
+    # ----------------------------------------------
+    # Content discovery
+    # ----------------------------------------------
+    
+    def _run_waybackurls(self, target):
+        """Simulated WaybackURLs"""
+        subdomains = self.results[target]['subdomains']
         urls = []
-        js_files = []
-        extensions = []
-        
-        # Simulate WaybackURLs
-        self.progress_tracker.resource_monitor.start_task("WaybackURLs")
-        for i, sub in enumerate(subdomains[:10]):
+        self.progress_tracker.resource_monitor.start_task(f"{target}:WaybackURLs")
+        for sub in subdomains[:10]:
             time.sleep(0.1)
             urls.extend([
                 f"http://{sub}/",
@@ -332,12 +464,15 @@ class ReconScanner:
                 f"http://{sub}/robots.txt",
                 f"http://{sub}/sitemap.xml"
             ])
-            self.progress_tracker.update_module("content_discovery", i * 5)
-        self.progress_tracker.resource_monitor.end_task("WaybackURLs")
-        
-        # Simulate Gau
-        self.progress_tracker.resource_monitor.start_task("Gau")
-        for i, sub in enumerate(subdomains[5:15]):
+        self.progress_tracker.resource_monitor.end_task(f"{target}:WaybackURLs")
+        return {'urls': urls}
+    
+    def _run_gau(self, target):
+        """Simulated Gau"""
+        subdomains = self.results[target]['subdomains']
+        urls = []
+        self.progress_tracker.resource_monitor.start_task(f"{target}:Gau")
+        for sub in subdomains[5:15]:
             time.sleep(0.08)
             urls.extend([
                 f"http://{sub}/login",
@@ -345,88 +480,108 @@ class ReconScanner:
                 f"http://{sub}/api",
                 f"http://{sub}/.env"
             ])
-            self.progress_tracker.update_module("content_discovery", 50 + i * 3)
-        self.progress_tracker.resource_monitor.end_task("Gau")
-        
-        # Simulate JS discovery
-        self.progress_tracker.resource_monitor.start_task("JSDiscovery")
-        for i, sub in enumerate(subdomains[:8]):
+        self.progress_tracker.resource_monitor.end_task(f"{target}:Gau")
+        return {'urls': urls}
+    
+    def _run_js_discovery(self, target):
+        """Simulated JS discovery"""
+        subdomains = self.results[target]['subdomains']
+        js_files = []
+        self.progress_tracker.resource_monitor.start_task(f"{target}:JSDiscovery")
+        for sub in subdomains[:8]:
             time.sleep(0.07)
             js_files.append(f"http://{sub}/app.js")
             js_files.append(f"http://{sub}/main.js")
             js_files.append(f"http://{sub}/bundle.js")
-            self.progress_tracker.update_module("content_discovery", 70 + i * 3)
-        self.progress_tracker.resource_monitor.end_task("JSDiscovery")
-        
-        # Simulate extension discovery
-        self.progress_tracker.resource_monitor.start_task("ExtensionScan")
-        for i, sub in enumerate(subdomains[:5]):
+        self.progress_tracker.resource_monitor.end_task(f"{target}:JSDiscovery")
+        return {'js_files': js_files}
+    
+    def _run_extension_scan(self, target):
+        """Simulated extension discovery"""
+        subdomains = self.results[target]['subdomains']
+        extensions = []
+        self.progress_tracker.resource_monitor.start_task(f"{target}:ExtensionScan")
+        for sub in subdomains[:5]:
             time.sleep(0.06)
             extensions.append(f"http://{sub}/backup.zip")
             extensions.append(f"http://{sub}/database.sql")
             extensions.append(f"http://{sub}/config.bak")
-            self.progress_tracker.update_module("content_discovery", 85 + i * 3)
-        self.progress_tracker.resource_monitor.end_task("ExtensionScan")
+        self.progress_tracker.resource_monitor.end_task(f"{target}:ExtensionScan")
+        return {'extensions': extensions}
+    
+    def _merge_content(self, job):
+        content_data = {'urls': [], 'js_files': [], 'extensions': []}
+        for part in job.results():
+            for key, values in part.items():
+                content_data[key].extend(values)
         
         # Write to files
-        with open(os.path.join(output_dir, "urls.txt"), 'w') as f:
-            f.write("\n".join(urls))
+        with open(os.path.join(job.target_dir, "urls.txt"), 'w') as f:
+            f.write("\n".join(content_data['urls']))
         
-        with open(os.path.join(output_dir, "js_files.txt"), 'w') as f:
-            f.write("\n".join(js_files))
+        with open(os.path.join(job.target_dir, "js_files.txt"), 'w') as f:
+            f.write("\n".join(content_data['js_files']))
         
-        with open(os.path.join(output_dir, "extensions.txt"), 'w') as f:
-            f.write("\n".join(extensions))
+        with open(os.path.join(job.target_dir, "extensions.txt"), 'w') as f:
+            f.write("\n".join(content_data['extensions']))
         
-        return {
-            'urls': urls,
-            'js_files': js_files,
-            'extensions': extensions
-        }
+        self.results[job.target].update(content_data)
+        return len(content_data['urls'])
+    
+    # ----------------------------------------------
+    # Vulnerability scanning
+    # ----------------------------------------------
+    
+    VULN_TYPES = ['XSS', 'SQL Injection', 'SSRF', 'LFI', 'IDOR', 'RCE', 'XXE']
+    SEVERITIES = ['Low', 'Medium', 'High', 'Critical']
     
-    def _run_vulnerability_scan(self, target, output_dir, urls):
-        """Simulated vulnerability scanning with progress"""
+    def _run_nuclei(self, target):
+        """Simulated Nuclei"""
+        urls = self.results[target]['urls']
         vulnerabilities = []
-        vuln_types = ['XSS', 'SQL Injection', 'SSRF', 'LFI', 'IDOR', 'RCE', 'XXE']
-        severities = ['Low', 'Medium', 'High', 'Critical']
-        
-        # Simulate Nuclei
-        self.progress_tracker.resource_monitor.start_task("Nuclei")
+        self.progress_tracker.resource_monitor.start_task(f"{target}:Nuclei")
         for i in range(10):
             time.sleep(0.2)
             if random.random() > 0.7:  # 30% chance of finding vulnerability
                 vuln = {
                     'url': random.choice(urls),
-                    'type': random.choice(vuln_types),
-                    'severity': random.choice(severities),
-                    'description': f"Potential {random.choice(vuln_types)} vulnerability detected",
+                    'type': random.choice(self.VULN_TYPES),
+                    'severity': random.choice(self.SEVERITIES),
+                    'description': f"Potential {random.choice(self.VULN_TYPES)} vulnerability detected",
                     'tool': 'Nuclei'
                 }
                 vulnerabilities.append(vuln)
-            self.progress_tracker.update_module("vulnerability_scan", i * 8)
-        self.progress_tracker.resource_monitor.end_task("Nuclei")
-        
-        # Simulate custom checks
-        self.progress_tracker.resource_monitor.start_task("CustomChecks")
+        self.progress_tracker.resource_monitor.end_task(f"{target}:Nuclei")
+        return vulnerabilities
+    
+    def _run_custom_checks(self, target):
+        """Simulated custom checks"""
+        urls = self.results[target]['urls']
+        vulnerabilities = []
+        self.progress_tracker.resource_monitor.start_task(f"{target}:CustomChecks")
         for i in range(5):
             time.sleep(0.15)
             if random.random() > 0.6:  # 40% chance of finding vulnerability
                 vuln = {
                     'url': random.choice(urls),
-                    'type': random.choice(vuln_types),
-                    'severity': random.choice(severities[1:]),  # Skip Low severity
+                    'type': random.choice(self.VULN_TYPES),
+                    'severity': random.choice(self.SEVERITIES[1:]),  # Skip Low severity
                     'description': f"Possible {random.choice(['misconfiguration', 'data exposure'])}",
                     'tool': 'CustomCheck'
                 }
                 vulnerabilities.append(vuln)
-            self.progress_tracker.update_module("vulnerability_scan", 60 + i * 8)
-        self.progress_tracker.resource_monitor.end_task("CustomChecks")
+        self.progress_tracker.resource_monitor.end_task(f"{target}:CustomChecks")
+        return vulnerabilities
+    
+    def _merge_vulnerabilities(self, job):
+        vulnerabilities = [v for part in job.results() for v in part]
         
         # Write to file
-        with open(os.path.join(output_dir, "vulnerabilities.json"), 'w') as f:
+        with open(os.path.join(job.target_dir, "vulnerabilities.json"), 'w') as f:
             json.dump(vulnerabilities, f, indent=2)
         
-        return vulnerabilities
+        self.results[job.target]['vulnerabilities'] = vulnerabilities
+        return len(vulnerabilities)
     
     def generate_report(self):
         report_gen = ReportGenerator(
@@ -462,12 +617,18 @@ class ReportGenerator:
         
         # Generate target reports
         for target in self.results:
-            target_path = os.path.join(report_dir, f"{target}_report.html")
-            with open(target_path, 'w') as f:
-                f.write(self._generate_target_html(target))
+            self.generate_target(target)
         
         return summary_path
     
+    def generate_target(self, target):
+        report_dir = os.path.join(self.output_dir, "reports")
+        os.makedirs(report_dir, exist_ok=True)
+        target_path = os.path.join(report_dir, f"{target}_report.html")
+        with open(target_path, 'w') as f:
+            f.write(self._generate_target_html(target))
+        return target_path
+    
     def _generate_summary_html(self):
         total_subdomains = sum(data.get('subdomain_count', 0) for data in self.results.values())
         total_vulns = sum(len(data.get('vulnerabilities', [])) for data in self.results.values())
@@ -913,7 +1074,11 @@ def main():
     parser.add_argument('-o', '--output', default='./reconx_results', 
                         help='Output directory')
     parser.add_argument('-c', '--concurrency', type=int, default=10,
-                        help='Number of concurrent workers')
+                        help='Number of concurrent workers shared by all targets')
+    parser.add_argument('--per-target', type=int, default=2,
+                        help='Max tools running at once for a single target')
+    parser.add_argument('--max-active-targets', type=int, default=None,
+                        help='Max targets in progress at once (default: concurrency)')
     parser.add_argument('--max-resources', action='store_true',
                         help='Enable resource usage limits')
     
@@ -934,7 +1099,9 @@ def main():
         mode=args.mode,
         output_dir=args.output,
         concurrency=args.concurrency,
-        max_resources=args.max_resources
+        max_resources=args.max_resources,
+        per_target=args.per_target,
+        max_active_targets=args.max_active_targets
     )
     
     try:
@@ -5,6 +5,8 @@ import yaml
 from concurrent.futures import ThreadPoolExecutor
 from core.ui import UI
 from core.tools import check_tool_availability, merge_results, check_alive, grep_important
+from core.phase_runner import run_phase
+from core import process_runner
 from core.report import generate_report
 from core.state_manager import StateManager
 
@@ -29,6 +31,9 @@ async def main():
             f.write(f"Error loading config.yaml: {e}\n")
         config = {}
 
+    # Per-tool resource accounting (output/metrics/tool_metrics.jsonl)
+    process_runner.configure(config, args.target)
+
     # Initialize StateManager
     state_manager = StateManager(args.target)
     state_manager.set_mode(args.mode)
@@ -58,118 +63,53 @@ async def main():
 
     if args.mode == "deep":
         ui.console.print("[cyan]Starting deep scan...[/cyan]")
-        for i, tool in enumerate(enabled_subdomain_tools, 1):
-            ui.console.print(f"[cyan]Running {tool} ({i}/{total_subdomain_tools})...[/cyan]")
-            try:
-                # Dynamically call the tool function
-                func = globals().get(f"run_{tool}")
-                if func:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = func(ui, args.target, config=config)
-                    subdomains.extend(result)
-                    ui.console.print(f"[cyan]{tool} found {len(result)} subdomains[/cyan]")
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                else:
-                    ui.console.print(f"[red]Error: Function run_{tool} not found in core/tools.py.[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error: Function run_{tool} not found for {args.target}\n")
-            except Exception as e:
-                ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                with open("output/errors/errors.log", "a") as f:
-                    f.write(f"Error running {tool} on {args.target}: {e}\n")
-                ui.end_tool(tool, [], stderr=str(e), error=True)
-            ui.update_phase_progress(tool)
+        for tool, (result, *_) in run_phase(ui, args.target, config, enabled_subdomain_tools, "subdomain tools").items():
+            subdomains.extend(result)
+            ui.console.print(f"[cyan]{tool} found {len(result)} subdomains[/cyan]")
 
         subdomains = merge_results(ui, args.target, config)
         state_manager.update_progress("phase_1_subdomain_enumeration", min(100, len(enabled_subdomain_tools) * 20))
         alive = check_alive(ui, args.target, config)
-        dead = list(set(subdomains) - set(alive))
+        # stream the merged file against the (smaller) alive set instead of loading it
+        alive_set = set(alive)
+        dead = [host for host in subdomains if host not in alive_set]
         state_manager.update_subdomains(alive)
         important = grep_important(ui, args.target, config)
 
         ui.console.print("[cyan]Running secret finding...[/cyan]")
-        for tool in tools.get("secret_finding", []):
-            if config.get("tools", {}).get(tool, {}).get("enabled", True):
-                try:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = globals()[f"run_{tool}"](ui, args.target, config=config)
-                    secrets.extend(result)
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                except Exception as e:
-                    ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error running {tool} on {args.target}: {e}\n")
-                    ui.end_tool(tool, [], stderr=str(e), error=True)
-                ui.update_phase_progress(tool)
+        phase_tools = [tool for tool in tools.get("secret_finding", []) if config.get("tools", {}).get(tool, {}).get("enabled", True)]
+        for result, *_ in run_phase(ui, args.target, config, phase_tools, "secret finding tools").values():
+            secrets.extend(result)
         state_manager.update_progress("phase_2_secret_finding", 100)
 
         ui.console.print("[cyan]Running asset identification...[/cyan]")
-        for tool in tools.get("asset_discovery", []):
-            if config.get("tools", {}).get(tool, {}).get("enabled", True):
-                try:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = globals()[f"run_{tool}"](ui, args.target, config=config)
-                    subdomains.extend(result)
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                except Exception as e:
-                    ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error running {tool} on {args.target}: {e}\n")
-                    ui.end_tool(tool, [], stderr=str(e), error=True)
-                ui.update_phase_progress(tool)
+        phase_tools = [tool for tool in tools.get("asset_discovery", []) if config.get("tools", {}).get(tool, {}).get("enabled", True)]
+        for result, *_ in run_phase(ui, args.target, config, phase_tools, "asset discovery tools").values():
+            subdomains.extend(result)
         state_manager.update_progress("phase_3_asset_identification", 100)
 
         ui.console.print("[cyan]Running endpoint extraction...[/cyan]")
-        for tool in tools.get("endpoint_extraction", []):
-            if config.get("tools", {}).get(tool, {}).get("enabled", True):
-                try:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = globals()[f"run_{tool}"](ui, args.target, config=config)
-                    endpoints.extend(result)
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                except Exception as e:
-                    ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error running {tool} on {args.target}: {e}\n")
-                    ui.end_tool(tool, [], stderr=str(e), error=True)
-                ui.update_phase_progress(tool)
+        phase_tools = [tool for tool in tools.get("endpoint_extraction", []) if config.get("tools", {}).get(tool, {}).get("enabled", True)]
+        for result, *_ in run_phase(ui, args.target, config, phase_tools, "endpoint extraction tools").values():
+            endpoints.extend(result)
         state_manager.update_progress("phase_4_endpoint_extraction", 100)
 
         ui.console.print("[cyan]Running vulnerability scanning...[/cyan]")
-        for tool in tools.get("vulnerability_scanning", []):
-            if config.get("tools", {}).get(tool, {}).get("enabled", True):
-                try:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = globals()[f"run_{tool}"](ui, args.target, config=config)
-                    vulnerabilities.extend(result)
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                except Exception as e:
-                    ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error running {tool} on {args.target}: {e}\n")
-                    ui.end_tool(tool, [], stderr=str(e), error=True)
-                ui.update_phase_progress(tool)
+        phase_tools = [tool for tool in tools.get("vulnerability_scanning", []) if config.get("tools", {}).get(tool, {}).get("enabled", True)]
+        for result, *_ in run_phase(ui, args.target, config, phase_tools, "vulnerability scanning tools").values():
+            vulnerabilities.extend(result)
         state_manager.update_progress("phase_5_vulnerability_scanning", 100)
 
     else:
         ui.console.print("[cyan]Starting quick scan...[/cyan]")
-        for i, tool in enumerate(enabled_subdomain_tools[:2], 1):
-            ui.console.print(f"[cyan]Running {tool} ({i}/2)...[/cyan]")
-            try:
-                func = globals().get(f"run_{tool}")
-                if func:
-                    result, stderr, duration, cpu, ram, net_sent, net_recv = func(ui, args.target, config=config)
-                    subdomains.extend(result)
-                    ui.end_tool(tool, result, duration, stderr, False, cpu, ram, net_sent, net_recv)
-                else:
-                    ui.console.print(f"[red]Error: Function run_{tool} not found.[/red]")
-                    with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Error: Function run_{tool} not found for {args.target}\n")
-            except Exception as e:
-                ui.console.print(f"[red]Error running {tool}: {e}[/red]")
-                with open("output/errors/errors.log", "a") as f:
-                    f.write(f"Error running {tool} on {args.target}: {e}\n")
-                ui.end_tool(tool, [], stderr=str(e), error=True)
-            ui.update_phase_progress(tool)
+        for result, *_ in run_phase(ui, args.target, config, enabled_subdomain_tools[:2], "subdomain tools").values():
+            subdomains.extend(result)
         subdomains = merge_results(ui, args.target, config)
         state_manager.update_progress("phase_1_subdomain_enumeration", min(100, len(enabled_subdomain_tools[:2]) * 20))
         alive = check_alive(ui, args.target, config)
-        dead = list(set(subdomains) - set(alive))
+        # stream the merged file against the (smaller) alive set instead of loading it
+        alive_set = set(alive)
+        dead = [host for host in subdomains if host not in alive_set]
         state_manager.update_subdomains(alive)
         state_manager.update_progress("phase_2_secret_finding", 100)
 
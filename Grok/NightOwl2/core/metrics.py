@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+import threading
+import psutil
+
+DEFAULT_METRICS_FILE = "output/metrics/tool_metrics.jsonl"
+
+class MetricsLog:
+    """Append-only JSONL log with one record per tool process run."""
+
+    def __init__(self, path=DEFAULT_METRICS_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def record(self, entry):
+        line = json.dumps(entry, sort_keys=True)
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+def summarize(path=DEFAULT_METRICS_FILE):
+    """
+    Per-tool p50/p95 of wall time, CPU seconds, cores used and peak RSS, plus
+    how many copies of the tool fit this machine. That count is the lower of
+    the fit by cores (p95 cores) and the fit by memory (p95 peak RSS).
+    """
+    runs = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                runs.setdefault(entry["tool"], []).append(entry)
+    cpus = os.cpu_count() or 1
+    mem_mb = psutil.virtual_memory().total / (1024 * 1024)
+    summary = {}
+    for tool, entries in sorted(runs.items()):
+        cores = [e["cpu_seconds"] / e["duration"] for e in entries if e["duration"] > 0] or [0]
+        rss = [e["peak_rss_mb"] for e in entries]
+        p95_cores = _percentile(cores, 95)
+        p95_rss = _percentile(rss, 95)
+        summary[tool] = {
+            "runs": len(entries),
+            "duration_p50": round(_percentile([e["duration"] for e in entries], 50), 1),
+            "duration_p95": round(_percentile([e["duration"] for e in entries], 95), 1),
+            "cpu_seconds_p95": round(_percentile([e["cpu_seconds"] for e in entries], 95), 1),
+            "cores_p50": round(_percentile(cores, 50), 2),
+            "cores_p95": round(p95_cores, 2),
+            "peak_rss_mb_p95": round(p95_rss, 1),
+            "peak_rss_mb_max": round(max(rss), 1),
+            "fits_parallel": int(min(cpus / p95_cores if p95_cores else float("inf"),
+                                     mem_mb / p95_rss if p95_rss else float("inf"), 9999)),
+        }
+    return summary
+
+if __name__ == "__main__":
+    from rich.console import Console
+    from rich.table import Table
+    summary = summarize(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_METRICS_FILE)
+    table = Table(title=f"Tool resource use ({os.cpu_count()} CPUs, "
+                        f"{psutil.virtual_memory().total / (1024 ** 3):.1f} GB RAM)")
+    columns = ["runs", "duration_p50", "duration_p95", "cpu_seconds_p95", "cores_p50", "cores_p95",
+               "peak_rss_mb_p95", "peak_rss_mb_max", "fits_parallel"]
+    table.add_column("tool")
+    for column in columns:
+        table.add_column(column, justify="right")
+    for tool, row in summary.items():
+        table.add_row(tool, *(str(row[c]) for c in columns))
+    Console().print(table)
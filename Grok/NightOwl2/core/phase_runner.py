@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import core.tools as tools_module
+
+def _group_limits(config):
+    general = config.get("general", {}) if config else {}
+    return general.get("max_parallel_tools", 4), general.get("tool_groups", {})
+
+def run_phase(ui, target, config, tool_names, label="tools"):
+    """
+    Run the independent tools of one phase concurrently.
+
+    At most `general.max_parallel_tools` tools run at once. A tool with
+    `group: <name>` under tools.<tool> in config.yaml also takes a slot of
+    `general.tool_groups.<name>` (e.g. resolver-heavy DNS tools, one at a
+    time). Returns {tool: result tuple} in `tool_names` order, covering only
+    the tools that ran without raising.
+    """
+    max_parallel, group_caps = _group_limits(config)
+    semaphores = {name: threading.Semaphore(cap) for name, cap in group_caps.items()}
+    tool_cfg = config.get("tools", {}) if config else {}
+    results = {}
+    lock = threading.Lock()
+
+    def run_one(tool):
+        func = getattr(tools_module, f"run_{tool}", None)
+        if func is None:
+            ui.console.print(f"[red]Error: Function run_{tool} not found in core/tools.py.[/red]")
+            with open("output/errors/errors.log", "a") as f:
+                f.write(f"Error: Function run_{tool} not found for {target}\n")
+            return
+        group = semaphores.get(tool_cfg.get(tool, {}).get("group"))
+        if group:
+            group.acquire()
+        try:
+            ui.console.print(f"[cyan]Running {tool}...[/cyan]")
+            result = func(ui, target, config=config)
+            _, _, duration, cpu, ram, net_sent, net_recv = result
+            ui.console.print(f"[cyan]{tool} finished in {duration:.1f}s: {len(result[0])} results, "
+                             f"cpu {cpu}%, ram {ram}%, net {net_sent:.0f}/{net_recv:.0f} KB sent/recv[/cyan]")
+            with lock:
+                results[tool] = result
+        except Exception as e:
+            ui.console.print(f"[red]Error running {tool}: {e}[/red]")
+            with open("output/errors/errors.log", "a") as f:
+                f.write(f"Error running {tool} on {target}: {e}\n")
+            ui.end_tool(tool, [], 0, str(e), True)
+        finally:
+            if group:
+                group.release()
+            ui.update_phase_progress(tool)
+
+    ui.console.print(f"[cyan]Running {len(tool_names)} {label} ({min(max_parallel, len(tool_names) or 1)} at a time)...[/cyan]")
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as pool:
+        list(pool.map(run_one, tool_names))
+    return {tool: results[tool] for tool in tool_names if tool in results}
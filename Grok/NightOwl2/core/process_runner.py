@@ -0,0 +1,256 @@
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import psutil
+from core.metrics import MetricsLog
+
+_settings = {"target": "", "metrics": None, "cgroup": None, "tools": {}}
+
+def configure(config, target):
+    """
+    Set up per-run accounting from config.yaml. Every tracked process is then
+    appended to general.metrics_file (default output/metrics/tool_metrics.jsonl).
+    When general.cgroup.enabled is set, each one also runs in its own cgroup v2.
+    """
+    general = (config or {}).get("general", {})
+    output_dir = general.get("output_dir", "output")
+    _settings["target"] = target
+    _settings["metrics"] = MetricsLog(general.get("metrics_file", f"{output_dir}/metrics/tool_metrics.jsonl"))
+    cgroup = general.get("cgroup", {})
+    _settings["cgroup"] = cgroup if cgroup.get("enabled") else None
+    _settings["tools"] = (config or {}).get("tools", {})
+
+class ProcessTreeUsage:
+    """
+    Resource use of one tool: its process and every descendant it spawns.
+
+    The tree is sampled while it runs. CPU and I/O counters are cumulative
+    per process, so the last sample of each pid is kept and summed.
+    Network traffic is estimated from the characters the tree read and wrote
+    minus what went to storage. That leaves socket and pipe traffic, which
+    for these tools is almost all network.
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.procs = {}
+        self.last = {}
+        self.peak_rss = 0
+
+    def sample(self):
+        try:
+            root = self.procs.get(self.pid) or psutil.Process(self.pid)
+            self.procs[self.pid] = root
+            tree = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return
+        rss = 0
+        for p in tree:
+            p = self.procs.setdefault(p.pid, p)
+            try:
+                with p.oneshot():
+                    cpu = p.cpu_times()
+                    io = p.io_counters()
+                    rss += p.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            self.last[p.pid] = (cpu.user + cpu.system, io.read_chars, io.write_chars, io.read_bytes, io.write_bytes)
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def totals(self, duration):
+        cpu = sum(v[0] for v in self.last.values())
+        recv = sum(max(0, v[1] - v[3]) for v in self.last.values())
+        sent = sum(max(0, v[2] - v[4]) for v in self.last.values())
+        return {
+            "cpu_seconds": round(cpu, 2),
+            "peak_rss_mb": round(self.peak_rss / (1024 * 1024), 1),
+            "io_read_mb": round(sum(v[3] for v in self.last.values()) / (1024 * 1024), 2),
+            "io_write_mb": round(sum(v[4] for v in self.last.values()) / (1024 * 1024), 2),
+            "net_sent_kb": round(sent / 1024, 1),
+            "net_recv_kb": round(recv / 1024, 1),
+        }
+
+class Cgroup:
+    """
+    A per-run cgroup v2 under general.cgroup.root. Optional memory.max and
+    cpu.max limits are applied. Its cpu.stat, memory.peak and io.stat are
+    read when the run ends.
+
+    The tool joins the cgroup itself before it is exec'd (see wrap), so
+    everything it forks is accounted as well.
+    """
+
+    def __init__(self, settings, tool, limits):
+        root = settings.get("root", "/sys/fs/cgroup/nightowl")
+        self.path = os.path.join(root, f"{tool}-{uuid.uuid4().hex[:8]}")
+        memory_mb = limits.get("memory_max_mb", settings.get("memory_max_mb"))
+        cpu_max = limits.get("cpu_max", settings.get("cpu_max"))
+        needed = [c for c, limit in (("memory", memory_mb), ("cpu", cpu_max)) if limit]
+        if needed:
+            # limits can only be written when the root hands the controller down
+            try:
+                with open(os.path.join(root, "cgroup.subtree_control")) as f:
+                    enabled = f.read().split()
+            except FileNotFoundError:
+                enabled = []
+            missing = [c for c in needed if c not in enabled]
+            if missing:
+                raise OSError(f"{', '.join(missing)} controller not enabled in {root}/cgroup.subtree_control")
+        os.makedirs(self.path)
+        try:
+            if memory_mb:
+                self._write("memory.max", str(int(memory_mb * 1024 * 1024)))
+            if cpu_max:
+                # cores, e.g. 1.5 -> "150000 100000"
+                self._write("cpu.max", f"{int(cpu_max * 100000)} 100000")
+        except OSError:
+            self.remove()
+            raise
+
+    def _write(self, name, value):
+        with open(os.path.join(self.path, name), "w") as f:
+            f.write(value)
+
+    def _read(self, name):
+        try:
+            with open(os.path.join(self.path, name)) as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def wrap(self, cmd):
+        """cmd prefixed with a shell that moves itself into the cgroup, then execs the tool."""
+        procs = os.path.join(self.path, "cgroup.procs")
+        return ["/bin/sh", "-c", 'echo $$ > "$0" && exec "$@"', procs, *cmd]
+
+    def stats(self):
+        stats = {}
+        cpu = dict(line.split() for line in self._read("cpu.stat").splitlines() if line.strip())
+        if "usage_usec" in cpu:
+            stats["cgroup_cpu_seconds"] = round(int(cpu["usage_usec"]) / 1e6, 2)
+        peak = self._read("memory.peak").strip()
+        if peak.isdigit():
+            stats["cgroup_peak_rss_mb"] = round(int(peak) / (1024 * 1024), 1)
+        rbytes = wbytes = 0
+        for line in self._read("io.stat").splitlines():
+            fields = dict(kv.split("=", 1) for kv in line.split()[1:] if "=" in kv)
+            rbytes += int(fields.get("rbytes", 0))
+            wbytes += int(fields.get("wbytes", 0))
+        if rbytes or wbytes:
+            stats["cgroup_io_read_mb"] = round(rbytes / (1024 * 1024), 2)
+            stats["cgroup_io_write_mb"] = round(wbytes / (1024 * 1024), 2)
+        return stats
+
+    def remove(self):
+        try:
+            os.rmdir(self.path)
+        except OSError:
+            pass
+
+def _open_cgroup(tool):
+    settings = _settings["cgroup"]
+    if not settings:
+        return None
+    try:
+        return Cgroup(settings, tool, _settings["tools"].get(tool, {}))
+    except OSError as e:
+        # no cgroup v2 delegation here: stop trying for the rest of the scan
+        _settings["cgroup"] = None
+        with open("output/errors/errors.log", "a") as f:
+            f.write(f"cgroup accounting disabled: {e}\n")
+        return None
+
+def run_tracked(cmd, timeout=None, on_line=None, check=True, poll_interval=0.5):
+    """
+    Run a tool like subprocess.run(cmd, capture_output=True, text=True, check=check)
+    and account its own resource use.
+
+    CPU time and max RSS come from the child's rusage via os.wait4. That
+    covers everything the tool forked and waited for. Tree peak RSS, disk
+    I/O and the network estimate come from ProcessTreeUsage. cgroup figures
+    are added when cgroups are configured. The record goes to the metrics
+    file.
+
+    on_line, if given, receives each stdout line as it arrives instead of it
+    being captured. After `timeout` seconds the tool's process group is
+    killed. Returns (CompletedProcess, usage). usage["timed_out"] says whether
+    the timeout fired; with check=True a timeout or a non-zero exit raises.
+    """
+    tool = os.path.basename(cmd[0])
+    start = time.time()
+    err = tempfile.TemporaryFile(mode="w+")
+    cgroup = _open_cgroup(tool)
+    proc = subprocess.Popen(cgroup.wrap(cmd) if cgroup else cmd, stdout=subprocess.PIPE, stderr=err,
+                            text=True, start_new_session=True)
+    lines = []
+
+    def read():
+        for line in proc.stdout:
+            if on_line:
+                on_line(line)
+            else:
+                lines.append(line)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    usage = ProcessTreeUsage(proc.pid)
+    timed_out = False
+    try:
+        while True:
+            usage.sample()
+            reader.join(poll_interval)
+            if not reader.is_alive():
+                pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+                if pid:
+                    break
+                time.sleep(0.05)
+            if timeout and not timed_out and time.time() - start > timeout:
+                timed_out = True
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        err.seek(0)
+        stderr = err.read()
+    finally:
+        err.close()
+    duration = time.time() - start
+
+    stats = usage.totals(duration)
+    stats["cpu_user"] = round(rusage.ru_utime, 2)
+    stats["cpu_system"] = round(rusage.ru_stime, 2)
+    stats["cpu_seconds"] = round(rusage.ru_utime + rusage.ru_stime, 2)
+    # ru_maxrss (KB) is the largest single process; the sampled tree sum can be higher
+    stats["max_rss_mb"] = round(rusage.ru_maxrss / 1024, 1)
+    stats["peak_rss_mb"] = max(stats["peak_rss_mb"], stats["max_rss_mb"])
+    if cgroup:
+        stats.update(cgroup.stats())
+        cgroup.remove()
+        stats["cpu_seconds"] = max(stats["cpu_seconds"], stats.get("cgroup_cpu_seconds", 0))
+        stats["peak_rss_mb"] = max(stats["peak_rss_mb"], stats.get("cgroup_peak_rss_mb", 0))
+    stats["cpu_percent"] = round(stats["cpu_seconds"] / duration * 100, 1) if duration > 0 else 0
+    stats["ram_percent"] = round(stats["peak_rss_mb"] * 1024 * 1024 / psutil.virtual_memory().total * 100, 2)
+    stats["timed_out"] = timed_out
+
+    if _settings["metrics"]:
+        _settings["metrics"].record({
+            "tool": tool,
+            "target": _settings["target"],
+            "cmd": " ".join(cmd),
+            "started": round(start, 3),
+            "duration": round(duration, 2),
+            "rc": proc.returncode,
+            **stats,
+        })
+
+    result = subprocess.CompletedProcess(cmd, proc.returncode, "".join(lines), stderr)
+    if check and timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout, result.stdout, stderr)
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, result.stdout, stderr)
+    return result, stats
@@ -1,9 +1,11 @@
 import json
 import os
+import threading
 
 class StateManager:
     def __init__(self, target=""):
         self.state_file = "output/state.json"
+        self.lock = threading.RLock()  # tools of a phase update state from several threads
         self.state = {
             "target": target,
             "mode": "",
@@ -25,8 +27,11 @@ class StateManager:
                 self.state.update(json.load(f))
 
     def save_state(self):
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=4)
+        with self.lock:
+            tmp = f"{self.state_file}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, indent=4)
+            os.replace(tmp, self.state_file)
 
     def set_target(self, target):
         self.state["target"] = target
@@ -46,17 +51,20 @@ class StateManager:
         return self.state.get("progress", {})
 
     def update_progress(self, phase, value):
-        if phase in self.state["progress"]:
-            self.state["progress"][phase] = min(100, max(0, value))
-            self.save_state()
+        with self.lock:
+            if phase in self.state["progress"]:
+                self.state["progress"][phase] = min(100, max(0, value))
+                self.save_state()
 
     def update_subdomains(self, subdomains):
-        self.state["subdomains"].extend(subdomains)
-        self.save_state()
+        with self.lock:
+            self.state["subdomains"].extend(subdomains)
+            self.save_state()
 
     def update_tool_status(self, tool, status):
-        self.state["current_tools"][tool] = status
-        self.save_state()
+        with self.lock:
+            self.state["current_tools"][tool] = status
+            self.save_state()
 
     def get_tool_status(self, tool):
         return self.state["current_tools"].get(tool, "Not Started")
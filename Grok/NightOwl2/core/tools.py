@@ -1,10 +1,20 @@
 import subprocess
 import os
+import re
+import heapq
+import json
+import signal
+import hashlib
+import tempfile
+import threading
 import time
 import yaml
 import psutil
 import shutil
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from core.ui import UI
+from core.process_runner import run_tracked
 
 def check_tool_availability(ui, config):
     """Check which tools are installed and available."""
@@ -46,16 +56,14 @@ def run_sublist3r(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/sublist3r.txt"
     cmd = ["sublist3r", "-d", target, "-o", output_file, "-n"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("sublist3r", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -64,10 +72,10 @@ def run_sublist3r(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: sublist3r output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("sublist3r", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("sublist3r", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"sublist3r on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("sublist3r", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -81,16 +89,14 @@ def run_amass(ui, target, output_dir="output/subdomains", config=None):
     cmd = ["amass", "enum", "-d", target, "-o", output_file, "-passive"]
     if api_key:
         cmd.extend(["-config", api_key])
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("amass", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -99,10 +105,10 @@ def run_amass(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: amass output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("amass", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("amass", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"amass on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("amass", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -113,16 +119,14 @@ def run_assetfinder(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/assetfinder.txt"
     cmd = ["assetfinder", "--subs-only", target]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("assetfinder", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = [line.strip() for line in result.stdout.splitlines() if line.strip() and target in line]
         with open(output_file, "w", encoding="utf-8") as f:
             f.write("\n".join(results))
@@ -130,10 +134,10 @@ def run_assetfinder(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: No valid subdomains found by assetfinder for {target}.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: assetfinder found no valid subdomains for {target}\n")
-        ui.end_tool("assetfinder", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("assetfinder", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"assetfinder on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("assetfinder", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -144,16 +148,14 @@ def run_findomain(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/findomain.txt"
     cmd = ["findomain", "-t", target, "-u", output_file, "--quiet"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("findomain", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -162,10 +164,10 @@ def run_findomain(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: findomain output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("findomain", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("findomain", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"findomain on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("findomain", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -176,16 +178,14 @@ def run_subfinder(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/subfinder.txt"
     cmd = ["subfinder", "-d", target, "-o", output_file, "-silent", "-all"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("subfinder", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -194,10 +194,10 @@ def run_subfinder(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: subfinder output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("subfinder", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("subfinder", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"subfinder on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("subfinder", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -208,16 +208,14 @@ def run_dnsx(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/dnsx.txt"
     cmd = ["dnsx", "-l", f"{output_dir}/final_subdomains.txt", "-o", output_file, "-silent"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("dnsx", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -226,10 +224,10 @@ def run_dnsx(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: dnsx output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("dnsx", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("dnsx", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"dnsx on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("dnsx", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -240,16 +238,14 @@ def run_gotator(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/gotator.txt"
     cmd = ["gotator", "-s", f"{output_dir}/final_subdomains.txt", "-o", output_file, "-silent"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("gotator", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -258,10 +254,10 @@ def run_gotator(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: gotator output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("gotator", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("gotator", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"gotator on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("gotator", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -272,16 +268,14 @@ def run_puredns(ui, target, output_dir="output/subdomains", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/puredns.txt"
     cmd = ["puredns", "resolve", f"{output_dir}/final_subdomains.txt", "-w", output_file, "--resolvers", config["general"]["resolver_file"]] if config and config.get("general", {}).get("resolver_file") else ["puredns", "resolve", f"{output_dir}/final_subdomains.txt", "-w", output_file]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("puredns", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -290,10 +284,10 @@ def run_puredns(ui, target, output_dir="output/subdomains", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: puredns output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("puredns", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("puredns", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"puredns on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("puredns", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -304,16 +298,14 @@ def run_trufflehog(ui, target, output_dir="output/important/secret", config=None
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/trufflehog.txt"
     cmd = ["trufflehog", "git", f"https://{target}", "--regex", "--entropy=True", "--json"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("trufflehog", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = [line.strip() for line in result.stdout.splitlines() if line.strip()]
         with open(output_file, "w", encoding="utf-8") as f:
             f.write("\n".join(results))
@@ -321,10 +313,10 @@ def run_trufflehog(ui, target, output_dir="output/important/secret", config=None
             ui.console.print(f"[red]Warning: No secrets found by trufflehog for {target}.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: trufflehog found no secrets for {target}\n")
-        ui.end_tool("trufflehog", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("trufflehog", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"trufflehog on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("trufflehog", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -335,16 +327,14 @@ def run_katana(ui, target, output_dir="output/important/endpoints", config=None)
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/katana.txt"
     cmd = ["katana", "-u", f"https://{target}", "-o", output_file, "-silent"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("katana", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -353,10 +343,10 @@ def run_katana(ui, target, output_dir="output/important/endpoints", config=None)
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: katana output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("katana", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("katana", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"katana on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("katana", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -367,16 +357,14 @@ def run_ffuf(ui, target, output_dir="output/important/endpoints", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/ffuf.json"
     cmd = ["ffuf", "-u", f"https://{target}/FUZZ", "-w", config["general"]["wordlist_dir"] + "/directories.txt", "-o", output_file, "-silent", "-of", "json"] if config and config.get("general", {}).get("wordlist_dir") else ["ffuf", "-u", f"https://{target}/FUZZ", "-w", "data/wordlists/directories.txt", "-o", output_file, "-silent", "-of", "json"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("ffuf", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -389,10 +377,10 @@ def run_ffuf(ui, target, output_dir="output/important/endpoints", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: ffuf output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("ffuf", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("ffuf", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"ffuf on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("ffuf", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -403,16 +391,14 @@ def run_waybackurls(ui, target, output_dir="output/important/endpoints", config=
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/waybackurls.txt"
     cmd = ["waybackurls", target]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("waybackurls", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = [line.strip() for line in result.stdout.splitlines() if line.strip()]
         with open(output_file, "w", encoding="utf-8") as f:
             f.write("\n".join(results))
@@ -420,48 +406,177 @@ def run_waybackurls(ui, target, output_dir="output/important/endpoints", config=
             ui.console.print(f"[red]Warning: No endpoints found by waybackurls for {target}.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: waybackurls found no endpoints for {target}\n")
-        ui.end_tool("waybackurls", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("waybackurls", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"waybackurls on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("waybackurls", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
             f.write(f"Error running waybackurls on {target}: {e}\n")
         return [], str(e), 0, 0, 0, 0, 0
 
+def _nuclei_targets(target, output_dir):
+    """Alive URLs from httpx (output/subdomains/alive.txt), or just the target."""
+    alive_file = os.path.join(output_dir, "..", "subdomains", "alive.txt")
+    hosts = []
+    if os.path.exists(alive_file):
+        with open(alive_file, "r", encoding="utf-8") as f:
+            hosts = [line.split()[0] for line in f if line.strip()]
+    return list(dict.fromkeys(hosts)) or [target]
+
+def _run_nuclei_shard(cmd, shard, shard_file, timeout, on_finding):
+    """
+    Run nuclei on one shard, parsing -jsonl lines as they arrive.
+
+    Returns (ok, killed, stderr, usage). killed means the shard timed out or
+    died from a signal, which a smaller shard may avoid; any other failure
+    would fail the same way again.
+    """
+    with open(shard_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(shard) + "\n")
+
+    def on_line(line):
+        if line.startswith("{"):
+            try:
+                on_finding(json.loads(line))
+            except ValueError:
+                pass
+
+    try:
+        result, usage = run_tracked(cmd + ["-l", shard_file], timeout=timeout, on_line=on_line, check=False)
+    finally:
+        os.remove(shard_file)
+    killed = usage["timed_out"] or result.returncode < 0
+    return result.returncode == 0 and not killed, killed, result.stderr, usage
+
 def run_nuclei(ui, target, output_dir="output/vulnerabilities", config=None):
+    """
+    Run nuclei over the alive hosts as parallel shards.
+
+    Hosts are split into shards of `shard_size`; `parallel` nuclei processes
+    (0 = CPU count * cpu_budget) take shards as they free up. A shard that
+    exceeds `shard_timeout` or is killed by a signal is split in half and
+    retried, so a slow host ends up alone and is then dropped. A shard that
+    exits non-zero on its own (bad template dir, flag error) is not split;
+    it is reported with its stderr, and if no shard succeeds the tool fails.
+    Completed shards are recorded in nuclei_checkpoint.json; a rerun over
+    the same host list continues from there, and the checkpoint is removed
+    once every shard has finished or been dropped.
+    """
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/vuln_nuclei.json"
-    cmd = ["nuclei", "-u", target, "-t", config["tools"]["nuclei"]["template_dir"], "-o", output_file, "-silent", "-json"] if config and config.get("tools", {}).get("nuclei", {}).get("template_dir") else ["nuclei", "-u", target, "-t", "data/nuclei_templates", "-o", output_file, "-silent", "-json"]
-    process = psutil.Process()
+    checkpoint_file = f"{output_dir}/nuclei_checkpoint.json"
+    nuclei_cfg = (config or {}).get("tools", {}).get("nuclei", {})
+    cmd = ["nuclei", "-t", nuclei_cfg.get("template_dir", "data/nuclei_templates"), "-silent", "-jsonl"]
+    shard_size = max(1, nuclei_cfg.get("shard_size", 25))
+    parallel = nuclei_cfg.get("parallel", 0) or max(1, int((os.cpu_count() or 1) * nuclei_cfg.get("cpu_budget", 0.75)))
+    shard_timeout = nuclei_cfg.get("shard_timeout", 900)
     start_time = time.time()
     ui.start_tool("nuclei", target)
     try:
-        ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        hosts = _nuclei_targets(target, output_dir)
+        hosts_id = hashlib.sha1("\n".join(hosts).encode()).hexdigest()
+        checkpoint = {"hosts": hosts_id, "done": [], "dropped": []}
+        if os.path.exists(checkpoint_file):
+            with open(checkpoint_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("hosts") == hosts_id:
+                checkpoint = saved
+        finished = set(checkpoint["done"]) | set(checkpoint["dropped"])
+        resuming = bool(finished) and os.path.exists(output_file)
+
+        lock = threading.Lock()
+        seen = set()
         results = []
-        if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+
+        def record(data):
+            key = (data.get("template-id"), data.get("matcher-name"), data.get("matched-at"), data.get("host"))
+            if key in seen:
+                return False
+            seen.add(key)
+            results.append(f"{data.get('info', {}).get('name', 'Unknown')}: {data.get('host', '')}")
+            return True
+
+        if resuming:
             with open(output_file, "r", encoding="utf-8") as f:
-                import json
                 for line in f:
                     if line.strip():
-                        data = json.loads(line)
-                        results.append(f"{data.get('info', {}).get('name', 'Unknown')}: {data.get('host', '')}")
-            with open(f"{output_dir}/vuln_nuclei.txt", "w", encoding="utf-8") as f:
-                f.write("\n".join(results))
-        else:
+                        record(json.loads(line))
+        def on_finding(data):
+            with lock:
+                if record(data):
+                    out.write(json.dumps(data) + "\n")
+                    out.flush()
+
+        todo = [h for h in hosts if h not in finished]
+        shards = [todo[i:i + shard_size] for i in range(0, len(todo), shard_size)]
+        ui.console.print(f"[cyan]Executing: {' '.join(cmd)} on {len(todo)} hosts ({len(finished)} done earlier), "
+                         f"{len(shards)} shards x {parallel} parallel[/cyan]")
+        errors = []
+        dropped = []
+        failed = []  # stderr of shards that exited non-zero without being killed
+        succeeded = False
+        usage = {"cpu_seconds": 0.0, "net_sent_kb": 0.0, "net_recv_kb": 0.0, "peak_rss_mb": 0.0}
+        with open(output_file, "a" if resuming else "w", encoding="utf-8") as out, \
+                ThreadPoolExecutor(max_workers=parallel) as pool:
+            running = {}
+            while shards or running:
+                while shards and len(running) < parallel:
+                    shard = shards.pop(0)
+                    shard_file = f"{output_dir}/nuclei_shard_{len(running)}_{time.time_ns()}.txt"
+                    running[pool.submit(_run_nuclei_shard, cmd, shard, shard_file, shard_timeout, on_finding)] = shard
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard = running.pop(future)
+                    ok, killed, stderr, shard_usage = future.result()
+                    for key in ("cpu_seconds", "net_sent_kb", "net_recv_kb"):
+                        usage[key] += shard_usage[key]
+                    usage["peak_rss_mb"] = max(usage["peak_rss_mb"], shard_usage["peak_rss_mb"])
+                    if ok:
+                        succeeded = True
+                        checkpoint["done"].extend(shard)
+                    elif not killed:
+                        # left out of the checkpoint, so a rerun tries these hosts again
+                        failed.append(stderr.strip()[-300:])
+                        if not succeeded and len(failed) >= parallel:
+                            shards.clear()  # every shard so far failed the same way: stop launching more
+                        continue
+                    elif len(shard) > 1:
+                        shards.append(shard[:len(shard) // 2])
+                        shards.append(shard[len(shard) // 2:])
+                        continue
+                    else:
+                        checkpoint["dropped"].extend(shard)
+                        dropped.extend(shard)
+                        errors.append(f"{shard[0]}: {'timed out' if shard_usage['timed_out'] else 'killed'}")
+                    with open(checkpoint_file, "w", encoding="utf-8") as f:
+                        json.dump(checkpoint, f)
+        if failed and not succeeded:
+            raise RuntimeError(f"nuclei exited with an error: {failed[-1]}")
+        if failed:
+            errors.append(f"{len(failed)} shards failed: {failed[-1]}")
+            ui.console.print(f"[yellow]Warning: {len(failed)} nuclei shards failed; rerun to retry them.[/yellow]")
+        elif os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+        stderr = "\n".join(errors)
+        if dropped:
+            ui.console.print(f"[yellow]Warning: nuclei dropped {len(dropped)} hosts (timeout/crash).[/yellow]")
+
+        duration = time.time() - start_time
+        cpu = round(usage["cpu_seconds"] / duration * 100, 1) if duration > 0 else 0
+        # upper bound: `parallel` shards each at the largest shard's peak
+        ram = round(usage["peak_rss_mb"] * parallel * 1024 * 1024 / psutil.virtual_memory().total * 100, 2)
+        with open(f"{output_dir}/vuln_nuclei.txt", "w", encoding="utf-8") as f:
+            f.write("\n".join(results))
+        if not results:
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: nuclei output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("nuclei", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("nuclei", results, duration, stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
-            f.write(f"nuclei on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+            f.write(f"nuclei on {target}: {len(hosts)} hosts, dropped={len(dropped)}, stderr={stderr}\n")
+        return results, stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("nuclei", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
@@ -472,16 +587,14 @@ def run_subjack(ui, target, output_dir="output/vulnerabilities", config=None):
     os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/vuln_subjack.txt"
     cmd = ["subjack", "-w", f"{output_dir}/../subdomains/final_subdomains.txt", "-o", output_file, "-silent"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("subjack", target)
     try:
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         results = []
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -490,47 +603,147 @@ def run_subjack(ui, target, output_dir="output/vulnerabilities", config=None):
             ui.console.print(f"[red]Warning: {output_file} is empty or not created.[/red]")
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: subjack output file {output_file} is empty or not created for {target}\n")
-        ui.end_tool("subjack", results, duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        ui.end_tool("subjack", results, duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"subjack on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
-        return results, result.stderr, duration, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024
+        return results, result.stderr, duration, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"]
     except Exception as e:
         ui.end_tool("subjack", [], stderr=str(e), error=True)
         with open("output/errors/errors.log", "a") as f:
             f.write(f"Error running subjack on {target}: {e}\n")
         return [], str(e), 0, 0, 0, 0, 0
 
+_HOSTNAME_RE = re.compile(r"^[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?(?:\.[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?)*$")
+
+def normalize_subdomain(line, target):
+    """
+    Hostname from one tool output line if it is `target` or lies under it, else None.
+
+    Takes the first field of the line (tools print `host`, `host,ip`, `host [A] [ip]`
+    or URLs), lowercases it and drops wildcards, ports and trailing dots. Scope is
+    matched on label boundaries, so `evil-target.com` is not in scope for `target.com`.
+    """
+    line = line.strip()
+    if not line or line.startswith(("[-]", "#")):
+        return None
+    host = line.split()[0].split(",")[0].lower()
+    if "://" in host:
+        host = urlsplit(host).hostname or ""
+    host = host.split("/")[0]
+    if host.count(":") == 1:
+        host = host.split(":")[0]
+    host = host.strip(".")
+    if host.startswith("*."):
+        host = host[2:]
+    target = target.lower().strip(".")
+    if host != target and not host.endswith("." + target):
+        return None
+    if len(host) > 253 or not _HOSTNAME_RE.match(host):
+        return None
+    return host
+
+class SubdomainFile:
+    """
+    Merged subdomains as stored in final_subdomains.txt.
+
+    Iterating reads the file, so the merged set is never held in memory;
+    len() is the merged count. extend() keeps later additions (asset
+    discovery results) in memory alongside it.
+    """
+
+    def __init__(self, path, count):
+        self.path = path
+        self.count = count
+        self.extra = []
+
+    def __len__(self):
+        return self.count + len(self.extra)
+
+    def __iter__(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+        yield from self.extra
+
+    def extend(self, items):
+        self.extra.extend(items)
+
+def _write_run(tmp_dir, run, runs):
+    path = os.path.join(tmp_dir, f"run_{len(runs)}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(f"{host}\n" for host in sorted(run))
+    runs.append(path)
+
 def merge_results(ui, target, config):
-    """Merge results from multiple tools."""
-    subdomains = set()
+    """
+    Merge results from multiple tools into final_subdomains.txt.
+
+    External merge sort: in-scope hosts are deduplicated in runs of at most
+    `general.merge_run_size` names, each run is sorted and spilled to disk,
+    and the runs are k-way merged (dropping duplicates) into the final file.
+    Memory stays bounded by the run size however large the tool outputs are.
+    """
     output_dir = config.get("general", {}).get("output_dir", "output") if config else "output"
+    run_size = config.get("general", {}).get("merge_run_size", 500000) if config else 500000
     subdomain_dir = f"{output_dir}/subdomains"
     os.makedirs(subdomain_dir, exist_ok=True)
     ui.console.print(f"[cyan]Merging subdomains from {subdomain_dir}...[/cyan]")
-    for file in os.listdir(subdomain_dir):
-        file_path = os.path.join(subdomain_dir, file)
-        if file.endswith(".txt") and file not in ["final_subdomains.txt", "alive.txt", "dead.txt"]:
-            ui.console.print(f"[cyan]Processing {file_path}...[/cyan]")
-            try:
-                if os.path.getsize(file_path) > 0:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and target in line and not line.startswith("[-]"):
-                                subdomains.add(line)
-                else:
-                    ui.console.print(f"[red]Warning: {file_path} is empty.[/red]")
+    tmp_dir = tempfile.mkdtemp(prefix=".merge_", dir=subdomain_dir)
+    runs = []
+    run = set()
+    skipped = 0
+    try:
+        for file in sorted(os.listdir(subdomain_dir)):
+            file_path = os.path.join(subdomain_dir, file)
+            if file.endswith(".txt") and file not in ["final_subdomains.txt", "alive.txt", "dead.txt"]:
+                ui.console.print(f"[cyan]Processing {file_path}...[/cyan]")
+                try:
+                    if os.path.getsize(file_path) > 0:
+                        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                            for line in f:
+                                host = normalize_subdomain(line, target)
+                                if host is None:
+                                    skipped += bool(line.strip())
+                                    continue
+                                run.add(host)
+                                if len(run) >= run_size:
+                                    _write_run(tmp_dir, run, runs)
+                                    run = set()
+                    else:
+                        ui.console.print(f"[red]Warning: {file_path} is empty.[/red]")
+                        with open("output/errors/errors.log", "a") as f:
+                            f.write(f"Warning: {file_path} is empty for {target}\n")
+                except Exception as e:
+                    ui.console.print(f"[red]Error reading {file_path}: {e}[/red]")
                     with open("output/errors/errors.log", "a") as f:
-                        f.write(f"Warning: {file_path} is empty for {target}\n")
-            except Exception as e:
-                ui.console.print(f"[red]Error reading {file_path}: {e}[/red]")
-                with open("output/errors/errors.log", "a") as f:
-                    f.write(f"Error reading {file_path}: {e}\n")
-    final_output = f"{subdomain_dir}/final_subdomains.txt"
-    with open(final_output, "w", encoding="utf-8") as f:
-        f.write("\n".join(sorted(subdomains)))
-    ui.console.print(f"[cyan]Merged {len(subdomains)} subdomains into {final_output}[/cyan]")
-    return list(subdomains)
+                        f.write(f"Error reading {file_path}: {e}\n")
+
+        final_output = f"{subdomain_dir}/final_subdomains.txt"
+        count = 0
+        if runs:
+            _write_run(tmp_dir, run, runs)
+            run = set()
+            files = [open(path, "r", encoding="utf-8") for path in runs]
+            try:
+                with open(final_output, "w", encoding="utf-8") as out:
+                    previous = None
+                    for line in heapq.merge(*files):
+                        if line != previous:
+                            out.write(line)
+                            count += 1
+                            previous = line
+            finally:
+                for f in files:
+                    f.close()
+        else:
+            with open(final_output, "w", encoding="utf-8") as out:
+                out.writelines(f"{host}\n" for host in sorted(run))
+            count = len(run)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    ui.console.print(f"[cyan]Merged {count} subdomains into {final_output} "
+                     f"({len(runs)} sorted runs, {skipped} out-of-scope/invalid lines skipped)[/cyan]")
+    return SubdomainFile(final_output, count)
 
 def check_alive(ui, target, config):
     """Check which subdomains are alive using httpx."""
@@ -538,7 +751,6 @@ def check_alive(ui, target, config):
     input_file = f"{output_dir}/subdomains/final_subdomains.txt"
     output_file = f"{output_dir}/subdomains/alive.txt"
     cmd = ["httpx", "-l", input_file, "-o", output_file, "-silent", "-status-code", "-no-fallback", "-timeout", "15", "-threads", "100", "-http2"]
-    process = psutil.Process()
     start_time = time.time()
     ui.start_tool("httpx", target)
     try:
@@ -556,15 +768,10 @@ def check_alive(ui, target, config):
             return []
 
         ui.console.print(f"[cyan]Executing: {' '.join(cmd)}[/cyan]")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result, usage = run_tracked(cmd)
         duration = time.time() - start_time
-        cpu = process.cpu_percent()
-        ram = process.memory_percent()
-        net = psutil.net_io_counters()
-        subdomains = set()
-        with open(input_file, "r", encoding="utf-8") as f:
-            subdomains = set(line.strip() for line in f if line.strip())
-
+        cpu = usage["cpu_percent"]
+        ram = usage["ram_percent"]
         alive = set()
         if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
             with open(output_file, "r", encoding="utf-8") as f:
@@ -579,11 +786,14 @@ def check_alive(ui, target, config):
             with open("output/errors/errors.log", "a") as f:
                 f.write(f"Warning: httpx output file {output_file} is empty or not created for {target}\n")
 
-        dead = subdomains - alive
+        # final_subdomains.txt is already sorted and unique: stream it against the alive set
         dead_file = f"{output_dir}/subdomains/dead.txt"
-        with open(dead_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(sorted(dead)))
-        ui.end_tool("httpx", list(alive), duration, result.stderr, False, cpu, ram, net.bytes_sent / 1024, net.bytes_recv / 1024)
+        with open(input_file, "r", encoding="utf-8") as src, open(dead_file, "w", encoding="utf-8") as f:
+            for line in src:
+                host = line.strip()
+                if host and host not in alive:
+                    f.write(host + "\n")
+        ui.end_tool("httpx", list(alive), duration, result.stderr, False, cpu, ram, usage["net_sent_kb"], usage["net_recv_kb"])
         with open("output/errors/errors.log", "a") as f:
             f.write(f"httpx on {target}: stdout={result.stdout}, stderr={result.stderr}\n")
         return list(alive)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the mass alive checker against a local aiohttp test server.
+
+Every host is a distinct loopback address (127.0.x.y), all answered by one
+server bound to 0.0.0.0, so no DNS or network is involved. The prober runs
+on an HttpClient built from HTTP_CLIENT_CONFIG with ALIVE_CHECK_CONFIG's
+rate budget, as in a scan. If ``httpx`` is on PATH the same host list is
+also probed with it for comparison.
+
+    python benchmarks/bench_alive_checker.py --hosts 5000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiohttp import web
+
+from config.settings import ALIVE_CHECK_CONFIG, HTTP_CLIENT_CONFIG
+from utils.http_client import HttpClient
+from utils.http_prober import HttpProber
+
+
+async def start_server(port, redirect_every):
+    async def index(request):
+        n = int(request.host.split(":")[0].rsplit(".", 1)[-1])
+        if redirect_every and n % redirect_every == 0:
+            raise web.HTTPFound("/landing")
+        return web.Response(text=f"<html><title>host {n}</title><body>ok</body></html>", content_type="text/html")
+
+    async def landing(request):
+        return web.Response(text="<title>landing</title>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", index)
+    app.router.add_get("/landing", landing)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port, backlog=4096).start()
+    return runner
+
+
+def loopback_hosts(count):
+    return [f"127.0.{i // 250}.{i % 250 + 1}" for i in range(count)]
+
+
+async def bench_prober(hosts, port, concurrency, rate):
+    http = HttpClient(**HTTP_CLIENT_CONFIG)
+    prober = HttpProber(http, concurrency=concurrency, ports=[port], timeout=ALIVE_CHECK_CONFIG['timeout'], rate=rate)
+    start = time.perf_counter()
+    alive = [r async for r in prober.probe_hosts(hosts)]
+    elapsed = time.perf_counter() - start
+    await http.close()
+    return len(alive), prober.probed, elapsed
+
+
+def bench_httpx(hosts, port, concurrency):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(hosts))
+    start = time.perf_counter()
+    out = subprocess.run(
+        ["httpx", "-l", f.name, "-p", str(port), "-silent", "-threads", str(concurrency), "-title", "-fr"],
+        capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    Path(f.name).unlink()
+    return len(out.stdout.splitlines()), elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Alive checker benchmark")
+    parser.add_argument("--hosts", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=ALIVE_CHECK_CONFIG['concurrency'])
+    parser.add_argument("--rate", type=int, default=ALIVE_CHECK_CONFIG['rate'],
+                        help="Probes per second; 0 shares HTTP_CLIENT_CONFIG's global_rate")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--redirect-every", type=int, default=10, help="Every Nth host answers with a 302")
+    args = parser.parse_args()
+
+    hosts = loopback_hosts(args.hosts)
+    runner = await start_server(args.port, args.redirect_every)
+    try:
+        alive, probed, elapsed = await bench_prober(hosts, args.port, args.concurrency, args.rate)
+        print(f"HttpProber: {alive}/{probed} alive in {elapsed:.2f}s ({probed / elapsed:.0f} probes/s)")
+        if shutil.which("httpx"):
+            loop = asyncio.get_running_loop()
+            alive, elapsed = await loop.run_in_executor(None, bench_httpx, hosts, args.port, args.concurrency)
+            print(f"httpx:      {alive} alive in {elapsed:.2f}s ({len(hosts) * 2 / elapsed:.0f} probes/s)")
+        else:
+            print("httpx:      not installed, skipped")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
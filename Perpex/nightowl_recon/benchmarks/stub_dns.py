@@ -0,0 +1,96 @@
+"""
+Minimal UDP stub DNS server for exercising BulkResolver offline.
+
+Records are given as ``{name: [(rdtype, value), ...]}``; ``wildcards`` is a
+set of zones that answer every otherwise unknown name with a fixed address.
+Unknown names get NXDOMAIN.
+"""
+
+import asyncio
+
+import dns.message
+import dns.name
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+
+WILDCARD_IP = "10.255.255.1"
+
+
+class StubDnsServer(asyncio.DatagramProtocol):
+    def __init__(self, records=None, wildcards=None, ttl=300, latency=0.0):
+        self.records = {k.rstrip(".").lower(): v for k, v in (records or {}).items()}
+        self.wildcards = {z.rstrip(".").lower() for z in (wildcards or ())}
+        self.ttl = ttl
+        self.latency = latency
+        self.queries = 0
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        if self.latency:
+            asyncio.get_running_loop().call_later(self.latency, self._answer, data, addr)
+        else:
+            self._answer(data, addr)
+
+    def _lookup(self, name):
+        if name in self.records:
+            return self.records[name]
+        if any(name.endswith("." + zone) for zone in self.wildcards):
+            return [("A", WILDCARD_IP)]
+        return None
+
+    def _answer(self, data, addr):
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name = question.name.to_text().rstrip(".").lower()
+        wanted = dns.rdatatype.to_text(question.rdtype)
+        records = self._lookup(name)
+        if records is None:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        while records:
+            cname = next((v for t, v in records if t == "CNAME"), None)
+            owner = dns.name.from_text(name)
+            if cname:
+                response.answer.append(dns.rrset.from_text(owner, self.ttl, "IN", "CNAME", cname.rstrip(".") + "."))
+                name = cname.rstrip(".").lower()
+                records = self._lookup(name)
+                continue
+            values = [v for t, v in records if t == wanted]
+            if values:
+                response.answer.append(dns.rrset.from_text_list(owner, self.ttl, "IN", wanted, values))
+            break
+        self.transport.sendto(response.to_wire(), addr)
+
+
+async def start_stub_dns(host="127.0.0.1", port=0, **kwargs):
+    """Start the stub server; returns ``(transport, protocol, port)``."""
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: StubDnsServer(**kwargs), local_addr=(host, port)
+    )
+    return transport, protocol, transport.get_extra_info("sockname")[1]
+
+
+def _serve_forever(ready, kwargs):
+    async def main():
+        transport, protocol, port = await start_stub_dns(**kwargs)
+        ready.put(port)
+        await asyncio.Event().wait()
+    asyncio.run(main())
+
+
+def run_stub_dns_process(**kwargs):
+    """Run the stub server in a child process so it does not share the benchmark's CPU.
+
+    Returns ``(process, port)``; terminate the process when done.
+    """
+    import multiprocessing
+    ready = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_serve_forever, args=(ready, kwargs), daemon=True)
+    proc.start()
+    return proc, ready.get(timeout=10)
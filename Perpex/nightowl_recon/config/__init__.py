@@ -13,7 +13,17 @@ __all__ = [
     'SCAN_MODES',
     'TOOL_CATEGORIES',
     'WORKFLOW_PHASES',
+    'STREAMING_CONFIG',
+    'CHECKPOINT_CONFIG',
+    'DELTA_CONFIG',
+    'ADAPTIVE_CONCURRENCY',
     'RESOURCE_LIMITS',
+    'HTTP_CLIENT_CONFIG',
+    'ALIVE_CHECK_CONFIG',
+    'SECRET_SCAN_CONFIG',
+    'DNS_CONFIG',
+    'PORT_SCAN_CONFIG',
+    'NUCLEI_CONFIG',
     'TIMEOUTS',
     'OUTPUT_FORMATS',
     'LOGGING_CONFIG',
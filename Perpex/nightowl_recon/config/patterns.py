@@ -4,10 +4,17 @@ Pattern definitions for NightOwl reconnaissance
 
 import re
 
-# Secret patterns for detection
+# Secret patterns for detection. Optional keys used by utils/secret_scanner.py:
+#   keywords  - literals every match starts with (case-insensitive for (?i));
+#               the pattern is only tried where one of them occurs
+#   full_scan - the pattern can match characters outside
+#               SECRET_SCAN_CONFIG['token_chars'] and has no keywords, so it
+#               is run over the whole text instead of only inside token runs
+#   priority  - where matches of two patterns overlap the higher one wins
 SECRET_PATTERNS = {
     'aws_access_key': {
-        'pattern': r'(?<![A-Z0-9])[A-Z0-9]{20}(?![A-Z0-9])',
+        'pattern': r'(?<![A-Z0-9])(?:AKIA|ASIA|AGPA|AIDA|AROA|AIPA|ANPA|ANVA)[A-Z0-9]{16}(?![A-Z0-9])',
+        'keywords': ['AKIA', 'ASIA', 'AGPA', 'AIDA', 'AROA', 'AIPA', 'ANPA', 'ANVA'],
         'description': 'AWS Access Key ID',
         'severity': 'high',
         'confidence': 'high'
@@ -15,6 +22,7 @@ SECRET_PATTERNS = {
     
     'aws_secret_key': {
         'pattern': r'(?<![A-Za-z0-9/+=])[A-Za-z0-9/+=]{40}(?![A-Za-z0-9/+=])',
+        'priority': 1,
         'description': 'AWS Secret Access Key',
         'severity': 'high',
         'confidence': 'medium'
@@ -22,6 +30,7 @@ SECRET_PATTERNS = {
     
     'jwt_token': {
         'pattern': r'eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*',
+        'keywords': ['eyJ'],
         'description': 'JWT Token',
         'severity': 'medium',
         'confidence': 'high'
@@ -29,6 +38,7 @@ SECRET_PATTERNS = {
     
     'api_key': {
         'pattern': r'(?i)(?:api[_-]?key|apikey)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_-]+)["\']?',
+        'keywords': ['api'],
         'description': 'Generic API Key',
         'severity': 'medium',
         'confidence': 'medium'
@@ -36,6 +46,7 @@ SECRET_PATTERNS = {
     
     'password': {
         'pattern': r'(?i)(?:password|pwd|pass)["\']?\s*[:=]\s*["\']?([^\s"\']+)["\']?',
+        'keywords': ['pass', 'pwd'],
         'description': 'Password',
         'severity': 'high',
         'confidence': 'low'
@@ -43,6 +54,7 @@ SECRET_PATTERNS = {
     
     'private_key': {
         'pattern': r'-----BEGIN (?:RSA |EC |OPENSSH |DSA )?PRIVATE KEY-----',
+        'keywords': ['-----BEGIN'],
         'description': 'Private Key',
         'severity': 'high',
         'confidence': 'high'
@@ -50,6 +62,7 @@ SECRET_PATTERNS = {
     
     'slack_token': {
         'pattern': r'xox[baprs]-[0-9a-zA-Z]{10,48}',
+        'keywords': ['xox'],
         'description': 'Slack Token',
         'severity': 'high',
         'confidence': 'high'
@@ -57,6 +70,7 @@ SECRET_PATTERNS = {
     
     'github_token': {
         'pattern': r'ghp_[0-9a-zA-Z]{36}',
+        'keywords': ['ghp_'],
         'description': 'GitHub Personal Access Token',
         'severity': 'high',
         'confidence': 'high'
@@ -64,6 +78,7 @@ SECRET_PATTERNS = {
     
     'google_api': {
         'pattern': r'AIza[0-9A-Za-z-_]{35}',
+        'keywords': ['AIza'],
         'description': 'Google API Key',
         'severity': 'medium',
         'confidence': 'high'
@@ -71,6 +86,7 @@ SECRET_PATTERNS = {
     
     'stripe_key': {
         'pattern': r'sk_live_[0-9a-zA-Z]{24}',
+        'keywords': ['sk_live_'],
         'description': 'Stripe Live Secret Key',
         'severity': 'high',
         'confidence': 'high'
@@ -78,6 +94,7 @@ SECRET_PATTERNS = {
     
     'mailgun_api': {
         'pattern': r'key-[0-9a-zA-Z]{32}',
+        'keywords': ['key-'],
         'description': 'Mailgun API Key',
         'severity': 'medium',
         'confidence': 'high'
@@ -85,6 +102,7 @@ SECRET_PATTERNS = {
     
     'twilio_key': {
         'pattern': r'SK[0-9a-fA-F]{32}',
+        'keywords': ['SK'],
         'description': 'Twilio API Key',
         'severity': 'medium',
         'confidence': 'high'
@@ -92,6 +110,7 @@ SECRET_PATTERNS = {
     
     'paypal_braintree': {
         'pattern': r'access_token\$production\$[0-9a-z]{16}\$[0-9a-f]{32}',
+        'keywords': ['access_token$production$'],
         'description': 'PayPal Braintree Access Token',
         'severity': 'high',
         'confidence': 'high'
@@ -99,6 +118,7 @@ SECRET_PATTERNS = {
     
     'square_oauth': {
         'pattern': r'sq0atp-[0-9A-Za-z-_]{22}',
+        'keywords': ['sq0atp-'],
         'description': 'Square OAuth Secret',
         'severity': 'high',
         'confidence': 'high'
@@ -106,6 +126,7 @@ SECRET_PATTERNS = {
     
     'square_access': {
         'pattern': r'sq0csp-[0-9A-Za-z-_]{43}',
+        'keywords': ['sq0csp-'],
         'description': 'Square Access Token',
         'severity': 'high',
         'confidence': 'high'
@@ -120,6 +141,7 @@ SECRET_PATTERNS = {
     
     'cert_key': {
         'pattern': r'-----BEGIN CERTIFICATE-----',
+        'keywords': ['-----BEGIN CERTIFICATE-----'],
         'description': 'Certificate',
         'severity': 'low',
         'confidence': 'high'
@@ -127,6 +149,7 @@ SECRET_PATTERNS = {
     
     'ssh_key': {
         'pattern': r'ssh-rsa [A-Za-z0-9+/]+[=]{0,3}',
+        'keywords': ['ssh-rsa '],
         'description': 'SSH Public Key',
         'severity': 'medium',
         'confidence': 'high'
@@ -134,6 +157,7 @@ SECRET_PATTERNS = {
     
     'connection_string': {
         'pattern': r'(?i)(jdbc|mysql|postgresql|oracle|sqlserver)://[^\s]+',
+        'keywords': ['jdbc', 'mysql', 'postgresql', 'oracle', 'sqlserver'],
         'description': 'Database Connection String',
         'severity': 'high',
         'confidence': 'high'
@@ -141,6 +165,7 @@ SECRET_PATTERNS = {
     
     'ftp_credentials': {
         'pattern': r'ftp://[^\s@]+:[^\s@]+@[^\s]+',
+        'keywords': ['ftp://'],
         'description': 'FTP Credentials',
         'severity': 'high',
         'confidence': 'high'
@@ -148,6 +173,7 @@ SECRET_PATTERNS = {
     
     'url_with_auth': {
         'pattern': r'https?://[^\s:@]+:[^\s:@]+@[^\s]+',
+        'keywords': ['http'],
         'description': 'URL with Authentication',
         'severity': 'medium',
         'confidence': 'medium'
@@ -155,6 +181,7 @@ SECRET_PATTERNS = {
     
     'base64_key': {
         'pattern': r'(?i)(?:key|secret|token|password)["\']?\s*[:=]\s*["\']?([A-Za-z0-9+/]{20,}={0,2})["\']?',
+        'keywords': ['key', 'secret', 'token', 'password'],
         'description': 'Base64 Encoded Key',
         'severity': 'medium',
         'confidence': 'low'
@@ -176,6 +203,7 @@ SECRET_PATTERNS = {
     
     'ip_address': {
         'pattern': r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)',
+        'full_scan': True,
         'description': 'IP Address',
         'severity': 'low',
         'confidence': 'high'
@@ -183,6 +211,7 @@ SECRET_PATTERNS = {
     
     'internal_ip': {
         'pattern': r'(?:10\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)|172\.(?:1[6-9]|2[0-9]|3[0-1])\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)|192\.168\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))',
+        'keywords': ['10.', '172.', '192.168.'],
         'description': 'Internal IP Address',
         'severity': 'medium',
         'confidence': 'high'
@@ -190,6 +219,7 @@ SECRET_PATTERNS = {
     
     'email_address': {
         'pattern': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        'full_scan': True,
         'description': 'Email Address',
         'severity': 'low',
         'confidence': 'high'
@@ -197,6 +227,7 @@ SECRET_PATTERNS = {
     
     'domain_name': {
         'pattern': r'(?i)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?',
+        'full_scan': True,
         'description': 'Domain Name',
         'severity': 'low',
         'confidence': 'medium'
@@ -204,6 +235,7 @@ SECRET_PATTERNS = {
     
     'hash_md5': {
         'pattern': r'[a-fA-F0-9]{32}',
+        'priority': 1,
         'description': 'MD5 Hash',
         'severity': 'low',
         'confidence': 'low'
@@ -211,6 +243,7 @@ SECRET_PATTERNS = {
     
     'hash_sha1': {
         'pattern': r'[a-fA-F0-9]{40}',
+        'priority': 2,
         'description': 'SHA1 Hash',
         'severity': 'low',
         'confidence': 'low'
@@ -218,6 +251,7 @@ SECRET_PATTERNS = {
     
     'hash_sha256': {
         'pattern': r'[a-fA-F0-9]{64}',
+        'priority': 3,
         'description': 'SHA256 Hash',
         'severity': 'low',
         'confidence': 'low'
@@ -232,6 +266,7 @@ SECRET_PATTERNS = {
     
     'docker_image': {
         'pattern': r'(?i)(?:docker\.io/)?[a-z0-9_-]+/[a-z0-9_-]+(?::[a-z0-9_.-]+)?',
+        'full_scan': True,
         'description': 'Docker Image',
         'severity': 'low',
         'confidence': 'medium'
@@ -144,6 +144,34 @@ WORKFLOW_PHASES = {
     ]
 }
 
+# Streaming pipeline (--stream): subdomain tools feed per-host consumers
+STREAMING_CONFIG = {
+    'queue_size': 1000,       # bounded per-consumer backlog of hosts
+    'workers_per_tool': 10,   # concurrent hosts processed by each consumer
+    'consumers': [
+        'alive_checker', 'secret_finder', 'endpoint_extractor',
+        'email_extractor', 'name_extractor', 'phone_extractor'
+    ]
+}
+
+# Resume checkpoints: finished tools and finished input items are journaled
+CHECKPOINT_CONFIG = {
+    'interval': 30,            # seconds between checkpoints while a tool is mid-run
+    'bulk_batch_size': 2000    # hosts per journaled batch for bulk tools
+}
+
+# Delta scans (--delta): per-host tools only rescan hosts that are new or whose
+# DNS answers changed since the last completed run; the rest carry over
+DELTA_CONFIG = {
+    'inventory_dir': 'inventory',      # under the output dir: last run's hosts, URLs and results
+    'full_refresh_days': 7,            # rescan everything when the last full scan is older
+    'report_file': 'delta_report.json',
+    'tools': [
+        'nuclei', 'naabu', 'alive_checker', 'secret_finder', 'endpoint_extractor',
+        'email_extractor', 'name_extractor', 'phone_extractor'
+    ]
+}
+
 # Resource limits
 RESOURCE_LIMITS = {
     'max_memory_percent': 85,
@@ -154,6 +182,84 @@ RESOURCE_LIMITS = {
     'max_file_size_mb': 100
 }
 
+# Adaptive (AIMD) limit on concurrently running tools and per-host work units
+ADAPTIVE_CONCURRENCY = {
+    'initial': 20,
+    'min': 2,
+    'max': 64,
+    'increase': 2,             # added per review while work is queued and resources are fine
+    'decrease': 0.5,           # multiplier applied when overloaded
+    'interval': 5,             # seconds between reviews
+    'max_cpu_percent': RESOURCE_LIMITS['max_cpu_percent'],
+    'max_memory_percent': RESOURCE_LIMITS['max_memory_percent'],
+    'max_fd_percent': 80,
+    'max_error_rate': 0.3      # share of failed/timed-out work units in a review window
+}
+
+# Secret scanning (utils/secret_scanner.py); patterns come from config/patterns.py
+SECRET_SCAN_CONFIG = {
+    'chunk_size': 1 << 20,         # characters scanned per window
+    'overlap': 4096,               # longest match guaranteed across window edges
+    'read_chunk': 65536,           # bytes read from the response per step
+    'max_body_bytes': 50 << 20,    # stop reading bodies past this size
+    # patterns without keywords are only tried inside runs of these characters
+    'token_chars': 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789/+=-',
+    'exclude': ['domain_name', 'email_address', 'ip_address', 'docker_image']  # not secrets
+}
+
+# Shared HTTP client (utils/http_client.py); per-host rate comes from --rate-limit
+HTTP_CLIENT_CONFIG = {
+    'global_rate': 500,        # requests per second across all hosts, 0 to disable
+    'connection_limit': 500,   # total pooled sockets
+    'limit_per_host': 6,       # keep-alive sockets reused per host
+    'keepalive_timeout': 30,
+    'dns_cache_ttl': 300
+}
+
+# Mass alive checking (utils/http_prober.py)
+ALIVE_CHECK_CONFIG = {
+    'concurrency': 500,      # in-flight probes; keep <= HTTP_CLIENT_CONFIG connection_limit
+    'rate': 3000,            # probes per second, in place of HTTP_CLIENT_CONFIG global_rate
+                             # (500/s would cap the prober whatever the concurrency); None or 0 = share it
+    'ports': None,           # None = http:80 + https:443, or e.g. [80, 443, 8080, 8443]
+    'timeout': 10,
+    'max_redirects': 5
+}
+
+# Bulk DNS resolution (utils/network_utils.BulkResolver); hosts that do not
+# resolve, or only hit a wildcard, are dropped before alive checks and port scans
+DNS_CONFIG = {
+    'enabled': True,
+    'resolvers': ['1.1.1.1', '8.8.8.8', '9.9.9.9'],   # empty list = system resolv.conf
+    'port': 53,
+    'concurrency': 200,
+    'timeout': 3,
+    'retries': 2,
+    'wildcard_checks': 2,      # random labels probed per parent zone
+    'cache_file': 'dns_cache.json',
+    'negative_ttl': 300
+}
+
+# Native connect scanner (utils/network_utils.AsyncPortScanner), used by the
+# naabu tool when the binary is missing
+PORT_SCAN_CONFIG = {
+    'prefer_binary': True,     # use naabu when it is on PATH
+    'ports': None,             # None = COMMON_PORTS
+    'concurrency': 1000,       # in-flight connects
+    'rate': 1000,              # connection attempts per second across the scan
+    'timeout': 1.5,
+    'retries': 0
+}
+
+# Sharded nuclei runs (utils/nuclei_runner.py) over the resolved host set
+NUCLEI_CONFIG = {
+    'shard_size': 25,          # hosts per nuclei process
+    'parallel': 0,             # processes at once, 0 = CPU count * cpu_budget
+    'cpu_budget': 0.75,
+    'shard_timeout': 900,      # seconds; a slower shard is split, a lone host over it dropped
+    'args': ['-jsonl', '-silent']
+}
+
 # Timeouts
 TIMEOUTS = {
     'tool_execution': 600,
@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit driven by the ResourceMonitor.
+
+    Works like a semaphore whose size changes at runtime. Every ``interval``
+    seconds the limit is reviewed: if CPU, memory or open file descriptors
+    are above their thresholds, or too many recent work units failed or
+    timed out, it is cut by ``decrease``; otherwise, if work was actually
+    waiting on the limit, it grows by ``increase``. Reviews run from a
+    background task started with start(), so the limit still moves while
+    long-running work holds every slot.
+
+    Outcomes come from work units leaving ``async with limiter`` and from
+    anything else that calls record(), such as the HttpClient reporting
+    request timeouts that tools catch themselves.
+    """
+
+    def __init__(
+        self,
+        monitor,
+        initial=20,
+        minimum=2,
+        maximum=64,
+        increase=2,
+        decrease=0.5,
+        interval=5,
+        max_cpu_percent=85,
+        max_memory_percent=85,
+        max_fd_percent=80,
+        max_error_rate=0.3,
+        min_samples=5
+    ):
+        self.monitor = monitor
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.interval = interval
+        self.max_cpu_percent = max_cpu_percent
+        self.max_memory_percent = max_memory_percent
+        self.max_fd_percent = max_fd_percent
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.active = 0
+        self.waiting = 0
+        self.increases = 0
+        self.decreases = 0
+        self.last_reason = ""
+        self._window = {"ok": 0, "errors": 0, "timeouts": 0, "saturated": False}
+        self._reviewed = time.monotonic()
+        self._cond = None
+        self._task = None
+
+    def _condition(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._review_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _review_loop(self):
+        cond = self._condition()
+        while True:
+            await asyncio.sleep(self.interval)
+            async with cond:
+                self._maybe_adjust()
+                cond.notify(max(0, self.limit - self.active))
+
+    async def acquire(self):
+        cond = self._condition()
+        async with cond:
+            if self.active >= self.limit:
+                self._window["saturated"] = True
+                self.waiting += 1
+                try:
+                    await cond.wait_for(lambda: self.active < self.limit)
+                finally:
+                    self.waiting -= 1
+            self.active += 1
+
+    async def release(self):
+        cond = self._condition()
+        async with cond:
+            self.active -= 1
+            self._maybe_adjust()
+            cond.notify(max(0, self.limit - self.active))
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.record()
+        elif not issubclass(exc_type, asyncio.CancelledError):
+            self.record(error=True, timeout=issubclass(exc_type, asyncio.TimeoutError))
+        await self.release()
+
+    def record(self, error=False, timeout=False):
+        """Count the outcome of one work unit for the next review."""
+        if timeout:
+            self._window["timeouts"] += 1
+        elif error:
+            self._window["errors"] += 1
+        else:
+            self._window["ok"] += 1
+
+    def _overload_reason(self):
+        usage = self.monitor.get_usage()
+        if usage.get("cpu_percent", 0) > self.max_cpu_percent:
+            return "cpu"
+        if usage.get("mem_percent", 0) > self.max_memory_percent:
+            return "memory"
+        if usage.get("fd_percent", 0) > self.max_fd_percent:
+            return "file descriptors"
+        w = self._window
+        failed = w["errors"] + w["timeouts"]
+        total = failed + w["ok"]
+        if total >= self.min_samples and failed / total > self.max_error_rate:
+            return "timeouts" if w["timeouts"] >= w["errors"] else "errors"
+        return ""
+
+    def _maybe_adjust(self):
+        now = time.monotonic()
+        if now - self._reviewed < self.interval:
+            return
+        reason = self._overload_reason()
+        if reason:
+            new = max(self.minimum, int(self.limit * self.decrease))
+            if new < self.limit:
+                self.decreases += 1
+        elif self._window["saturated"] or self.waiting:
+            new = min(self.maximum, self.limit + self.increase)
+            if new > self.limit:
+                self.increases += 1
+                reason = "saturated"
+        else:
+            new = self.limit
+        self.limit = new
+        if reason:
+            self.last_reason = reason
+        self._window = {"ok": 0, "errors": 0, "timeouts": 0, "saturated": False}
+        self._reviewed = now
+
+    def stats(self):
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "min": self.minimum,
+            "max": self.maximum,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "last_reason": self.last_reason
+        }
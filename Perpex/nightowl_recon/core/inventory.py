@@ -0,0 +1,130 @@
+import json
+import time
+from pathlib import Path
+
+from core.subdomain_index import normalize_hostname
+
+
+def result_host(item):
+    """
+    Host a tool result belongs to. Results are tagged with ``scanned_host``
+    when journaled; older results fall back to what the tool reported
+    (naabu and nuclei ``host``, which nuclei may give as a URL or
+    ``host:port``, then nuclei ``matched-at``, probers ``domain``).
+    Extractor results such as ``{"email": ...}`` carry no host of their own.
+    """
+    return normalize_hostname(
+        item.get("scanned_host") or item.get("host") or item.get("matched-at")
+        or item.get("domain") or item.get("url")
+    )
+
+
+def diff_sets(previous, current):
+    return {
+        "new": sorted(current - previous),
+        "removed": sorted(previous - current)
+    }
+
+
+class AssetInventory:
+    """
+    What the previous run of a target found, kept between runs for delta scans.
+
+    ``inventory.json`` holds every host with its DNS answers plus the live
+    URLs; ``results/<tool>.jsonl`` holds the per-host tools' results so a
+    delta run can carry them over for hosts it does not rescan. Nothing is
+    overwritten until the current run calls save(), so an interrupted or
+    resumed run still compares against the last completed one.
+    """
+
+    def __init__(self, path, target):
+        self.path = Path(path)
+        self.target = target
+        self.hosts = {}
+        self.urls = set()
+        self.last_full = None
+        self.saved_at = None
+        data = self._load()
+        if data and data.get("target") == target:
+            self.hosts = {h: sorted(ips) for h, ips in data.get("hosts", {}).items()}
+            self.urls = set(data.get("urls", []))
+            self.last_full = data.get("last_full")
+            self.saved_at = data.get("saved_at")
+
+    def _load(self):
+        try:
+            with open(self.path / "inventory.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def __bool__(self):
+        return self.saved_at is not None
+
+    def needs_full_refresh(self, max_age_days):
+        """No previous run, or the last full scan is older than ``max_age_days``."""
+        if not self or not self.last_full:
+            return True
+        return time.time() - self.last_full >= max_age_days * 86400
+
+    def is_unchanged(self, host, ips):
+        """Host was seen last run with the same DNS answers (``ips`` None = not resolved)."""
+        if host not in self.hosts:
+            return False
+        return ips is None or sorted(ips) == self.hosts[host]
+
+    def previous_results(self, tool):
+        """Last run's results of ``tool``, grouped by host."""
+        by_host = {}
+        try:
+            with open(self.path / "results" / f"{tool}.jsonl") as f:
+                for line in f:
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        continue
+                    by_host.setdefault(result_host(item), []).append(item)
+        except OSError:
+            pass
+        return by_host
+
+    def diff(self, hosts, urls):
+        """New/removed/changed hosts and new/removed URLs against the previous run."""
+        report = diff_sets(set(self.hosts), set(hosts))
+        report["changed"] = sorted(
+            h for h, ips in hosts.items()
+            if h in self.hosts and ips is not None and sorted(ips) != self.hosts[h]
+        )
+        return {
+            "target": self.target,
+            "previous_scan": self.saved_at,
+            "hosts": report,
+            "urls": diff_sets(self.urls, set(urls))
+        }
+
+    def save(self, hosts, urls, results, full):
+        """Replace the snapshot with this run's hosts, URLs and per-tool results."""
+        now = time.time()
+        results_dir = self.path / "results"
+        results_dir.mkdir(parents=True, exist_ok=True)
+        for tool, items in results.items():
+            tmp = results_dir / f"{tool}.jsonl.tmp"
+            with open(tmp, "w") as f:
+                for item in items:
+                    f.write(json.dumps(item, default=str) + "\n")
+            tmp.replace(results_dir / f"{tool}.jsonl")
+        self.hosts = {h: sorted(ips or []) for h, ips in hosts.items()}
+        self.urls = set(urls)
+        self.saved_at = now
+        if full:
+            self.last_full = now
+        tmp = self.path / "inventory.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump({
+                "target": self.target,
+                "saved_at": self.saved_at,
+                "last_full": self.last_full,
+                "hosts": self.hosts,
+                "urls": sorted(self.urls)
+            }, f)
+        tmp.replace(self.path / "inventory.json")
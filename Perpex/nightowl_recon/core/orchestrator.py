@@ -1,11 +1,23 @@
 import asyncio
+import json
+import time
 from datetime import datetime
 from pathlib import Path
 from utils.error_handler import ErrorHandler
 from core.state_manager import StateManager
 from core.resource_monitor import ResourceMonitor
-from core.workflow_engine import WorkflowEngine
+from core.adaptive_limiter import AdaptiveLimiter
+from core.workflow_engine import WorkflowEngine, Phase
+from core.pipeline import StreamingPipeline
+from core.subdomain_index import SubdomainIndex
+from core.inventory import AssetInventory, result_host
 from utils.file_manager import FileManager
+from utils.http_client import HttpClient
+from utils.network_utils import BulkResolver, DnsCache
+from config.settings import (
+    TOOL_CATEGORIES, STREAMING_CONFIG, HTTP_CLIENT_CONFIG, SECURITY_CONFIG, DNS_CONFIG,
+    CHECKPOINT_CONFIG, ADAPTIVE_CONCURRENCY, DELTA_CONFIG
+)
 
 # Import all scanner classes explicitly
 from tools.subdomain.amass import AmassScanner
@@ -39,7 +51,10 @@ class NightOwlOrchestrator:
         resume: bool = False,
         custom_tools=None,
         config_file: str = None,
-        verbose: bool = False
+        verbose: bool = False,
+        streaming: bool = False,
+        delta: bool = False,
+        full_refresh: bool = False
     ):
         self.target = target
         self.mode = mode
@@ -50,16 +65,67 @@ class NightOwlOrchestrator:
         self.custom_tools = custom_tools or []
         self.config_file = config_file
         self.verbose = verbose
+        self.streaming = streaming
 
         self.scan_results = {}
         self.failed_tools = {}
         self.current_phase = 0
+        self.restored_counts = {}
+        self.completed_tools = set()
+        self.processed = {}        # tool -> input items already handled (for resume)
+        self.planned_tools = set()
+        self.processed_log = {}    # tool -> the same items, in order, for the journal
+        self._last_checkpoint = time.monotonic()
+        self.subdomain_index = SubdomainIndex(self.target)
 
         self.state_manager = StateManager(self.output_dir)
         self.resource_monitor = ResourceMonitor()
+        self.limiter = AdaptiveLimiter(
+            self.resource_monitor,
+            initial=ADAPTIVE_CONCURRENCY['initial'],
+            minimum=ADAPTIVE_CONCURRENCY['min'],
+            maximum=ADAPTIVE_CONCURRENCY['max'],
+            increase=ADAPTIVE_CONCURRENCY['increase'],
+            decrease=ADAPTIVE_CONCURRENCY['decrease'],
+            interval=ADAPTIVE_CONCURRENCY['interval'],
+            max_cpu_percent=ADAPTIVE_CONCURRENCY['max_cpu_percent'],
+            max_memory_percent=ADAPTIVE_CONCURRENCY['max_memory_percent'],
+            max_fd_percent=ADAPTIVE_CONCURRENCY['max_fd_percent'],
+            max_error_rate=ADAPTIVE_CONCURRENCY['max_error_rate']
+        )
         self.file_manager = FileManager(self.output_dir)
         self.workflow_engine = WorkflowEngine(self.mode, self.custom_tools)
         self.error_handler = ErrorHandler(self.output_dir)
+        self.http_client = HttpClient(
+            rate_limit=self.rate_limit,
+            verify_ssl=SECURITY_CONFIG['verify_ssl'],
+            headers={'User-Agent': SECURITY_CONFIG['user_agent']},
+            **HTTP_CLIENT_CONFIG
+        )
+        # request timeouts that tools swallow still reach the concurrency limit
+        self.http_client.limiter = self.limiter
+        self.dns_records = {}
+        self.dns_resolver = None
+        if DNS_CONFIG['enabled']:
+            self.dns_resolver = BulkResolver(
+                resolvers=DNS_CONFIG['resolvers'],
+                port=DNS_CONFIG['port'],
+                concurrency=DNS_CONFIG['concurrency'],
+                timeout=DNS_CONFIG['timeout'],
+                retries=DNS_CONFIG['retries'],
+                wildcard_checks=DNS_CONFIG['wildcard_checks'],
+                cache=DnsCache(self.output_dir / DNS_CONFIG['cache_file'], DNS_CONFIG['negative_ttl'])
+            )
+
+        # Delta scans compare against the last completed run of this target
+        self.inventory = None
+        self.full_scan = True
+        self.delta_report = None
+        self._previous_results = {}
+        self.delta_counts = {}     # tool -> {"rescanned": n, "carried_over": n} hosts
+        if delta:
+            self.inventory = AssetInventory(self.output_dir / DELTA_CONFIG['inventory_dir'], self.target)
+            self.full_scan = full_refresh or self.inventory.needs_full_refresh(DELTA_CONFIG['full_refresh_days'])
 
         self.tools = {}
         self._initialize_tools()
@@ -94,32 +160,58 @@ class NightOwlOrchestrator:
         for name, cls in tool_classes.items():
             try:
                 self.tools[name] = cls(timeout=self.timeout, rate_limit=self.rate_limit)
+                self.tools[name].http = self.http_client
+                self.tools[name].dns_records = self.dns_records
             except Exception as e:
                 self.failed_tools[name] = str(e)
                 self.error_handler.log_error(name, f"Initialization error: {e}", self.target)
 
     def _restore_previous_state(self):
-        state = self.state_manager.load_state()
-        self.scan_results = state.get("scan_results", {})
+        state = self.state_manager.load_state() or {}
         self.current_phase = state.get("current_phase", 0)
+        self.completed_tools = set(state.get("completed_tools", []))
+        if "scan_results" in state:
+            # single-blob checkpoint from an older version; re-journaled on the next save
+            self.scan_results = state["scan_results"]
+            self.completed_tools |= set(self.scan_results)
+            self._index_subdomains(self.scan_results)
+            return
+        # Results stay on disk; only the subdomain index is rebuilt, by streaming the journal
+        self.restored_counts = state.get("result_counts", {})
+        for name in self.restored_counts:
+            if name in TOOL_CATEGORIES['subdomain']:
+                self._index_subdomains({name: self.state_manager.iter_results(name)})
+        for name in self.tools:
+            if name not in self.completed_tools:
+                done = set(self.state_manager.iter_processed(name))
+                if done:
+                    self.processed[name] = done
 
     async def run(self):
         self.resource_monitor.start()
-        phases = self.workflow_engine.get_phases()
-        for idx, phase in enumerate(phases, start=1):
-            self.current_phase = idx
-            if self.resume and idx <= self.current_phase:
-                continue
-            await self._run_phase(phase)
-            self.state_manager.save_state({
-                "current_phase": self.current_phase,
-                "scan_results": self.scan_results
-            })
-        self.resource_monitor.stop()
+        self.limiter.start()
+        try:
+            phases = self.workflow_engine.get_phases()
+            self.planned_tools = {name for phase in phases for name in phase.tools}
+            if self.streaming:
+                phases = await self._run_streaming(phases)
+            for idx, phase in enumerate(phases, start=1):
+                self.current_phase = idx
+                pending = [name for name in phase.tools if name not in self.completed_tools]
+                if not pending:
+                    continue
+                await self._run_phase(Phase(phase.name, pending, phase.description, phase.parallel))
+                await self._save_subdomain_index()
+                self.save_state()
+            if self.inventory is not None:
+                self._update_inventory()
+        finally:
+            await self.limiter.stop()
+            await self.http_client.close()
+            self.resource_monitor.stop()
         self._final_summary()
 
     async def _run_phase(self, phase):
-        semaphore = asyncio.Semaphore(20)
         tasks = []
 
         # Ensure each tool has an entry even if it returns no results
@@ -128,13 +220,20 @@ class NightOwlOrchestrator:
 
         async def run_tool(name):
             try:
-                async with semaphore:
+                async with self.limiter:
                     tool = self.tools.get(name)
                     if not tool:
                         raise RuntimeError("Tool not initialized")
-                    results = await tool.scan(self.target)
+                    self.start_tool(name)
+                    if hasattr(tool, "stream_hosts") and len(self.subdomain_index):
+                        # writes its own result files, including results from before a resume
+                        results = await self._run_bulk_tool(name, tool)
+                    else:
+                        results = await tool.scan(self.target)
+                        await self.file_manager.save_tool_results(name, results)
                     self.scan_results[name] = results
-                    await self.file_manager.save_tool_results(name, results)
+                    self._index_subdomains({name: results})
+                    self.complete_tool(name)
             except Exception as e:
                 self.failed_tools[name] = str(e)
                 self.error_handler.log_error(name, str(e), self.target)
@@ -144,6 +243,183 @@ class NightOwlOrchestrator:
 
         await asyncio.gather(*tasks)
 
+    async def _run_bulk_tool(self, name, tool):
+        """Feed every unique host to a bulk-capable tool, writing results as JSONL as they arrive.
+
+        Hosts go in batches; each finished batch is journaled so a resumed
+        scan picks up with the next one. Returns only this run's results; the
+        result files also hold those journaled before a resume.
+        """
+        results = self.scan_results[name] = []
+        done = self.processed.get(name, set())
+        writer = self.file_manager.open_jsonl_stream(name, append=bool(done))
+        json_writer = self.file_manager.open_tool_stream(name)
+        # replayed before this run journals anything of its own; results for
+        # hosts of an interrupted batch are left out, those hosts run again
+        for old in self.state_manager.iter_results(name):
+            host = result_host(old)
+            if not host or host in done:
+                json_writer.write(old)
+        batch_size = CHECKPOINT_CONFIG['bulk_batch_size']
+        try:
+            hosts = await self._resolved_hosts(self.subdomain_index.hosts())
+            hosts = [h for h in hosts if h not in done]
+            unchanged = [h for h in hosts if self.delta_skip(name, h)]
+            for item in self.carry_over(name, unchanged):
+                results.append(item)
+                writer.write(item)
+                json_writer.write(item)
+            if unchanged:
+                self.mark_processed(name, unchanged)
+                skipped = set(unchanged)
+                hosts = [h for h in hosts if h not in skipped]
+            self.count_delta(name, "carried_over", len(unchanged))
+            self.count_delta(name, "rescanned", len(hosts))
+            tool.on_hosts_done = lambda done_hosts: self.mark_processed(name, done_hosts)
+            for start in range(0, len(hosts), batch_size):
+                batch = hosts[start:start + batch_size]
+                async for item in tool.stream_hosts(batch):
+                    host = result_host(item)
+                    if host:
+                        item.setdefault("scanned_host", host)
+                    results.append(item)
+                    writer.write(item)
+                    json_writer.write(item)
+                marked = self.processed.get(name, set())
+                self.mark_processed(name, [h for h in batch if h not in marked])
+        finally:
+            writer.close()
+            json_writer.close()
+        return results
+
+    def start_tool(self, name):
+        """Drop journaled results of a tool that restarts from scratch (no resumable progress)."""
+        if name not in self.processed:
+            self.state_manager.reset_segment(name)
+
+    def complete_tool(self, name):
+        self.completed_tools.add(name)
+        self.save_state()
+
+    def mark_processed(self, name, items):
+        self.processed.setdefault(name, set()).update(items)
+        self.processed_log.setdefault(name, []).extend(items)
+        if time.monotonic() - self._last_checkpoint >= CHECKPOINT_CONFIG['interval']:
+            self.save_state()
+
+    def delta_skip(self, name, host):
+        """True when a delta scan can reuse ``name``'s previous results for ``host``."""
+        if self.full_scan or name not in DELTA_CONFIG['tools']:
+            return False
+        record = self.dns_records.get(host)
+        ips = record["a"] + record["aaaa"] if record else None
+        return self.inventory.is_unchanged(host, ips)
+
+    def count_delta(self, name, key, n=1):
+        if self.inventory is not None and name in DELTA_CONFIG['tools']:
+            counts = self.delta_counts.setdefault(name, {"rescanned": 0, "carried_over": 0})
+            counts[key] += n
+
+    def carry_over(self, name, hosts):
+        """Previous run's results of ``name`` for hosts the delta scan skips."""
+        if name not in self._previous_results:
+            self._previous_results[name] = self.inventory.previous_results(name) if self.inventory else {}
+        previous = self._previous_results[name]
+        for host in hosts:
+            yield from previous.get(host, [])
+
+    def _update_inventory(self):
+        """Write the delta report and make this run the baseline for the next one."""
+        hosts = {}
+        for host in self.subdomain_index.hosts():
+            record = self.dns_records.get(host)
+            hosts[host] = record["a"] + record["aaaa"] if record else None
+        urls = [
+            item["url"] for item in self.state_manager.iter_results("alive_checker")
+            if item.get("url")
+        ]
+        self.delta_report = self.inventory.diff(hosts, urls)
+        self.delta_report["full_scan"] = self.full_scan
+        self.delta_report["tools"] = self.delta_counts
+        results = {
+            name: self.state_manager.iter_results(name) for name in DELTA_CONFIG['tools']
+            if name in self.completed_tools and name not in self.failed_tools
+        }
+        incomplete = [
+            name for name in DELTA_CONFIG['tools']
+            if name in self.planned_tools and name not in results
+        ]
+        if incomplete:
+            # The hosts this run had to rescan were not fully scanned, so they
+            # keep their previous entry (or stay out of the baseline if new) and
+            # the next delta run picks them up again.
+            for host, ips in list(hosts.items()):
+                if not self.inventory.is_unchanged(host, ips):
+                    if host in self.inventory.hosts:
+                        hosts[host] = self.inventory.hosts[host]
+                    else:
+                        del hosts[host]
+            self.delta_report["incomplete_tools"] = incomplete
+        with open(self.output_dir / DELTA_CONFIG['report_file'], "w") as f:
+            json.dump(self.delta_report, f, indent=2)
+        self.inventory.save(hosts, urls, results, self.full_scan and not incomplete)
+
+    async def _resolved_hosts(self, hosts):
+        """Resolve hosts not looked up yet; return only those with real, non-wildcard records."""
+        if not self.dns_resolver:
+            return list(hosts)
+        pending = [h for h in hosts if h not in self.dns_records]
+        if pending:
+            async for record in self.dns_resolver.resolve_many(pending):
+                self.dns_records[record["host"]] = record
+            await self.save_dns_records()
+        return [h for h in hosts if BulkResolver.is_usable(self.dns_records[h])]
+
+    async def save_dns_records(self):
+        await self.file_manager.save_tool_results("dns_resolution", list(self.dns_records.values()))
+        self.dns_resolver.cache.save()
+
+    async def _run_streaming(self, phases):
+        """Run subdomain tools and their per-host consumers as one pipeline.
+
+        Returns the phases left over, with the streamed tools removed.
+        """
+        planned = [name for phase in phases for name in phase.tools if name not in self.completed_tools]
+        producers = [name for name in planned if name in TOOL_CATEGORIES['subdomain']]
+        consumers = [name for name in planned if name in STREAMING_CONFIG['consumers']]
+        if not producers:
+            return phases
+        pipeline = StreamingPipeline(
+            self,
+            producers,
+            consumers,
+            queue_size=STREAMING_CONFIG['queue_size'],
+            workers=STREAMING_CONFIG['workers_per_tool']
+        )
+        await pipeline.run()
+        await self._save_subdomain_index()
+        if self.dns_resolver:
+            await self.save_dns_records()
+        self.save_state()
+        streamed = set(producers) | set(consumers)
+        remaining = []
+        for phase in phases:
+            tools = [name for name in phase.tools if name not in streamed]
+            if tools:
+                remaining.append(Phase(phase.name, tools, phase.description, phase.parallel))
+        return remaining
+
+    def _index_subdomains(self, results_by_tool):
+        for name, results in results_by_tool.items():
+            if name in TOOL_CATEGORIES['subdomain']:
+                self.subdomain_index.add_many((r.get("domain") for r in results), name)
+
+    async def _save_subdomain_index(self):
+        if not len(self.subdomain_index):
+            return
+        await self.file_manager.save_combined_results("subdomains", self.subdomain_index.hosts())
+        await self.file_manager.save_tool_results("subdomain_index", self.subdomain_index.to_dict())
+
     def _final_summary(self):
         duration = (datetime.now() - self.scan_start_time).total_seconds()
         print(f"Scan complete in {duration:.1f}s; Completed: {len(self.scan_results)}; Failed: {len(self.failed_tools)}")
@@ -151,14 +427,17 @@ class NightOwlOrchestrator:
     def save_state(self):
         self.state_manager.save_state({
             "current_phase": self.current_phase,
-            "scan_results": self.scan_results
+            "completed_tools": sorted(self.completed_tools),
+            "scan_results": self.scan_results,
+            "processed_inputs": self.processed_log
         })
+        self._last_checkpoint = time.monotonic()
 
     def get_scan_statistics(self):
         elapsed = (datetime.now() - self.scan_start_time).total_seconds()
         total_phases = len(self.workflow_engine.get_phases())
         total_tools = len(self.tools)
-        completed = len(self.scan_results)
+        completed = len(self.completed_tools)
         failed = len(self.failed_tools)
         overall_progress = (completed / total_tools * 100) if total_tools else 0.0
         return {
@@ -166,11 +445,14 @@ class NightOwlOrchestrator:
             "mode": self.mode,
             "overall_progress": overall_progress,
             "resource_usage": self.resource_monitor.get_usage(),
+            "concurrency": self.limiter.stats(),
             "current_phase": self.current_phase,
             "total_phases": total_phases,
             "elapsed_time": f"{elapsed:.1f}s",
             "completed_tools": completed,
-            "failed_tools": failed
+            "failed_tools": failed,
+            "unique_subdomains": len(self.subdomain_index),
+            "resolved_hosts": sum(1 for r in self.dns_records.values() if BulkResolver.is_usable(r))
         }
 
     def get_failed_tools(self):
@@ -0,0 +1,154 @@
+import asyncio
+
+_DONE = object()
+
+
+class StreamingPipeline:
+    """
+    Runs subdomain producers and per-host consumer tools concurrently.
+
+    Every host a producer emits goes through the orchestrator's
+    SubdomainIndex; hosts new to the index are pushed onto one bounded queue
+    per consumer, so alive checks and extractors start on the first subdomain
+    instead of waiting for the slowest enumerator to finish. When the
+    orchestrator has a DNS resolver, hosts pass through a resolution stage
+    first and only those with real, non-wildcard records reach consumers.
+
+    On resume, finished producers are skipped, hosts already in the index
+    are replayed to the consumers, and each consumer skips the hosts it
+    had already handled. Per-host work units share the orchestrator's
+    adaptive concurrency limit. In a delta scan, hosts unchanged since the
+    last run get their previous results instead of a rescan.
+    """
+
+    def __init__(self, orchestrator, producers, consumers, queue_size=1000, workers=10):
+        self.orchestrator = orchestrator
+        self.producers = list(producers)
+        self.consumers = list(consumers)
+        self.queue_size = queue_size
+        self.workers = workers
+        self.queues = {}
+        self.writers = {}
+        self.resolve_queue = None
+
+    async def run(self):
+        orch = self.orchestrator
+        for name in self.producers + self.consumers:
+            orch.scan_results.setdefault(name, [])
+            orch.start_tool(name)
+        self.queues = {name: asyncio.Queue(maxsize=self.queue_size) for name in self.consumers}
+        workers = [
+            asyncio.create_task(self._consume(name, queue))
+            for name, queue in self.queues.items()
+            for _ in range(self.workers)
+        ]
+        resolver = orch.dns_resolver
+        if resolver:
+            self.resolve_queue = asyncio.Queue(maxsize=self.queue_size)
+            resolvers = [asyncio.create_task(self._resolve(resolver)) for _ in range(resolver.concurrency)]
+            workers += resolvers
+        try:
+            for host in orch.subdomain_index.hosts():
+                await self._dispatch(host)
+            await self._publish(orch.target, "target")
+            await asyncio.gather(*(self._produce(name) for name in self.producers))
+            if resolver:
+                for _ in resolvers:
+                    await self.resolve_queue.put(_DONE)
+                await asyncio.gather(*resolvers)
+            for queue in self.queues.values():
+                for _ in range(self.workers):
+                    await queue.put(_DONE)
+            await asyncio.gather(*workers)
+            for name in self.consumers:
+                if name not in orch.failed_tools:
+                    orch.complete_tool(name)
+        finally:
+            for task in workers:
+                task.cancel()
+            for writer in self.writers.values():
+                writer.close()
+
+    def _record(self, name, item, host=None):
+        if host and isinstance(item, dict):
+            # what a delta scan groups previous results by, since extractors report no host
+            item.setdefault("scanned_host", host)
+        self.orchestrator.scan_results[name].append(item)
+        if name not in self.writers:
+            writer = self.writers[name] = self.orchestrator.file_manager.open_tool_stream(name)
+            # a resumed tool's file must still hold what it found before the checkpoint
+            for old in self.orchestrator.state_manager.iter_results(name):
+                writer.write(old)
+        self.writers[name].write(item)
+
+    async def _publish(self, name, source):
+        host = self.orchestrator.subdomain_index.add(name, source)
+        if host:
+            await self._dispatch(host)
+
+    async def _dispatch(self, host):
+        if self.resolve_queue:
+            await self.resolve_queue.put(host)
+        else:
+            await self._fan_out(host)
+
+    async def _fan_out(self, host):
+        for queue in self.queues.values():
+            await queue.put(host)
+
+    async def _resolve(self, resolver):
+        orch = self.orchestrator
+        while True:
+            host = await self.resolve_queue.get()
+            if host is _DONE:
+                return
+            try:
+                record = await resolver.resolve(host)
+            except Exception as e:
+                orch.error_handler.log_error("dns", str(e), host)
+                continue
+            orch.dns_records[host] = record
+            if resolver.is_usable(record):
+                await self._fan_out(host)
+
+    async def _produce(self, name):
+        orch = self.orchestrator
+        try:
+            tool = orch.tools.get(name)
+            if not tool:
+                raise RuntimeError("Tool not initialized")
+            async for item in tool.stream(orch.target):
+                self._record(name, item)
+                await self._publish(item.get("domain"), name)
+            orch.complete_tool(name)
+        except Exception as e:
+            orch.failed_tools[name] = str(e)
+            orch.error_handler.log_error(name, str(e), orch.target)
+
+    async def _consume(self, name, queue):
+        orch = self.orchestrator
+        tool = orch.tools.get(name)
+        while True:
+            host = await queue.get()
+            if host is _DONE:
+                return
+            if not tool:
+                orch.failed_tools[name] = "Tool not initialized"
+                continue
+            if host in orch.processed.get(name, ()):
+                continue
+            if orch.delta_skip(name, host):
+                for item in orch.carry_over(name, [host]):
+                    self._record(name, item, host)
+                orch.mark_processed(name, [host])
+                orch.count_delta(name, "carried_over")
+                continue
+            orch.count_delta(name, "rescanned")
+            try:
+                async with orch.limiter:
+                    async for item in tool.stream(host):
+                        self._record(name, item, host)
+            except Exception as e:
+                orch.error_handler.log_error(name, str(e), host)
+                continue
+            orch.mark_processed(name, [host])
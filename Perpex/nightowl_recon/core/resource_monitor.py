@@ -2,12 +2,27 @@ import psutil
 import threading
 import time
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _fd_limit():
+    if resource is None:
+        return 0
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    return soft if soft != resource.RLIM_INFINITY else 0
+
 class ResourceMonitor:
     def __init__(self):
         self.cpu_percent = 0
         self.mem_percent = 0
         self.network_bytes = (0, 0)
+        self.open_fds = 0
+        self.fd_limit = _fd_limit()
         self.monitoring = False
+        self._process = psutil.Process()
 
     def start(self):
         if not self.monitoring:
@@ -29,14 +44,29 @@ class ResourceMonitor:
             self.mem_percent = psutil.virtual_memory().percent
             net = psutil.net_io_counters()
             self.network_bytes = (net.bytes_sent, net.bytes_recv)
+            self.open_fds = self._count_fds()
             time.sleep(1)
 
+    def _count_fds(self):
+        try:
+            if hasattr(self._process, "num_fds"):
+                return self._process.num_fds()
+            return self._process.num_handles()
+        except psutil.Error:
+            return self.open_fds
+
+    @property
+    def fd_percent(self):
+        return self.open_fds / self.fd_limit * 100 if self.fd_limit else 0
+
     def get_usage(self):
         return {
             "cpu_percent": self.cpu_percent,
             "mem_percent": self.mem_percent,
-            "network_bytes": self.network_bytes
+            "network_bytes": self.network_bytes,
+            "open_fds": self.open_fds,
+            "fd_percent": self.fd_percent
         }
 
     def can_execute_tool(self):
-        return self.cpu_percent < 80 and self.mem_percent < 80
+        return self.cpu_percent < 80 and self.mem_percent < 80 and self.fd_percent < 80
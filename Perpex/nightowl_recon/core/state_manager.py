@@ -1,26 +1,168 @@
+import gzip
 import json
+import os
 import zlib
 from pathlib import Path
 from filelock import FileLock
 
 class StateManager:
-    def __init__(self, output_dir):
-        self.state_file = Path(output_dir) / ".nightowl.state"
-        self.lock_file = self.state_file.with_suffix(".lock")
+    """
+    Append-only scan journal.
+
+    Scan metadata lives in ``meta.json``. Each checkpoint appends only the
+    results a tool gained since the previous checkpoint, as a new gzip JSONL
+    chunk under ``segments/<tool>/``, so its cost tracks new results rather
+    than the whole scan. Input items a tool has finished with are journaled
+    the same way (``processed_inputs``) so a resumed scan can skip them.
+    Chunks are recorded in the metadata only after they are fully written,
+    which makes a crash mid-checkpoint harmless. Every ``compact_every``
+    chunks a tool's segment is merged back into one file.
+    """
+
+    def __init__(self, output_dir, compact_every=32):
+        self.state_dir = Path(output_dir) / ".nightowl_journal"
+        self.segment_dir = self.state_dir / "segments"
+        self.meta_file = self.state_dir / "meta.json"
+        self.lock_file = self.state_dir.with_suffix(".lock")
+        self.legacy_file = Path(output_dir) / ".nightowl.state"
+        self.compact_every = compact_every
+        self.segments = {}
+        self._next_chunk = 0
+        self._released = {}  # tool -> chunks dropped from a segment, deleted at the next checkpoint
+
+    def _chunk_path(self, tool, chunk):
+        return self.segment_dir / tool / chunk
+
+    def _new_chunk(self, tool):
+        (self.segment_dir / tool).mkdir(parents=True, exist_ok=True)
+        self._next_chunk += 1
+        return f"{self._next_chunk:08d}.jsonl.gz"
+
+    def _write_chunk(self, tool, lines):
+        chunk = self._new_chunk(tool)
+        with gzip.open(self._chunk_path(tool, chunk), "wt", compresslevel=6) as f:
+            for line in lines:
+                f.write(line)
+        return chunk
+
+    def _drop_chunks(self, tool, chunks):
+        for chunk in chunks:
+            self._chunk_path(tool, chunk).unlink(missing_ok=True)
+
+    def _append(self, tool, items):
+        seg = self.segments.setdefault(tool, {"count": 0, "base": 0, "chunks": []})
+        # ``base`` results were journaled by an earlier run and are not in ``items``
+        offset = seg["count"] - seg.get("base", 0)
+        if len(items) < offset:
+            # the tool was re-run and its results replaced; start the segment over
+            self.reset_segment(tool)
+            offset = 0
+        new = items[offset:]
+        if not new:
+            return
+        seg["chunks"].append(self._write_chunk(tool, (json.dumps(i, default=str) + "\n" for i in new)))
+        seg["count"] += len(new)
+
+    def reset_segment(self, tool):
+        """Forget a tool's journaled results before it runs again from scratch.
+
+        The chunk files stay on disk until a checkpoint has written metadata
+        that no longer lists them, so a crash before then leaves the old
+        journal readable.
+        """
+        for name in (tool, f"{tool}.inputs"):
+            seg = self.segments.get(name)
+            if seg:
+                self._released.setdefault(name, []).extend(seg["chunks"])
+                seg.update(count=0, base=0, chunks=[])
+
+    def _compact(self, tool):
+        seg = self.segments[tool]
+        if len(seg["chunks"]) < 2:
+            return []
+        old = seg["chunks"]
+        seg["chunks"] = [self._write_chunk(tool, self._iter_lines(tool, old))]
+        return old
+
+    def _write_meta(self, meta):
+        tmp = self.meta_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta, default=str))
+        os.replace(tmp, self.meta_file)
+
+    def _checkpoint(self, meta, compact_all=False):
+        stale = {tool: list(chunks) for tool, chunks in self._released.items()}
+        for tool, seg in self.segments.items():
+            if compact_all or len(seg["chunks"]) >= self.compact_every:
+                stale.setdefault(tool, []).extend(self._compact(tool))
+        meta["segments"] = self.segments
+        meta["next_chunk"] = self._next_chunk
+        self._write_meta(meta)
+        self._released = {}
+        # replaced chunks are only removed once the metadata no longer references them
+        for tool, chunks in stale.items():
+            self._drop_chunks(tool, chunks)
 
     def save_state(self, state: dict):
-        data = zlib.compress(json.dumps(state, default=str).encode())
+        """Checkpoint ``state``; its ``scan_results`` lists are journaled incrementally."""
+        meta = {k: v for k, v in state.items() if k not in ("scan_results", "processed_inputs")}
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
         with FileLock(str(self.lock_file)):
-            with open(self.state_file, "wb") as f:
-                f.write(data)
+            for tool, items in state.get("scan_results", {}).items():
+                self._append(tool, items if isinstance(items, list) else list(items))
+            for tool, items in state.get("processed_inputs", {}).items():
+                self._append(f"{tool}.inputs", items)
+            self._checkpoint(meta)
+
+    def compact(self):
+        if not self.meta_file.exists():
+            return
+        with FileLock(str(self.lock_file)):
+            meta = json.loads(self.meta_file.read_text())
+            self._checkpoint(meta, compact_all=True)
 
     def load_state(self) -> dict:
+        """Return the checkpoint metadata without loading any tool results.
+
+        ``result_counts`` maps each journaled tool to its number of results;
+        use ``iter_results`` to replay them. Old single-blob checkpoints are
+        still readable and come back with ``scan_results`` filled in.
+        """
         try:
             with FileLock(str(self.lock_file)):
-                if not self.state_file.exists():
-                    return None
-                with open(self.state_file, "rb") as f:
-                    data = zlib.decompress(f.read())
-                    return json.loads(data)
+                if not self.meta_file.exists():
+                    return self._load_legacy()
+                meta = json.loads(self.meta_file.read_text())
         except Exception:
             return None
+        self.segments = meta.pop("segments", {})
+        self._next_chunk = meta.pop("next_chunk", 0)
+        for seg in self.segments.values():
+            # nothing journaled so far is held in memory by the resumed scan
+            seg["base"] = seg["count"]
+        meta["result_counts"] = {
+            tool: seg["count"] for tool, seg in self.segments.items() if not tool.endswith(".inputs")
+        }
+        return meta
+
+    def _iter_lines(self, tool, chunks):
+        for chunk in chunks:
+            with gzip.open(self._chunk_path(tool, chunk), "rt") as f:
+                yield from f
+
+    def iter_results(self, tool):
+        """Stream a tool's journaled results one at a time."""
+        seg = self.segments.get(tool)
+        if not seg:
+            return
+        for line in self._iter_lines(tool, seg["chunks"]):
+            yield json.loads(line)
+
+    def iter_processed(self, tool):
+        """Stream the input items a tool had finished before the checkpoint."""
+        return self.iter_results(f"{tool}.inputs")
+
+    def _load_legacy(self):
+        if not self.legacy_file.exists():
+            return None
+        with open(self.legacy_file, "rb") as f:
+            return json.loads(zlib.decompress(f.read()))
@@ -0,0 +1,91 @@
+import re
+
+_HOST_RE = re.compile(r"^[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?(?:\.[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?)*$")
+
+
+def normalize_hostname(name):
+    """Lowercase a scanner-reported name and strip wildcards, schemes, ports and trailing dots.
+
+    Returns None for anything that is not a plausible hostname.
+    """
+    if not name:
+        return None
+    host = str(name).strip().lower()
+    if "://" in host:
+        host = host.split("://", 1)[1]
+    host = host.split("/", 1)[0].split(":", 1)[0]
+    while host.startswith("*."):
+        host = host[2:]
+    host = host.strip(".")
+    if not host or len(host) > 253 or not _HOST_RE.match(host):
+        return None
+    if any(len(label) > 63 for label in host.split(".")):
+        return None
+    return host
+
+
+class SubdomainIndex:
+    """
+    Central, normalized set of hostnames shared by every enumeration tool.
+
+    Each host is stored once together with the sources that reported it, so
+    later phases can probe every unique in-scope host exactly once.
+    """
+
+    def __init__(self, target, extra_scope=None):
+        self.roots = [normalize_hostname(r) for r in [target, *(extra_scope or [])]]
+        self.roots = [r for r in self.roots if r]
+        self._sources = {}
+        self.reported = {}
+        self.rejected = 0
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __contains__(self, name):
+        return normalize_hostname(name) in self._sources
+
+    def in_scope(self, host):
+        return any(host == root or host.endswith("." + root) for root in self.roots)
+
+    def add(self, name, source):
+        """Record ``name`` as reported by ``source``; returns the host if it is new, else None."""
+        self.reported[source] = self.reported.get(source, 0) + 1
+        host = normalize_hostname(name)
+        if not host or not self.in_scope(host):
+            self.rejected += 1
+            return None
+        sources = self._sources.get(host)
+        if sources is None:
+            self._sources[host] = {source}
+            return host
+        sources.add(source)
+        return None
+
+    def add_many(self, names, source):
+        return [host for host in (self.add(n, source) for n in names) if host]
+
+    def hosts(self):
+        return sorted(self._sources)
+
+    def sources(self, name):
+        return sorted(self._sources.get(normalize_hostname(name), ()))
+
+    def source_stats(self):
+        """Per-source counts: raw rows reported, unique hosts seen, hosts only that source found."""
+        stats = {s: {"reported": n, "unique": 0, "exclusive": 0} for s, n in self.reported.items()}
+        for sources in self._sources.values():
+            for s in sources:
+                stats[s]["unique"] += 1
+                if len(sources) == 1:
+                    stats[s]["exclusive"] += 1
+        return stats
+
+    def to_dict(self):
+        return {
+            "roots": self.roots,
+            "total": len(self),
+            "rejected": self.rejected,
+            "sources": self.source_stats(),
+            "hosts": {host: sorted(s) for host, s in sorted(self._sources.items())}
+        }
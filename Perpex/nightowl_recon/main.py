@@ -51,6 +51,9 @@ class NightOwlCLI:
         parser.add_argument("--no-ui", action="store_true", help="Disable interactive UI")
         parser.add_argument("--timeout", type=int, default=300, help="Per-tool timeout (seconds)")
         parser.add_argument("--rate-limit", type=int, default=10, help="Requests per second limit")
+        parser.add_argument("--stream", action="store_true", help="Stream subdomains into downstream tools as they are found")
+        parser.add_argument("--delta", action="store_true", help="Only rescan hosts that are new or changed since the last run")
+        parser.add_argument("--full-refresh", action="store_true", help="With --delta, rescan every host and reset the refresh clock")
         parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
         parser.add_argument("--help-menu", action="store_true", help="Show detailed help")
         parser.add_argument("--list-tools", action="store_true", help="List available tools")
@@ -111,7 +114,10 @@ class NightOwlCLI:
             resume=args.resume,
             custom_tools=args.tools,
             config_file=args.config,
-            verbose=args.verbose
+            verbose=args.verbose,
+            streaming=args.stream,
+            delta=args.delta,
+            full_refresh=args.full_refresh
         )
 
         if args.no_ui:
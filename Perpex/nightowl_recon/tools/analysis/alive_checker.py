@@ -1,17 +1,28 @@
 from tools.base_tool import BaseTool
-import aiohttp
+from utils.http_prober import HttpProber
+from config.settings import ALIVE_CHECK_CONFIG
 
 class AliveChecker(BaseTool):
     name = "alive_checker"
 
+    def _prober(self, concurrency):
+        return HttpProber(
+            self.get_http(),
+            concurrency=concurrency,
+            ports=ALIVE_CHECK_CONFIG['ports'],
+            timeout=ALIVE_CHECK_CONFIG['timeout'],
+            max_redirects=ALIVE_CHECK_CONFIG['max_redirects'],
+            rate=ALIVE_CHECK_CONFIG['rate']
+        )
+
     async def scan(self, target):
-        results = []
-        async with aiohttp.ClientSession() as session:
-            for proto in ["http", "https"]:
-                url = f"{proto}://{target}"
-                try:
-                    async with session.get(url, timeout=5) as resp:
-                        results.append({"domain": target, "protocol": proto, "status": "alive", "status_code": resp.status})
-                except Exception:
-                    continue
-        return results
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
+        async for result in self._prober(4).probe_hosts([target]):
+            yield result
+
+    async def stream_hosts(self, hosts):
+        """Probe the whole deduplicated host set at once."""
+        async for result in self._prober(ALIVE_CHECK_CONFIG['concurrency']).probe_hosts(hosts):
+            yield result
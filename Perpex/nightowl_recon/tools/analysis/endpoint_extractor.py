@@ -2,7 +2,6 @@
 
 import re
 from tools.base_tool import BaseTool
-import aiohttp
 
 class EndpointExtractor(BaseTool):
     def __init__(self, timeout=300, rate_limit=10, threads=50):
@@ -17,16 +16,16 @@ class EndpointExtractor(BaseTool):
             f"https://{target}/app.js"
         ]
 
-        async with aiohttp.ClientSession() as session:
-            for url in js_urls:
-                try:
-                    async with session.get(url, timeout=self.timeout) as resp:
-                        if resp.status == 200:
-                            content = await resp.text()
-                            endpoints = re.findall(r'["\'](\/(?:api|v\d+\/)[^"\']+?)["\']', content)
-                            for ep in endpoints:
-                                results.add(ep)
-                except Exception as e:
-                    continue
+        http = self.get_http()
+        for url in js_urls:
+            try:
+                async with http.get(url, timeout=self.timeout) as resp:
+                    if resp.status == 200:
+                        content = await resp.text()
+                        endpoints = re.findall(r'["\'](\/(?:api|v\d+\/)[^"\']+?)["\']', content)
+                        for ep in endpoints:
+                            results.add(ep)
+            except Exception as e:
+                continue
 
         return [{"endpoint": ep} for ep in results]
@@ -1,9 +1,40 @@
+from utils.http_client import HttpClient
+
 class BaseTool:
     def __init__(self, timeout=300, rate_limit=10, threads=50):
         self.timeout = timeout
         self.rate_limit = rate_limit
         self.threads = threads                # ✅ Add this
         self.version = "unknown"
+        self.http = None                      # shared HttpClient, set by the orchestrator
+        self.dns_records = {}                 # host -> BulkResolver record, shared by the orchestrator
+        self.on_hosts_done = None             # callback(hosts) for bulk tools that checkpoint mid-batch
+        self._own_http = False                # True once get_http() made a private client
+
+    def get_http(self):
+        """Return the shared HTTP client, or a private one when the tool runs standalone."""
+        if self.http is None:
+            self.http = HttpClient(rate_limit=self.rate_limit)
+            self._own_http = True
+        return self.http
+
+    async def close(self):
+        """Close the private HTTP client, if get_http() created one; a shared client is left open."""
+        if self._own_http:
+            await self.http.close()
+            self.http = None
+            self._own_http = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
 
     async def scan(self, target):
         raise NotImplementedError("Scan method must be implemented by subclasses.")
+
+    async def stream(self, target):
+        """Yield results one at a time. Tools that can emit early override this."""
+        for item in await self.scan(target):
+            yield item
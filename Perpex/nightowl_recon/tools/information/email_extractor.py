@@ -1,5 +1,5 @@
 from tools.base_tool import BaseTool
-import aiohttp, re
+import re
 
 class EmailExtractor(BaseTool):
     name = "email_extractor"
@@ -8,12 +8,11 @@ class EmailExtractor(BaseTool):
 
     async def scan(self, target):
         results = []
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"http://{target}", timeout=10) as resp:
-                    content = await resp.text()
-                    for email in set(self.EMAIL_PATTERN.findall(content)):
-                        results.append({"email": email})
-            except Exception:
-                pass
+        try:
+            async with self.get_http().get(f"http://{target}", timeout=10) as resp:
+                content = await resp.text()
+                for email in set(self.EMAIL_PATTERN.findall(content)):
+                    results.append({"email": email})
+        except Exception:
+            pass
         return results
@@ -1,5 +1,5 @@
 from tools.base_tool import BaseTool
-import aiohttp, re
+import re
 
 class NameExtractor(BaseTool):
     name = "name_extractor"
@@ -8,12 +8,11 @@ class NameExtractor(BaseTool):
 
     async def scan(self, target):
         results = []
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"http://{target}") as resp:
-                    content = await resp.text()
-                    for name in set(self.NAME_PATTERN.findall(content)):
-                        results.append({"name": name})
-            except Exception:
-                pass
+        try:
+            async with self.get_http().get(f"http://{target}") as resp:
+                content = await resp.text()
+                for name in set(self.NAME_PATTERN.findall(content)):
+                    results.append({"name": name})
+        except Exception:
+            pass
         return results
@@ -1,5 +1,5 @@
 from tools.base_tool import BaseTool
-import aiohttp, re
+import re
 
 class PhoneExtractor(BaseTool):
     name = "phone_extractor"
@@ -7,12 +7,11 @@ class PhoneExtractor(BaseTool):
 
     async def scan(self, target):
         results = []
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"http://{target}") as resp:
-                    content = await resp.text()
-                    for phone in set(self.PHONE_PATTERN.findall(content)):
-                        results.append({"phone": phone})
-            except Exception:
-                pass
+        try:
+            async with self.get_http().get(f"http://{target}") as resp:
+                content = await resp.text()
+                for phone in set(self.PHONE_PATTERN.findall(content)):
+                    results.append({"phone": phone})
+        except Exception:
+            pass
         return results
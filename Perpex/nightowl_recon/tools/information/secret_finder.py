@@ -1,23 +1,55 @@
 from tools.base_tool import BaseTool
-import aiohttp, re
+from config.settings import SECRET_SCAN_CONFIG
+from utils.secret_scanner import SecretScanner
 
 class SecretFinder(BaseTool):
     name = "secret_finder"
-    patterns = [
-        re.compile(r'ghp_[0-9a-zA-Z]{36}'),  # github
-        re.compile(r'xox[baprs]-[0-9a-zA-Z]{10,48}'), # slack
-    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scanner = SecretScanner(
+            exclude=SECRET_SCAN_CONFIG['exclude'],
+            chunk_size=SECRET_SCAN_CONFIG['chunk_size'],
+            overlap=SECRET_SCAN_CONFIG['overlap'],
+            token_chars=SECRET_SCAN_CONFIG['token_chars']
+        )
+
+    async def stream(self, target):
+        http = self.get_http()
+        for url in [f"http://{target}", f"https://{target}/.env"]:
+            seen = set()
+            try:
+                async with http.get(url, timeout=10) as resp:
+                    scan = self.scanner.stream(resp.charset or "utf-8")
+                    read = 0
+                    async for data in resp.content.iter_chunked(SECRET_SCAN_CONFIG['read_chunk']):
+                        read += len(data)
+                        for result in self._unseen(url, scan.feed(data), seen):
+                            yield result
+                        if read >= SECRET_SCAN_CONFIG['max_body_bytes']:
+                            break
+                    for result in self._unseen(url, scan.close(), seen):
+                        yield result
+            except Exception:
+                pass
+
+    @staticmethod
+    def _unseen(url, matches, seen):
+        """Results for matches not already reported for ``url``."""
+        for m in matches:
+            key = (m["type"], m["match"])
+            if key in seen:
+                continue
+            seen.add(key)
+            yield {
+                "secret": m["match"],
+                "url": url,
+                "type": m["type"],
+                "severity": m["severity"],
+                "confidence": m["confidence"],
+                "description": m["description"],
+                "position": m["position"]
+            }
 
     async def scan(self, target):
-        results = []
-        async with aiohttp.ClientSession() as session:
-            for url in [f"http://{target}", f"https://{target}/.env"]:
-                try:
-                    async with session.get(url, timeout=10) as resp:
-                        content = await resp.text()
-                        for pat in self.patterns:
-                            for m in pat.findall(content):
-                                results.append({"secret": m, "url": url})
-                except Exception:
-                    pass
-        return results
+        return [r async for r in self.stream(target)]
@@ -7,9 +7,13 @@ class AmassScanner(BaseTool):
         self.name="amass"
 
     async def scan(self,target):
-        results=[]; cmd=["amass","enum","-d",target,"-json","-"]
+        return [r async for r in self.stream(target)]
+
+    async def stream(self,target):
+        cmd=["amass","enum","-d",target,"-json","-"]
         proc=await asyncio.create_subprocess_exec(*cmd,stdout=asyncio.subprocess.PIPE,stderr=asyncio.subprocess.DEVNULL)
         async for l in proc.stdout:
-            try: d=json.loads(l); results.append({"domain":d["name"]})
-            except: pass
-        await proc.wait(); return results
+            try: d=json.loads(l)
+            except: continue
+            if "name" in d: yield {"domain":d["name"]}
+        await proc.wait()
@@ -5,11 +5,12 @@ class AssetfinderScanner(BaseTool):
     name = "assetfinder"
 
     async def scan(self, target):
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
         cmd = ["assetfinder", "--subs-only", target]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
-        lines = []
         async for line in proc.stdout:
             domain = line.decode().strip()
-            if domain: lines.append({"domain": domain})
+            if domain: yield {"domain": domain}
         await proc.wait()
-        return lines
@@ -1,5 +1,4 @@
 from tools.base_tool import BaseTool
-import aiohttp
 
 class ChaosScanner(BaseTool):
     name = "chaos"
@@ -10,9 +9,8 @@ class ChaosScanner(BaseTool):
             return []
         url = f"https://dns.projectdiscovery.io/dns/{target}/subdomains"
         headers = {'Authorization': api_key}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return [{"domain": name} for name in data.get("subdomains",[])]
+        async with self.get_http().get(url, headers=headers, timeout=10) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                return [{"domain": name} for name in data.get("subdomains",[])]
         return []
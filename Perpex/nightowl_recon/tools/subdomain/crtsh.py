@@ -1,8 +1,6 @@
 # tools/subdomain/crtsh.py
 
 from tools.base_tool import BaseTool
-import aiohttp
-import asyncio
 
 class CrtShScanner(BaseTool):
     def __init__(self, timeout=300, rate_limit=10):
@@ -10,14 +8,13 @@ class CrtShScanner(BaseTool):
         self.name = "crtsh"
 
     async def scan(self, target):
-        results = []
+        # crt.sh repeats the same name across every certificate that covers it
+        names = set()
         url = f"https://crt.sh/?q=%25.{target}&output=json"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=self.timeout) as resp:
-                data = await resp.json()
-                for entry in data:
-                    name = entry.get("name_value")
-                    if name:
-                        for d in name.split("\n"):
-                            results.append({"domain": d})
-        return results
+        async with self.get_http().get(url, timeout=self.timeout) as resp:
+            data = await resp.json()
+            for entry in data:
+                name = entry.get("name_value")
+                if name:
+                    names.update(d.strip().lower() for d in name.split("\n") if d.strip())
+        return [{"domain": d} for d in sorted(names)]
@@ -9,12 +9,13 @@ class FindomainScanner(BaseTool):
         self.name = "findomain"
 
     async def scan(self, target):
-        results = []
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
         cmd = ["findomain", "-t", target, "-q", "-oJ"]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
         async for line in proc.stdout:
             data = line.decode().strip()
             if data:
-                results.append({"domain": data})
+                yield {"domain": data}
         await proc.wait()
-        return results
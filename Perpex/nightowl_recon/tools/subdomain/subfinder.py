@@ -4,11 +4,13 @@ import asyncio, json
 class SubfinderScanner(BaseTool):
     name = "subfinder"
     async def scan(self, target):
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
         cmd = ["subfinder","-d",target,"-json"]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
-        results = []
         async for line in proc.stdout:
-            try: results.append(json.loads(line.decode()))
+            try: x = json.loads(line.decode())
             except Exception: continue
+            yield {"domain": x.get("host")}
         await proc.wait()
-        return [{"domain": x.get("host")} for x in results]
@@ -4,11 +4,13 @@ import asyncio, json
 class HttpxScanner(BaseTool):
     name = "httpx"
     async def scan(self, target):
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
         cmd = ["httpx","-u",target,"-json"]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
-        results = []
         async for line in proc.stdout:
-            try: obj = json.loads(line.decode()); results.append(obj)
+            try: obj = json.loads(line.decode())
             except Exception: continue
+            yield obj
         await proc.wait()
-        return results
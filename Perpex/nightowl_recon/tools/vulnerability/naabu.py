@@ -1,14 +1,83 @@
 from tools.base_tool import BaseTool
-import asyncio, json
+from utils.network_utils import AsyncPortScanner, expand_ip_targets
+from config.settings import PORT_SCAN_CONFIG, COMMON_PORTS, DNS_CONFIG
+import asyncio, ipaddress, json, os, shutil, socket, tempfile
 
 class NaabuScanner(BaseTool):
     name = "naabu"
     async def scan(self, target):
-        cmd = ["naabu","-host",target,"-json"]
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
+        if self._use_binary():
+            async for obj in self._run_binary(["-host", target]):
+                yield obj
+            return
+        async for obj in self.stream_hosts([target]):
+            yield obj
+
+    async def stream_hosts(self, hosts):
+        """Port-scan a host set, probing each shared IP only once.
+
+        Items may be hostnames, IPs or CIDR ranges; ranges are expanded into
+        their addresses, which are reported with the IP as ``host``.
+        """
+        if self._use_binary():
+            with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+                f.write("\n".join(hosts))
+            try:
+                async for obj in self._run_binary(["-list", f.name]):
+                    yield obj
+            finally:
+                os.unlink(f.name)
+            return
+        addresses = [h for h in hosts if self._is_address(h)]
+        names = [h for h in hosts if not self._is_address(h)]
+        # hosts the orchestrator has not resolved are looked up here, concurrently
+        lookups = asyncio.Semaphore(DNS_CONFIG['concurrency'])
+        records = await asyncio.gather(*(self._record(h, lookups) for h in names))
+        scanner = AsyncPortScanner(
+            concurrency=PORT_SCAN_CONFIG['concurrency'],
+            rate=PORT_SCAN_CONFIG['rate'],
+            timeout=PORT_SCAN_CONFIG['timeout'],
+            retries=PORT_SCAN_CONFIG['retries']
+        )
+        ports = PORT_SCAN_CONFIG['ports'] or COMMON_PORTS
+        targets = scanner.group_by_ip(records)
+        for ip in expand_ip_targets(addresses):
+            targets.setdefault(ip, [])
+        async for hit in scanner.scan(targets, ports):
+            host = hit["hosts"][0] if hit["hosts"] else hit["ip"]
+            yield {"host": host, "hosts": hit["hosts"], "ip": hit["ip"], "port": hit["port"]}
+
+    @staticmethod
+    def _is_address(item):
+        try:
+            ipaddress.ip_network(str(item).strip(), strict=False)
+            return True
+        except ValueError:
+            return False
+
+    def _use_binary(self):
+        return PORT_SCAN_CONFIG['prefer_binary'] and shutil.which("naabu")
+
+    async def _record(self, host, lookups):
+        record = self.dns_records.get(host)
+        if record:
+            return record
+        try:
+            async with lookups:
+                infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except (OSError, UnicodeError):
+            infos = []
+        ips = list(dict.fromkeys(info[4][0] for info in infos))
+        return {"host": host, "a": [ip for ip in ips if ":" not in ip], "aaaa": [ip for ip in ips if ":" in ip]}
+
+    async def _run_binary(self, args):
+        cmd = ["naabu", *args, "-json"]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
-        results = []
         async for line in proc.stdout:
-            try: results.append(json.loads(line.decode()))
+            try: obj = json.loads(line.decode())
             except Exception: continue
+            yield obj
         await proc.wait()
-        return results
@@ -1,18 +1,34 @@
 from tools.base_tool import BaseTool
+from utils.nuclei_runner import ShardedNuclei
+from config.settings import NUCLEI_CONFIG
 import asyncio, json
 
 class NucleiScanner(BaseTool):
     name = "nuclei"
 
     async def scan(self, target):
+        return [r async for r in self.stream(target)]
+
+    async def stream(self, target):
         cmd = ["nuclei", "-u", target, "-json"]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE)
-        results = []
         async for line in proc.stdout:
             try:
                 vuln = json.loads(line.decode())
-                results.append(vuln)
             except Exception:
                 continue
+            yield vuln
         await proc.wait()
-        return results
+
+    async def stream_hosts(self, hosts):
+        """Scan a host set as parallel nuclei shards, checkpointing each finished shard."""
+        runner = ShardedNuclei(
+            args=NUCLEI_CONFIG['args'],
+            shard_size=NUCLEI_CONFIG['shard_size'],
+            parallel=NUCLEI_CONFIG['parallel'],
+            cpu_budget=NUCLEI_CONFIG['cpu_budget'],
+            shard_timeout=NUCLEI_CONFIG['shard_timeout'],
+            on_shard_done=self.on_hosts_done
+        )
+        async for vuln in runner.stream(hosts):
+            yield vuln
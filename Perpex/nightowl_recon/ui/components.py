@@ -70,7 +70,8 @@ def create_summary_panel(stats: dict) -> Panel:
     """
     Footer summary panel. Expects stats keys:
       target, mode, current_phase, total_phases,
-      completed_tools (int), failed_tools (int), elapsed_time, resource_usage
+      completed_tools (int), failed_tools (int), elapsed_time, resource_usage,
+      concurrency (optional)
     """
     lines = []
     lines.append(f"Target: {stats.get('target')}")
@@ -86,5 +87,8 @@ def create_summary_panel(stats: dict) -> Panel:
     mem = resource.get("memory_percent", 0)
     net = resource.get("network_mb", 0)
     lines.append(f"CPU: {cpu:.0f}% | Mem: {mem:.0f}% | Net: {net:.1f}MB")
+    limiter = stats.get("concurrency")
+    if limiter:
+        lines.append(f"Concurrency: {limiter['active']}/{limiter['limit']} ({limiter['waiting']} waiting)")
     body = Text("\n".join(lines), style="bold")
     return Panel(body, title="Summary", border_style="white")
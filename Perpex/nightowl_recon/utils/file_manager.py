@@ -1,6 +1,47 @@
 import json
 from pathlib import Path
 
+
+class ToolResultWriter:
+    """Writes a tool's results as a JSON array, one item at a time."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.count = 0
+        self._fh = open(self.path, "w")
+        self._fh.write("[")
+
+    def write(self, item):
+        self._fh.write(",\n  " if self.count else "\n  ")
+        self._fh.write(json.dumps(item, default=str))
+        self._fh.flush()
+        self.count += 1
+
+    def close(self):
+        if self._fh.closed:
+            return
+        self._fh.write("\n]" if self.count else "]")
+        self._fh.close()
+
+
+class JsonLinesWriter:
+    """Appends one JSON document per line, flushed as each result arrives."""
+
+    def __init__(self, path, append=False):
+        self.path = Path(path)
+        self.count = 0
+        self._fh = open(self.path, "a" if append else "w")
+
+    def write(self, item):
+        self._fh.write(json.dumps(item, default=str) + "\n")
+        self._fh.flush()
+        self.count += 1
+
+    def close(self):
+        if not self._fh.closed:
+            self._fh.close()
+
+
 class FileManager:
     def __init__(self, output_dir):
         self.output_dir = Path(output_dir)
@@ -11,6 +52,16 @@ class FileManager:
         with open(d / f"{tool}.json", "w") as f:
             json.dump(results, f, indent=2)
 
+    def open_tool_stream(self, tool):
+        d = self.output_dir / "scans"
+        d.mkdir(exist_ok=True)
+        return ToolResultWriter(d / f"{tool}.json")
+
+    def open_jsonl_stream(self, tool, append=False):
+        d = self.output_dir / "scans"
+        d.mkdir(exist_ok=True)
+        return JsonLinesWriter(d / f"{tool}.jsonl", append=append)
+
     async def save_combined_results(self, name, items):
         with open(self.output_dir / "scans" / f"{name}_all.txt", "w") as f:
             for item in sorted(set(items)):
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, bursting up to ``capacity``."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HttpClient:
+    """
+    Orchestrator-owned HTTP layer shared by every HTTP-based tool.
+
+    One pooled connector keeps sockets (and TLS sessions) alive across tools
+    and caches DNS lookups. Requests pass through a global token bucket and a
+    per-host bucket driven by the scan's ``rate_limit``. A caller with a
+    budget of its own (the alive prober) passes ``rate_bucket`` to use it
+    instead of the global bucket. When ``limiter``
+    is set, every request's outcome is recorded on it: timeouts as
+    timeouts, 429/503 answers as errors.
+    """
+
+    def __init__(
+        self,
+        rate_limit=10,
+        global_rate=500,
+        connection_limit=100,
+        limit_per_host=6,
+        keepalive_timeout=30,
+        dns_cache_ttl=300,
+        verify_ssl=True,
+        headers=None
+    ):
+        self.rate_limit = rate_limit
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.verify_ssl = verify_ssl
+        self.headers = headers or {}
+        self.global_bucket = TokenBucket(global_rate) if global_rate else None
+        self.host_buckets = {}
+        self.requests_sent = 0
+        self.limiter = None
+        self._session = None
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                enable_cleanup_closed=True,
+                ssl=None if self.verify_ssl else False
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self._session
+
+    async def _throttle(self, url, rate_bucket=None):
+        bucket = rate_bucket or self.global_bucket
+        if bucket:
+            await bucket.acquire()
+        if not self.rate_limit:
+            return
+        host = urlsplit(url).hostname or ""
+        bucket = self.host_buckets.get(host)
+        if bucket is None:
+            bucket = self.host_buckets[host] = TokenBucket(self.rate_limit)
+        await bucket.acquire()
+
+    @asynccontextmanager
+    async def request(self, method, url, rate_bucket=None, **kwargs):
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        await self._throttle(url, rate_bucket)
+        session = await self._get_session()
+        self.requests_sent += 1
+        try:
+            async with session.request(method, url, **kwargs) as resp:
+                yield resp
+        except asyncio.TimeoutError:
+            self._report(timeout=True)
+            raise
+        self._report(error=resp.status in (429, 503))
+
+    def _report(self, error=False, timeout=False):
+        if self.limiter is not None:
+            self.limiter.record(error=error, timeout=timeout)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,110 @@
+import asyncio
+import re
+
+from utils.http_client import TokenBucket
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_DONE = object()
+
+
+def build_probe_urls(host, ports=None):
+    """Return every URL to probe for ``host``.
+
+    Without ``ports`` only http:80 and https:443 are tried. Custom ports are
+    tried with both schemes unless they are the scheme's default port.
+    """
+    if not ports:
+        return [f"http://{host}", f"https://{host}"]
+    urls = []
+    for port in ports:
+        for scheme, default in _DEFAULT_PORTS.items():
+            if port == default:
+                urls.append(f"{scheme}://{host}")
+            elif port not in _DEFAULT_PORTS.values():
+                urls.append(f"{scheme}://{host}:{port}")
+    return urls
+
+
+class HttpProber:
+    """
+    High-throughput HTTP prober over a whole host set.
+
+    Probes every scheme/port combination concurrently under a fixed number
+    of in-flight requests and yields each live URL as soon as it answers.
+    Requests go through the shared HttpClient, so its pooling and per-host
+    limits apply. With ``rate`` the probes get a budget of their own, in
+    probes per second, instead of the client's global rate; otherwise they
+    share it with every other HTTP tool.
+    """
+
+    def __init__(self, http, concurrency=500, ports=None, timeout=10, max_redirects=5, read_limit=65536, rate=None):
+        self.http = http
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, capacity=max(1, rate // 10)) if rate else None
+        self.ports = ports
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.read_limit = read_limit
+        self.probed = 0
+        self.alive = 0
+
+    async def probe(self, host, url):
+        try:
+            async with self.http.get(url, timeout=self.timeout, max_redirects=self.max_redirects,
+                                     rate_bucket=self.bucket) as resp:
+                body = await resp.content.read(self.read_limit)
+                length = resp.headers.get("Content-Length")
+                match = _TITLE_RE.search(body.decode(resp.charset or "utf-8", errors="ignore"))
+                return {
+                    "domain": host,
+                    "url": url,
+                    "protocol": url.split("://", 1)[0],
+                    "status": "alive",
+                    "status_code": resp.status,
+                    "title": " ".join(match.group(1).split()) if match else "",
+                    "content_length": int(length) if length and length.isdigit() else len(body),
+                    "final_url": str(resp.url),
+                    "redirect_chain": [{"url": str(h.url), "status_code": h.status} for h in resp.history]
+                }
+        except Exception:
+            return None
+        finally:
+            self.probed += 1
+
+    async def probe_hosts(self, hosts):
+        """Yield a result dict for every live URL across ``hosts``, in completion order."""
+        jobs = asyncio.Queue(maxsize=self.concurrency * 2)
+        results = asyncio.Queue()
+
+        async def feed():
+            for host in hosts:
+                for url in build_probe_urls(host, self.ports):
+                    await jobs.put((host, url))
+            for _ in range(self.concurrency):
+                await jobs.put(_DONE)
+
+        async def work():
+            while True:
+                job = await jobs.get()
+                if job is _DONE:
+                    break
+                result = await self.probe(*job)
+                if result:
+                    await results.put(result)
+            await results.put(_DONE)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks += [asyncio.create_task(work()) for _ in range(self.concurrency)]
+        try:
+            finished = 0
+            while finished < self.concurrency:
+                item = await results.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                self.alive += 1
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
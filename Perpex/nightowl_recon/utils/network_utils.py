@@ -1,5 +1,20 @@
-import socket
+import asyncio
 import ipaddress
+import json
+import os
+import random
+import socket
+import string
+import struct
+import time
+from pathlib import Path
+
+import dns.asyncresolver
+import dns.exception
+import dns.rdatatype
+import dns.resolver
+
+from utils.http_client import TokenBucket
 
 class NetworkUtils:
     @staticmethod
@@ -29,3 +44,275 @@ class NetworkUtils:
                 return True
         except Exception:
             return False
+
+    @staticmethod
+    async def is_port_open_async(ip: str, port: int, timeout: float = 1.0) -> bool:
+        """Non-blocking TCP connect probe; the socket is reset on close so no TIME_WAIT piles up."""
+        family = socket.AF_INET6 if ":" in ip else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        try:
+            await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, (ip, port)), timeout)
+            return True
+        except (OSError, asyncio.TimeoutError):
+            return False
+        finally:
+            sock.close()
+
+
+class DnsCache:
+    """On-disk DNS answer cache that honours record TTLs, shared between scans."""
+
+    def __init__(self, path=None, negative_ttl=300):
+        self.path = Path(path) if path else None
+        self.negative_ttl = negative_ttl
+        self.entries = {}
+        if self.path and self.path.exists():
+            try:
+                now = time.time()
+                data = json.loads(self.path.read_text())
+                self.entries = {h: e for h, e in data.items() if e.get("expires", 0) > now}
+            except Exception:
+                self.entries = {}
+
+    def get(self, host):
+        entry = self.entries.get(host)
+        if entry and entry["expires"] > time.time():
+            return entry["record"]
+        return None
+
+    def put(self, host, record):
+        ttl = record.get("ttl") or self.negative_ttl
+        self.entries[host] = {"record": record, "expires": time.time() + ttl}
+
+    def save(self):
+        if not self.path:
+            return
+        now = time.time()
+        live = {h: e for h, e in self.entries.items() if e["expires"] > now}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(live))
+        os.replace(tmp, self.path)
+
+
+class BulkResolver:
+    """
+    Asyncio-native bulk resolver for A/AAAA/CNAME records.
+
+    Lookups run under a fixed concurrency cap against a configurable
+    resolver list. Each parent zone is probed once with random labels; hosts
+    whose addresses only match that zone's wildcard answer are flagged.
+    """
+
+    def __init__(
+        self,
+        resolvers=None,
+        port=53,
+        concurrency=200,
+        timeout=3.0,
+        retries=2,
+        wildcard_checks=2,
+        cache=None
+    ):
+        self.resolver = dns.asyncresolver.Resolver(configure=not resolvers)
+        if resolvers:
+            self.resolver.nameservers = list(resolvers)
+        self.resolver.port = port
+        self.resolver.timeout = timeout
+        self.resolver.lifetime = timeout * (retries + 1)
+        self.concurrency = concurrency
+        self.wildcard_checks = wildcard_checks
+        self.cache = cache or DnsCache()
+        self.queries = 0
+        self._semaphore = None
+        self._wildcards = {}
+
+    async def _query(self, name, rdtype):
+        self.queries += 1
+        try:
+            answer = await self.resolver.resolve(name, rdtype, raise_on_no_answer=False)
+        except dns.resolver.NXDOMAIN:
+            return None, [], None
+        except (dns.exception.DNSException, ValueError) as e:
+            # NoNameservers, Timeout, but also names dnspython rejects (LabelTooLong, bad IDNA)
+            raise LookupError(str(e) or type(e).__name__) from e
+        cnames = [
+            str(rr.target).rstrip(".")
+            for rrset in answer.response.answer if rrset.rdtype == dns.rdatatype.CNAME
+            for rr in rrset
+        ]
+        if answer.rrset is None:
+            return [], cnames, None
+        return [rr.to_text() for rr in answer.rrset], cnames, answer.rrset.ttl
+
+    async def _lookup(self, host):
+        async with self._semaphore:
+            record = {"host": host, "a": [], "aaaa": [], "cname": [], "ttl": None, "status": "nxdomain"}
+            try:
+                (a, cname_a, ttl_a), (aaaa, cname_aaaa, ttl_aaaa) = await asyncio.gather(
+                    self._query(host, "A"), self._query(host, "AAAA")
+                )
+            except LookupError as e:
+                record.update(status="error", error=str(e))
+                return record
+            if a is None and aaaa is None:
+                return record
+            ttls = [t for t in (ttl_a, ttl_aaaa) if t is not None]
+            record.update(
+                a=a or [],
+                aaaa=aaaa or [],
+                cname=list(dict.fromkeys(cname_a + cname_aaaa)),
+                ttl=min(ttls) if ttls else None,
+                status="resolved" if (a or aaaa) else "noanswer"
+            )
+            return record
+
+    async def _wildcard_ips(self, zone):
+        if zone not in self._wildcards:
+            async def probe():
+                ips = set()
+                for _ in range(self.wildcard_checks):
+                    label = "".join(random.choices(string.ascii_lowercase + string.digits, k=16))
+                    record = await self._lookup(f"{label}.{zone}")
+                    ips.update(record["a"] + record["aaaa"])
+                return ips
+            self._wildcards[zone] = asyncio.ensure_future(probe())
+        return await self._wildcards[zone]
+
+    async def resolve(self, host):
+        """Resolve one host, using the cache and flagging wildcard-only answers."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        record = self.cache.get(host)
+        if record is None:
+            record = await self._lookup(host)
+            if record["status"] != "error":
+                self.cache.put(host, record)
+        record = dict(record)
+        ips = set(record["a"] + record["aaaa"])
+        if ips and "." in host:
+            wildcard = await self._wildcard_ips(host.split(".", 1)[1])
+            record["wildcard"] = bool(wildcard) and ips <= wildcard
+        else:
+            record["wildcard"] = False
+        return record
+
+    async def resolve_many(self, hosts):
+        """Yield a record for every host as its lookup completes."""
+        hosts = iter(hosts)
+        pending = set()
+        try:
+            while True:
+                for host in hosts:
+                    pending.add(asyncio.ensure_future(self.resolve(host)))
+                    if len(pending) >= self.concurrency * 2:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def is_usable(record):
+        return record["status"] == "resolved" and not record["wildcard"]
+
+
+def expand_ip_targets(items):
+    """Expand IPs and CIDR ranges into a de-duplicated list of addresses, preserving order."""
+    seen = {}
+    for item in items:
+        item = str(item).strip()
+        if not item:
+            continue
+        if "/" in item:
+            network = ipaddress.ip_network(item, strict=False)
+            addresses = network.hosts() if network.num_addresses > 2 else network
+            for addr in addresses:
+                seen.setdefault(str(addr), None)
+        elif NetworkUtils.is_valid_ip(item):
+            seen.setdefault(item, None)
+    return list(seen)
+
+
+class AsyncPortScanner:
+    """
+    Asyncio TCP connect scanner over an IP x port matrix.
+
+    Each IP is probed once no matter how many hostnames point at it, and
+    connection attempts are paced by a global token bucket so the scan
+    stays within a packets-per-second budget. Open ports are yielded as
+    soon as they answer.
+    """
+
+    def __init__(self, concurrency=1000, rate=1000, timeout=1.5, retries=0):
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, capacity=max(1, rate // 10)) if rate else None
+        self.timeout = timeout
+        self.retries = retries
+        self.attempts = 0
+
+    @staticmethod
+    def group_by_ip(dns_records):
+        """Map each IP to the hostnames that resolve to it, from BulkResolver records."""
+        ip_hosts = {}
+        for record in dns_records:
+            for ip in record.get("a", []) + record.get("aaaa", []):
+                ip_hosts.setdefault(ip, []).append(record["host"])
+        return ip_hosts
+
+    async def check(self, ip, port):
+        for _ in range(self.retries + 1):
+            if self.bucket:
+                await self.bucket.acquire()
+            self.attempts += 1
+            if await NetworkUtils.is_port_open_async(ip, port, self.timeout):
+                return True
+        return False
+
+    async def scan(self, targets, ports):
+        """Yield ``{"ip", "port", "hosts"}`` for every open port.
+
+        ``targets`` is either a mapping of IP to hostnames (see ``group_by_ip``)
+        or an iterable of IPs/CIDRs. Ports are walked in the outer loop so no
+        single host takes a burst of connections.
+        """
+        ip_hosts = targets if isinstance(targets, dict) else dict.fromkeys(expand_ip_targets(targets), [])
+        ips = list(ip_hosts)
+        jobs = asyncio.Queue(maxsize=self.concurrency * 2)
+        found = asyncio.Queue()
+        workers = min(self.concurrency, len(ips) * len(ports)) or 1
+
+        async def feed():
+            for port in ports:
+                for ip in ips:
+                    await jobs.put((ip, port))
+            for _ in range(workers):
+                await jobs.put(None)
+
+        async def work():
+            while True:
+                job = await jobs.get()
+                if job is None:
+                    break
+                if await self.check(*job):
+                    await found.put(job)
+            await found.put(None)
+
+        tasks = [asyncio.create_task(feed())] + [asyncio.create_task(work()) for _ in range(workers)]
+        try:
+            finished = 0
+            while finished < workers:
+                job = await found.get()
+                if job is None:
+                    finished += 1
+                    continue
+                ip, port = job
+                yield {"ip": ip, "port": port, "hosts": list(ip_hosts[ip])}
+        finally:
+            for task in tasks:
+                task.cancel()
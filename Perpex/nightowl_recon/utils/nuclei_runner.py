@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import signal
+import tempfile
+
+_SHARD_DONE = object()
+
+
+class ShardedNuclei:
+    """
+    Runs nuclei over a large host set as many small parallel processes.
+
+    The hosts are cut into shards of ``shard_size`` that ``parallel`` workers
+    pull from one queue, so a shard stuck on a slow host holds up only its
+    own worker. ``-jsonl`` output is parsed line by line and findings are
+    yielded as they arrive. A shard that runs past ``shard_timeout`` (or
+    crashes) is killed, split in half and requeued, which walks the slow
+    host into a shard of its own; a single host that still fails is dropped
+    and listed in ``dropped``. Findings a killed shard already produced are
+    produced again when its halves rerun; they are yielded only once.
+
+    ``on_shard_done(hosts)`` is called once every finding of a completed
+    shard has been yielded, so callers can checkpoint at shard granularity.
+    """
+
+    def __init__(self, binary="nuclei", args=("-jsonl", "-silent"), shard_size=25, parallel=0,
+                 cpu_budget=0.75, shard_timeout=900, on_shard_done=None):
+        self.binary = binary
+        self.args = list(args)
+        self.shard_size = max(1, shard_size)
+        self.parallel = parallel or max(1, int((os.cpu_count() or 1) * cpu_budget))
+        self.shard_timeout = shard_timeout
+        self.on_shard_done = on_shard_done
+        self.shards = 0
+        self.splits = 0
+        self.findings = 0
+        self.dropped = []
+
+    async def stream(self, hosts):
+        hosts = list(dict.fromkeys(hosts))
+        if not hosts:
+            return
+        work = asyncio.Queue()
+        for i in range(0, len(hosts), self.shard_size):
+            work.put_nowait(hosts[i:i + self.shard_size])
+        out = asyncio.Queue(maxsize=1000)
+        workers = [asyncio.create_task(self._worker(work, out)) for _ in range(self.parallel)]
+        joined = asyncio.create_task(work.join())
+        seen = set()
+        try:
+            while True:
+                if joined.done():
+                    # every shard is finished and has queued all its output
+                    if out.empty():
+                        break
+                    item = out.get_nowait()
+                else:
+                    get = asyncio.ensure_future(out.get())
+                    await asyncio.wait({get, joined}, return_when=asyncio.FIRST_COMPLETED)
+                    if not get.done():
+                        get.cancel()
+                        continue
+                    item = get.result()
+                if isinstance(item, tuple) and item[0] is _SHARD_DONE:
+                    if self.on_shard_done:
+                        self.on_shard_done(item[1])
+                    continue
+                key = self.finding_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                self.findings += 1
+                yield item
+        finally:
+            joined.cancel()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    @staticmethod
+    def finding_key(finding):
+        return (finding.get("template-id"), finding.get("matcher-name"),
+                finding.get("matched-at"), finding.get("host"))
+
+    async def _worker(self, work, out):
+        while True:
+            shard = await work.get()
+            try:
+                if await self._run_shard(shard, out):
+                    await out.put((_SHARD_DONE, shard))
+                elif len(shard) > 1:
+                    mid = len(shard) // 2
+                    self.splits += 1
+                    work.put_nowait(shard[:mid])
+                    work.put_nowait(shard[mid:])
+                else:
+                    self.dropped.extend(shard)
+                    await out.put((_SHARD_DONE, shard))
+            finally:
+                work.task_done()
+
+    async def _run_shard(self, shard, out):
+        """Run one nuclei process over ``shard``; True when it exited cleanly in time."""
+        self.shards += 1
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("\n".join(shard) + "\n")
+        proc = await asyncio.create_subprocess_exec(
+            self.binary, "-l", f.name, *self.args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True, limit=1 << 20
+        )
+
+        async def pump():
+            async for line in proc.stdout:
+                if not line.startswith(b"{"):
+                    continue
+                try:
+                    finding = json.loads(line)
+                except ValueError:
+                    continue
+                await out.put(finding)
+            return await proc.wait()
+
+        try:
+            return await asyncio.wait_for(pump(), self.shard_timeout) == 0
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if proc.returncode is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+            os.unlink(f.name)
@@ -0,0 +1,200 @@
+import bisect
+import codecs
+import re
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from config.patterns import SECRET_PATTERNS
+
+DEFAULT_TOKEN_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789/+=-"
+
+
+class _Rule:
+    __slots__ = ("name", "regex", "keywords", "ignore_case", "full_scan", "priority", "min_length", "info")
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.regex = re.compile(spec["pattern"])
+        self.ignore_case = bool(self.regex.flags & re.IGNORECASE)
+        self.keywords = [(k.lower() if self.ignore_case else k).encode() for k in spec.get("keywords", ())]
+        self.full_scan = spec.get("full_scan", False)
+        self.priority = spec.get("priority", 0)
+        self.min_length = sre_parse.parse(spec["pattern"]).getwidth()[0]
+        self.info = {k: spec[k] for k in ("severity", "confidence", "description")}
+
+
+class SecretScanner:
+    """
+    Multi-pattern secret scanner built around cheap prefilters.
+
+    Each window of text is encoded to bytes once; finding where patterns
+    can match is then C-speed substring search over those bytes:
+
+    * patterns with ``keywords`` are only tried, as an anchored match,
+      where one of their literal prefixes occurs;
+    * other patterns are only tried inside runs of ``token_chars`` at least
+      as long as their shortest possible match, found with one byte-table
+      translation of the window;
+    * ``full_scan`` patterns are run over the whole window.
+
+    Where matches of different patterns overlap, keyword patterns win over
+    the rest, then the higher ``priority``, then the order in
+    SECRET_PATTERNS. Text is scanned in ``chunk_size`` windows that overlap
+    by ``overlap`` characters, so a match straddling a boundary is still
+    found whole as long as it is shorter than the overlap. ``stream()`` does
+    the same over text arriving in pieces, keeping only the overlap in memory.
+    """
+
+    def __init__(self, patterns=None, exclude=(), chunk_size=1 << 20, overlap=4096, token_chars=DEFAULT_TOKEN_CHARS):
+        patterns = SECRET_PATTERNS if patterns is None else patterns
+        rules = [_Rule(name, spec) for name, spec in patterns.items() if name not in exclude]
+        rules.sort(key=lambda r: (not r.keywords, -r.priority))
+        self.rules = rules
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.chars_scanned = 0
+        self._rank = {rule.name: i for i, rule in enumerate(rules)}
+        self._keyword_rules = [r for r in rules if r.keywords]
+        self._lower = any(r.ignore_case for r in self._keyword_rules)
+        self._full_rules = [r for r in rules if not r.keywords and r.full_scan]
+        self._token_rules = sorted(
+            (r for r in rules if not r.keywords and not r.full_scan), key=lambda r: r.min_length
+        )
+        self._min_token = max(1, min((r.min_length for r in self._token_rules), default=1))
+        token_bytes = token_chars.encode()
+        self._token_table = bytes(0x61 if i in token_bytes else 0x20 for i in range(256))
+
+    def _token_runs(self, raw):
+        """Yield (start, end) of every run of token characters long enough to hold a match."""
+        marked = raw.translate(self._token_table)
+        needle = b"a" * self._min_token
+        i = marked.find(needle)
+        while i >= 0:
+            end = marked.find(b" ", i + self._min_token)
+            if end < 0:
+                end = len(marked)
+            yield i, end
+            i = marked.find(needle, end)
+
+    def _candidates(self, text, pos, endpos):
+        # latin-1 with "replace" keeps one byte per character, so offsets line up with ``text``
+        raw = text[pos:endpos].encode("latin-1", "replace")
+        lowered = raw.lower() if self._lower else raw
+        for rule in self._keyword_rules:
+            haystack = lowered if rule.ignore_case else raw
+            starts = set()
+            for keyword in rule.keywords:
+                i = haystack.find(keyword)
+                while i >= 0:
+                    starts.add(i)
+                    i = haystack.find(keyword, i + 1)
+            resume = 0
+            for i in sorted(starts):
+                if i < resume:
+                    continue
+                m = rule.regex.match(text, pos + i, endpos)
+                if m:
+                    resume = m.end() - pos
+                    yield rule, m
+        for rule in self._full_rules:
+            for m in rule.regex.finditer(text, pos, endpos):
+                yield rule, m
+        if self._token_rules:
+            for start, end in self._token_runs(raw):
+                for rule in self._token_rules:
+                    if rule.min_length > end - start:
+                        break
+                    yield from ((rule, m) for m in rule.regex.finditer(text, pos + start, pos + end))
+
+    def _scan_window(self, text, pos, endpos, accept_before, offset):
+        """Return matches in ``text[pos:endpos]`` starting before ``accept_before``, and the last match end."""
+        found = [
+            (self._rank[rule.name], m.start(), rule, m)
+            for rule, m in self._candidates(text, pos, endpos)
+            if m.start() < accept_before and m.end() > m.start()
+        ]
+        found.sort(key=lambda f: f[:2])
+        starts, ends, kept = [], [], []
+        for _, start, rule, m in found:
+            # drop matches overlapping one from a better-ranked pattern
+            i = bisect.bisect_right(starts, start)
+            if (i and ends[i - 1] > start) or (i < len(starts) and starts[i] < m.end()):
+                continue
+            starts.insert(i, start)
+            ends.insert(i, m.end())
+            kept.append((start, rule, m))
+        kept.sort(key=lambda k: k[0])
+        matches = [{
+            "type": rule.name,
+            "match": m.group(),
+            "position": (offset + start, offset + m.end()),
+            **rule.info
+        } for start, rule, m in kept]
+        return matches, max(ends, default=pos)
+
+    def scan(self, text):
+        """Return every match in ``text``."""
+        matches = []
+        pos = 0
+        n = len(text)
+        for start in range(0, n, self.chunk_size):
+            end = min(n, start + self.chunk_size + self.overlap)
+            accept_before = n if end == n else start + self.chunk_size
+            found, last_end = self._scan_window(text, max(pos, start), end, accept_before, 0)
+            matches.extend(found)
+            pos = max(pos, last_end)
+        self.chars_scanned += n
+        return matches
+
+    def stream(self, encoding="utf-8"):
+        return SecretStream(self, encoding)
+
+
+class SecretStream:
+    """Incremental scan over text fed in pieces, e.g. a response body read in chunks."""
+
+    def __init__(self, scanner, encoding="utf-8"):
+        self.scanner = scanner
+        self.buffer = ""
+        self.offset = 0   # absolute position of buffer[0]
+        self.resume = 0   # buffer position where scanning continues
+        self._pending = []
+        self._pending_len = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+
+    def feed(self, data):
+        """Add text (or bytes) and return the matches that are now complete."""
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+        self.scanner.chars_scanned += len(data)
+        self._pending.append(data)
+        self._pending_len += len(data)
+        if len(self.buffer) + self._pending_len - self.resume < self.scanner.chunk_size + self.scanner.overlap:
+            return []
+        return self._drain(final=False)
+
+    def close(self):
+        """Scan whatever is left and return its matches."""
+        tail = self._decoder.decode(b"", final=True)
+        self.scanner.chars_scanned += len(tail)
+        self._pending.append(tail)
+        return self._drain(final=True)
+
+    def _drain(self, final):
+        scanner = self.scanner
+        self.buffer += "".join(self._pending)
+        self._pending = []
+        self._pending_len = 0
+        n = len(self.buffer)
+        accept_before = n if final else n - scanner.overlap
+        matches, last_end = scanner._scan_window(self.buffer, self.resume, n, accept_before, self.offset)
+        cut = n if final else max(accept_before, last_end)
+        # keep a little history before the cut so lookbehinds still see it
+        keep_from = max(0, cut - 64)
+        self.offset += keep_from
+        self.buffer = self.buffer[keep_from:]
+        self.resume = cut - keep_from
+        return matches